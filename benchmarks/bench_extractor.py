@@ -0,0 +1,117 @@
+"""Throughput of SolarRenExtractor (feed + get_html + get_text) over a synthetic corpus.
+
+    python benchmarks/bench_extractor.py [--pages 200] [--repeat 3]
+    python benchmarks/bench_extractor.py --check    # chunked feeds must match a single feed
+"""
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from solarex.render.solarren import SolarRenExtractor  # noqa: E402
+
+WORDS = ("solar", "render", "latency", "throughput", "parser", "segment", "anchor", "layout",
+         "cache", "budget", "stream", "vector", "kernel", "socket", "buffer", "&amp;", "&lt;tag&gt;", "naïve")
+
+
+def _sentence(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def make_page(rng, i):
+    """One news/docs-like page: nav links, headings, paragraphs with inline links, lists, code, a form."""
+    parts = [f"<html><head><title>Page {i}</title><style>p {{ color: red }}</style>"
+             "<script>var x = '<p>not text</p>';</script></head><body><nav>"]
+    parts += [f'<a href="/section/{k}">Section {k}</a> ' for k in range(12)]
+    parts.append("</nav><main>")
+    for s in range(rng.randint(6, 12)):
+        parts.append(f"<h2>{_sentence(rng, 4)}</h2>")
+        for _ in range(rng.randint(3, 8)):
+            links = "".join(f' <a href="/article/{rng.randint(0, 300)}">{_sentence(rng, 2)}</a>' for _ in range(3))
+            parts.append(f"<p>{_sentence(rng, 40)}{links}\n  {_sentence(rng, 20)}</p>")
+        parts.append("<ul>" + "".join(f"<li>{_sentence(rng, 6)}</li>" for _ in range(6)) + "</ul>")
+        if s % 3 == 0:
+            parts.append(f"<pre>def f(x):\n    return x  # {_sentence(rng, 3)}\n</pre><hr>")
+    parts.append('<form><input type="search" name="q" placeholder="Search"><textarea name="t">'
+                 f'{_sentence(rng, 8)}</textarea><button type="submit">Go</button></form>')
+    parts.append("</main><footer>" + _sentence(rng, 30) + "</footer></body></html>")
+    return "".join(parts)
+
+
+def make_corpus(pages: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [make_page(rng, i) for i in range(pages)]
+
+
+CORPUS = Path(__file__).resolve().parent / "corpus"
+# Form-control text split at every offset: runs inside <button>/<textarea> cross feed() boundaries.
+FORM_CASE = ("<form><button>hello world</button><input name=q><button>1 < 2 &amp; <b>x</b> y</button>"
+             "<textarea name=t>  caf&eacute; a,b\n line  </textarea><button> a  b </button></form>")
+
+
+def _extract(html, chunk=None):
+    ex = SolarRenExtractor("https://example.com/")
+    for start in range(0, len(html), chunk or len(html) or 1):
+        ex.feed(html[start:start + chunk] if chunk else html)
+    ex.close()
+    return ex.get_html(), ex.get_text()
+
+
+def check_chunked(corpus):
+    """Feed every page whole and in chunks; returns the (name, chunk size) pairs whose output differs."""
+    pages = [("forms-case", FORM_CASE, (1, 2, 3, 7))]
+    pages += [(f.name, f.read_text("utf-8"), (7, 64, 4096)) for f in sorted(CORPUS.glob("*.html"))]
+    pages += [(f"synthetic-{i}", page, (7, 64, 4096)) for i, page in enumerate(corpus[:10])]
+    bad = []
+    for name, html, sizes in pages:
+        whole = _extract(html)
+        bad += [(name, size) for size in sizes if _extract(html, size) != whole]
+    return bad
+
+
+def run(corpus, repeat: int):
+    total_bytes = sum(len(p.encode("utf-8")) for p in corpus)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for i, page in enumerate(corpus):
+            ex = SolarRenExtractor(f"https://example.com/p/{i}")
+            ex.feed(page)
+            ex.close()
+            ex.get_html()
+            ex.get_text()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    ex = SolarRenExtractor("https://example.com/")
+    ex.feed("".join(corpus[:20]))
+    ex.close()
+    ex.get_html()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return total_bytes, best, peak
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--pages", type=int, default=200)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--check", action="store_true", help="only verify chunked feeding against a single feed")
+    args = ap.parse_args(argv)
+    corpus = make_corpus(args.pages)
+    if args.check:
+        bad = check_chunked(corpus)
+        for name, size in bad: print(f"MISMATCH {name} fed in {size}-char chunks")
+        print("chunked feed check:", "FAILED" if bad else "ok")
+        return 1 if bad else 0
+    total, seconds, peak = run(corpus, args.repeat)
+    print(f"pages={len(corpus)} size={total / 1e6:.1f}MB best={seconds:.2f}s "
+          f"throughput={total / 1e6 / seconds:.2f}MB/s pages/s={len(corpus) / seconds:.0f} "
+          f"peak(20 pages)={peak / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
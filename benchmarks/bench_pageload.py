@@ -0,0 +1,265 @@
+"""End-to-end page loads through core.render.new_view() for each renderer backend.
+
+    python benchmarks/bench_pageload.py [--backends qtweb,solarren,minimal] [--loads 60]
+        [--concurrency 4] [--latency-ms 80] [--bandwidth-kbps 2000] [--json out.json]
+
+A local fixture server serves the benchmark corpus (benchmarks/corpus/) with a
+fixed time-to-first-byte and a bandwidth cap. Each backend runs in its own
+headless child process (QT_QPA_PLATFORM=offscreen, throwaway HOME, incognito
+profile): --concurrency views each load pages back to back until --loads
+loads are done. The time from view.load() to a successful loadFinished is
+reported as p50/p95/p99; failed loads are counted (with their own p50) but
+kept out of those percentiles. RSS growth and peak
+thread counts (Python threads and OS threads) over the run.
+
+Every load gets a unique query string so render memos and HTTP caches never
+turn it into a cache hit; pass --warm to cycle through a fixed set of URLs
+instead.
+"""
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+CORPUS = HERE / "corpus"
+BACKENDS = ("qtweb", "solarren", "minimal")
+SEND_CHUNK = 8 * 1024
+
+
+# ---- fixture server ----
+def make_server(latency_ms: float, bandwidth_kbps: float):
+    pages = {p.stem: p.read_bytes() for p in CORPUS.glob("*.html")}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            name = self.path.split("?")[0].strip("/").removesuffix(".html")
+            body = pages.get(name)
+            time.sleep(latency_ms / 1000)
+            if body is None:
+                self.send_error(404); return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            per_chunk = SEND_CHUNK / (bandwidth_kbps * 1024 / 8) if bandwidth_kbps > 0 else 0
+            try:
+                for start in range(0, len(body), SEND_CHUNK):
+                    self.wfile.write(body[start:start + SEND_CHUNK])
+                    if per_chunk: time.sleep(per_chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, sorted(pages)
+
+
+# ---- process stats ----
+def _proc_status(field: str) -> int:
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def rss_kb() -> int:
+    rss = _proc_status("VmRSS")
+    if rss: return rss
+    import resource   # peak rather than current RSS, but better than nothing off Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def os_threads() -> int:
+    return _proc_status("Threads") or threading.active_count()
+
+
+def percentile(values, pct):
+    if not values: return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return round(ordered[rank], 1)
+
+
+# ---- child: one backend ----
+def run_backend(args) -> dict:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6 import QtCore
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
+    if args.child == "qtweb":
+        # Availability check; importing it also initializes QtWebEngine, which must precede the QApplication.
+        try:
+            importlib.import_module("PyQt6.QtWebEngineWidgets")
+        except Exception as exc:
+            return {"backend": args.child, "error": f"QtWebEngine unavailable: {exc}"}
+    from PyQt6 import QtWidgets
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    sys.path.insert(0, str(HERE.parent))
+    from solarex.core.modules import SolarCore
+    core = SolarCore()
+    core.args = argparse.Namespace(ua=None, renderer=args.child)
+    core.set_profile(incognito=True)
+    core.load("solarex.net")
+    core.load("solarex.net.httpx_backend", as_name="net")
+    core.load("solarex.render.manager", as_name="render")
+    core.render.set_active(args.child)
+    if core.render.active_id != args.child:
+        return {"backend": args.child, "error": "backend failed to import (see log above)"}
+
+    pages = args.pages.split(",")
+    counter = iter(range(10 ** 9))
+    def next_url():
+        i = next(counter)
+        name = pages[i % len(pages)]
+        return f"{args.base}/{name}.html?{'v' if args.warm else 'n'}={i % len(pages) if args.warm else i}"
+
+    rss0, threads0 = rss_kb(), os_threads()
+    peak = {"rss": rss0, "threads": threads0, "py_threads": threading.active_count()}
+    def sample():
+        peak["rss"] = max(peak["rss"], rss_kb())
+        peak["threads"] = max(peak["threads"], os_threads())
+        peak["py_threads"] = max(peak["py_threads"], threading.active_count())
+    sampler = QtCore.QTimer(); sampler.setInterval(50); sampler.timeout.connect(sample); sampler.start()
+
+    times, failed_times, timeouts = [], [], [0]   # times: successful loads only
+    remaining = [args.loads]
+    loop = QtCore.QEventLoop()
+    windows = []
+
+    def start(view, state):
+        if remaining[0] <= 0:
+            state["busy"] = False
+            if not any(s["busy"] for _, s in slots): loop.quit()
+            return
+        remaining[0] -= 1
+        state.update(busy=True, t0=time.perf_counter(), seq=state["seq"] + 1)
+        seq = state["seq"]
+        QtCore.QTimer.singleShot(int(args.timeout * 1000), lambda: expire(view, state, seq))
+        view.load(QtCore.QUrl(next_url()))
+
+    def finished(view, state, ok):
+        if not state["busy"] or state.get("done_seq") == state["seq"]: return
+        state["done_seq"] = state["seq"]
+        (times if ok else failed_times).append((time.perf_counter() - state["t0"]) * 1000)
+        QtCore.QTimer.singleShot(0, lambda: start(view, state))
+
+    def expire(view, state, seq):
+        if state["seq"] != seq or state.get("done_seq") == seq: return
+        state["done_seq"] = seq
+        timeouts[0] += 1
+        if hasattr(view, "stop"): view.stop()
+        start(view, state)
+
+    slots = []
+    for _ in range(args.concurrency):
+        win = QtWidgets.QMainWindow()
+        view = core.render.new_view()
+        win.setCentralWidget(view); win.resize(1024, 768); win.show()
+        windows.append(win)
+        state = {"busy": False, "seq": 0}
+        if not hasattr(view, "loadFinished"):
+            return {"backend": args.child, "error": f"{type(view).__name__} has no loadFinished signal"}
+        view.loadFinished.connect(lambda ok, v=view, s=state: finished(v, s, ok))
+        slots.append((view, state))
+    app.processEvents()
+
+    t0 = time.perf_counter()
+    for view, state in slots:
+        QtCore.QTimer.singleShot(0, lambda v=view, s=state: start(v, s))
+    loop.exec()
+    wall = time.perf_counter() - t0
+    sample()
+    for win in windows: win.close()
+
+    return {
+        "backend": args.child, "loads": len(times), "failures": len(failed_times), "timeouts": timeouts[0],
+        "wall_s": round(wall, 2), "loads_per_s": round(len(times) / wall, 2) if wall else None,
+        "p50_ms": percentile(times, 50), "p95_ms": percentile(times, 95), "p99_ms": percentile(times, 99),
+        "max_ms": round(max(times), 1) if times else None, "failed_p50_ms": percentile(failed_times, 50),
+        "rss_start_mb": round(rss0 / 1024, 1), "rss_growth_mb": round((rss_kb() - rss0) / 1024, 1),
+        "rss_peak_mb": round(peak["rss"] / 1024, 1),
+        "threads_start": threads0, "threads_peak": peak["threads"], "py_threads_peak": peak["py_threads"],
+    }
+
+
+# ---- parent ----
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--backends", default=",".join(BACKENDS))
+    ap.add_argument("--loads", type=int, default=60, help="page loads per backend")
+    ap.add_argument("--concurrency", type=int, default=4, help="views loading at the same time")
+    ap.add_argument("--latency-ms", type=float, default=80, help="server delay before the first byte")
+    ap.add_argument("--bandwidth-kbps", type=float, default=0, help="per-connection cap in kbit/s (0 = unlimited)")
+    ap.add_argument("--pages", default="news,docs,search,forms", help="corpus pages to cycle through")
+    ap.add_argument("--timeout", type=float, default=60, help="seconds before a load counts as timed out")
+    ap.add_argument("--warm", action="store_true", help="reuse one URL per page instead of unique URLs")
+    ap.add_argument("--json", help="also write the results to this file")
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    ap.add_argument("--base", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        print("@@RESULT " + json.dumps(run_backend(args)), flush=True)
+        os._exit(0)   # skip Qt/WebEngine teardown; nothing is left to flush
+
+    server, available = make_server(args.latency_ms, args.bandwidth_kbps)
+    missing = set(args.pages.split(",")) - set(available)
+    if missing:
+        ap.error(f"unknown corpus pages: {', '.join(sorted(missing))}")
+    base = f"http://127.0.0.1:{server.server_port}"
+    home = tempfile.mkdtemp(prefix="solarex-pageload-")
+    env = dict(os.environ, HOME=home, XDG_CONFIG_HOME=home, XDG_DATA_HOME=home)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    results = []
+    for backend in args.backends.split(","):
+        cmd = [sys.executable, __file__, "--child", backend, "--base", base, "--loads", str(args.loads),
+               "--concurrency", str(args.concurrency), "--pages", args.pages, "--timeout", str(args.timeout)]
+        if args.warm: cmd.append("--warm")
+        proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+        line = next((l for l in proc.stdout.splitlines() if l.startswith("@@RESULT ")), None)
+        if line is None:
+            tail = (proc.stderr or proc.stdout).strip().splitlines()[-3:]
+            result = {"backend": backend, "error": f"child exited with {proc.returncode}: {' | '.join(tail)}"}
+        else:
+            result = json.loads(line[len("@@RESULT "):])
+        results.append(result)
+        if "error" in result:
+            print(f"{backend:9} skipped: {result['error']}")
+        else:
+            failed = f" (p50 {result['failed_p50_ms']}ms)" if result["failures"] else ""
+            print(f"{backend:9} loads={result['loads']} fail={result['failures']}{failed} timeout={result['timeouts']} "
+                  f"p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms "
+                  f"rate={result['loads_per_s']}/s rss+={result['rss_growth_mb']}MB (peak {result['rss_peak_mb']}MB) "
+                  f"threads {result['threads_start']}->{result['threads_peak']} (py {result['py_threads_peak']})")
+    server.shutdown()
+
+    if args.json:
+        meta = {"loads": args.loads, "concurrency": args.concurrency, "latency_ms": args.latency_ms,
+                "bandwidth_kbps": args.bandwidth_kbps, "pages": args.pages, "warm": args.warm}
+        Path(args.json).write_text(json.dumps({"meta": meta, "results": results}, indent=2) + "\n", "utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
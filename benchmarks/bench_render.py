@@ -0,0 +1,193 @@
+"""Renderer micro-benchmarks over the checked-in corpus (benchmarks/corpus/).
+
+    python benchmarks/bench_render.py [--repeat 5] [--only news,table] [--save-baseline]
+
+For every page this times SolarRenExtractor (feed / get_html / get_text), each
+stage of SolarRenView._transform (StageClock laps: parse, clean, inline_css,
+forms, media, enhance, serialize; parse/extract/serialize for site extractors
+such as google-search), then setHtml and a full layout of the result. The best
+of --repeat runs is reported; Python peak memory comes from one extra
+tracemalloc pass. Runs headless (QT_QPA_PLATFORM=offscreen) with a throwaway
+HOME so user settings never leak in.
+
+Results are compared with benchmarks/baseline.json: a metric regresses when it
+is more than --threshold (time) or --mem-threshold (memory) above the baseline
+and also more than --min-ms / --min-kb in absolute terms. Next to every page a
+fixed pure-Python workload is timed (calib_ms) and baseline times are scaled
+by its ratio, so a host that is uniformly slower today (shared CPU, frequency
+scaling) does not read as a regression. The exit status is 1
+on any regression. Baselines are machine specific: refresh with
+--save-baseline on the machine that runs the comparison.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+_home = tempfile.mkdtemp(prefix="solarren-bench-")
+os.environ.update(HOME=_home, XDG_CONFIG_HOME=_home, XDG_DATA_HOME=_home)
+
+from PyQt6 import QtWidgets  # noqa: E402
+
+from solarex.core.modules import SolarCore  # noqa: E402
+from solarex.render.budget import RenderBudget  # noqa: E402
+from solarex.render.solarren import SolarRenExtractor  # noqa: E402
+
+CORPUS = HERE / "corpus"
+BASELINE = HERE / "baseline.json"
+# Generous parse limits so every run does the whole page; layout splitting stays at its default.
+BUDGET = RenderBudget(parse_ms=600_000, max_nodes=10_000_000)
+
+
+def load_corpus(only=None):
+    index = json.loads((CORPUS / "index.json").read_text("utf-8"))
+    return [(name, meta["url"], (CORPUS / f"{name}.html").read_text("utf-8"))
+            for name, meta in index.items() if not only or name in only]
+
+
+def make_view():
+    from solarex.render.modules import solarren
+    core = SolarCore()
+    core.set_profile(incognito=True)
+    core.settings.set_ns("renderer.solarren", "site_css", False)   # no network during timing
+    win = QtWidgets.QMainWindow()
+    view = solarren.new_view(core)
+    win.setCentralWidget(view)
+    win.resize(1024, 768)
+    win.show()
+    return win, view
+
+
+def calibrate(rounds=5):
+    """Best-of time of a fixed HTMLParser + str workload, the yardstick for this host right now."""
+    from html.parser import HTMLParser
+    chunk = "<div class=a><p>solar <b>render</b> &amp; layout</p><a href='/x'>link</a></div>" * 400
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        parser = HTMLParser()
+        parser.feed(chunk)
+        parser.close()
+        " ".join(sorted(chunk.split()))
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1000, 3)
+
+
+def run_extractor(url, html):
+    t0 = time.perf_counter()
+    ex = SolarRenExtractor(url)
+    ex.feed(html)
+    ex.close()
+    t1 = time.perf_counter()
+    ex.get_html()
+    t2 = time.perf_counter()
+    ex.get_text()
+    t3 = time.perf_counter()
+    return {"extractor.feed": (t1 - t0) * 1000, "extractor.html": (t2 - t1) * 1000,
+            "extractor.text": (t3 - t2) * 1000}
+
+
+def run_view(view, url, html):
+    _soup, page, _status = view._transform(url, html, BUDGET)
+    laps = {f"view.{k}": v for k, v in view.stages.items()}
+    doc = view.canvas.document()
+    doc.setDefaultStyleSheet(view._document_css(page))
+    t0 = time.perf_counter()
+    view.canvas.setHtml(page.html)
+    t1 = time.perf_counter()
+    doc.size()   # forces the full document layout
+    t2 = time.perf_counter()
+    laps["qt.setHtml"] = (t1 - t0) * 1000
+    laps["qt.layout"] = (t2 - t1) * 1000
+    return laps
+
+
+def measure(view, url, html, repeat):
+    samples = {}
+    for _ in range(repeat):
+        for key, ms in {**run_extractor(url, html), **run_view(view, url, html)}.items():
+            samples.setdefault(key, []).append(ms)
+    result = {k: round(min(v), 2) for k, v in samples.items()}
+    result["total_ms"] = round(sum(result.values()), 2)
+    result["calib_ms"] = calibrate()
+    tracemalloc.start()
+    run_extractor(url, html)
+    result["extractor.peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024)
+    tracemalloc.reset_peak()
+    view._transform(url, html, BUDGET)
+    result["view.peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024)
+    tracemalloc.stop()
+    return result
+
+
+def compare(results, baseline, args):
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name, {})
+        scale = metrics["calib_ms"] / base["calib_ms"] if base.get("calib_ms") else 1.0
+        for key, value in metrics.items():
+            old = base.get(key)
+            if old is None or key == "calib_ms": continue
+            memory = key.endswith("_kb")
+            if not memory: old = round(old * scale, 2)
+            limit = old * (1 + (args.mem_threshold if memory else args.threshold))
+            floor = args.min_kb if memory else args.min_ms
+            if value > limit and value - old > floor:
+                regressions.append(f"{name} {key}: {old} -> {value} (+{(value / old - 1) * 100 if old else 0:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--only", help="comma separated page names")
+    ap.add_argument("--baseline", default=str(BASELINE))
+    ap.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    ap.add_argument("--threshold", type=float, default=0.25, help="allowed relative slowdown (default 25%%)")
+    ap.add_argument("--mem-threshold", type=float, default=0.15, help="allowed relative memory growth")
+    ap.add_argument("--min-ms", type=float, default=5.0, help="ignore slowdowns smaller than this")
+    ap.add_argument("--min-kb", type=float, default=64, help="ignore memory growth smaller than this")
+    args = ap.parse_args(argv)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    win, view = make_view()
+    app.processEvents()
+    results = {}
+    for name, url, html in load_corpus(set(args.only.split(",")) if args.only else None):
+        run_view(view, url, html)   # warm-up: imports, selector compilation, font caches
+        calib = calibrate()
+        results[name] = measure(view, url, html, args.repeat)
+        results[name]["calib_ms"] = min(calib, results[name]["calib_ms"])
+        stages = "  ".join(f"{k}={v}" for k, v in results[name].items())
+        print(f"{name:7} {len(html.encode('utf-8')) // 1024:4d}KB  {stages}")
+    win.close()
+
+    path = Path(args.baseline)
+    if args.save_baseline:
+        payload = {"meta": {"python": platform.python_version(), "machine": platform.machine(),
+                            "platform": platform.platform(terse=True), "repeat": args.repeat},
+                   "results": results}
+        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {path}")
+        return 0
+    if not path.exists():
+        print(f"no baseline at {path}; run with --save-baseline to create one")
+        return 0
+    regressions = compare(results, json.loads(path.read_text("utf-8"))["results"], args)
+    for line in regressions:
+        print("REGRESSION", line)
+    print(f"{len(regressions)} regression(s) against {path.name}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
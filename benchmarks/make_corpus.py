@@ -0,0 +1,146 @@
+"""Regenerate the checked-in benchmark corpus in benchmarks/corpus/.
+
+    python benchmarks/make_corpus.py
+
+The pages are deterministic (fixed seed) so timings stay comparable with
+benchmarks/baseline.json; only regenerate together with a new baseline.
+"""
+import json
+import random
+from pathlib import Path
+
+CORPUS = Path(__file__).resolve().parent / "corpus"
+WORDS = ("solar", "render", "latency", "throughput", "parser", "segment", "anchor", "layout", "cache",
+         "budget", "stream", "vector", "kernel", "socket", "buffer", "&amp;", "naïve", "über", "data",
+         "engine", "module", "network", "profile", "window", "plugin", "theme", "history", "request")
+
+# name -> (base URL the page is rendered against, short description)
+PAGES = {
+    "news": ("https://news.example.com/2026/10/solar-flare-report", "article with nav, figures, comments"),
+    "docs": ("https://docs.example.org/api/render.html", "API reference: code, small tables, callouts"),
+    "table": ("https://data.example.net/export/all", "one giant data table"),
+    "search": ("https://www.google.com/search?q=solar+renderer", "search results (google-search extractor)"),
+    "forms": ("https://account.example.com/settings", "form-heavy settings page"),
+}
+
+
+def words(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def head(title, extra=""):
+    return (f"<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\"><title>{title}</title>"
+            '<link rel="stylesheet" href="/static/site.css">'
+            "<style>body{font:16px/1.5 sans-serif}.ad{display:none}</style>"
+            "<script>window.dataLayer=[];function track(e){dataLayer.push(e)}</script>"
+            f"{extra}</head>")
+
+
+def news(rng):
+    out = [head("Solar flare report | Example News"), "<body><header><nav><ul>"]
+    out += [f'<li><a href="/section/{k}">{words(rng, 1).title()}</a></li>' for k in range(25)]
+    out.append("</ul></nav></header><main><article><h1>" + words(rng, 9) + "</h1>")
+    out.append(f'<p class="byline" style="color:#888;font-style:italic">By {words(rng, 2)} · 19 Oct 2026</p>')
+    for s in range(40):
+        if s % 6 == 0:
+            out.append(f'<figure><img src="/img/{s}.jpg" srcset="/img/{s}-480.jpg 480w, /img/{s}-960.jpg 960w" '
+                       f'sizes="(max-width: 600px) 480px, 960px" alt="{words(rng, 3)}" loading="lazy">'
+                       f"<figcaption>{words(rng, 12)}</figcaption></figure>")
+        if s % 9 == 4:
+            out.append(f"<blockquote><p>{words(rng, 30)}</p></blockquote>")
+        links = "".join(f' <a href="/article/{rng.randint(1, 900)}">{words(rng, 3)}</a>' for _ in range(2))
+        out.append(f"<p>{words(rng, 70)}{links} <em>{words(rng, 5)}</em> <strong>{words(rng, 4)}</strong> {words(rng, 40)}.</p>")
+        if s % 10 == 9:
+            out.append(f'<div class="ad"><iframe src="https://ads.example.com/slot/{s}"></iframe></div>')
+    out.append("</article><aside><h2>Related</h2><ul>")
+    out += [f'<li><a href="/article/{k}">{words(rng, 6)}</a></li>' for k in range(30)]
+    out.append("</ul></aside><section class=\"comments\"><h2>Comments</h2>")
+    for c in range(120):
+        out.append(f'<div class="comment" style="margin-left:{(c % 3) * 20}px"><b>{words(rng, 1)}{c}</b> '
+                   f"<span>{words(rng, rng.randint(8, 60))}</span><button>Reply</button></div>")
+    out.append("</section></main><footer><p>" + words(rng, 40) + "</p></footer>"
+               "<script>track({page:'article'})</script></body></html>")
+    return "".join(out)
+
+
+def docs(rng):
+    out = [head("render — Example API docs"), "<body><div class=\"sidebar\"><ul>"]
+    out += [f'<li><a href="#fn-{k}">render_{k}()</a></li>' for k in range(80)]
+    out.append("</ul></div><div class=\"content\"><h1>Rendering API</h1>")
+    for k in range(80):
+        out.append(f'<h2 id="fn-{k}">render_{k}(<code>doc</code>, <code>opts=None</code>)</h2>')
+        out.append(f"<p>{words(rng, 45)} See <a href=\"#fn-{(k + 7) % 80}\">render_{(k + 7) % 80}()</a>.</p>")
+        out.append("<table><tr><th>Parameter</th><th>Type</th><th>Description</th></tr>"
+                   + "".join(f"<tr><td><code>{words(rng, 1)}</code></td><td>str</td><td>{words(rng, 12)}</td></tr>"
+                             for _ in range(4)) + "</table>")
+        body = "\n".join(f"    {words(rng, 1)} = {words(rng, 1)}({k}, {rng.randint(0, 99)})  # {words(rng, 4)}"
+                         for _ in range(rng.randint(4, 12)))
+        out.append(f"<pre><code>def render_{k}(doc, opts=None):\n{body}\n    return doc</code></pre>")
+        if k % 5 == 0:
+            out.append(f'<div class="note" style="background:#eef;border-left:3px solid #55f;padding:4px">'
+                       f"<strong>Note</strong> {words(rng, 25)}</div>")
+        out.append("<ol>" + "".join(f"<li>{words(rng, 10)}</li>" for _ in range(3)) + "</ol>")
+    out.append("</div><hr><footer>" + words(rng, 20) + "</footer></body></html>")
+    return "".join(out)
+
+
+def table(rng):
+    out = [head("Export — all rows"), "<body><h1>Export</h1><table><thead><tr>"]
+    cols = ("id", "name", "region", "status", "latency", "throughput", "updated", "owner")
+    out += [f"<th>{c}</th>" for c in cols]
+    out.append("</tr></thead><tbody>")
+    for r in range(3000):
+        out.append(f"<tr><td>{r}</td><td><a href=\"/item/{r}\">{words(rng, 2)}</a></td><td>{words(rng, 1)}</td>"
+                   f"<td style=\"color:{'#0a0' if r % 4 else '#a00'}\">{'ok' if r % 4 else 'down'}</td>"
+                   f"<td>{rng.randint(1, 999)} ms</td><td>{rng.random() * 100:.2f} MB/s</td>"
+                   f"<td>2026-10-{1 + r % 28:02d}</td><td>{words(rng, 1)}</td></tr>")
+    out.append("</tbody></table></body></html>")
+    return "".join(out)
+
+
+def search(rng):
+    out = [head("solar renderer - Google Search"), "<body><div id=\"searchform\">"
+           '<form action="/search" method="get"><input name="q" value="solar renderer"><button>Search</button></form>'
+           "</div><div id=\"appbar\">About 1,240,000 results</div><div id=\"search\"><div id=\"rso\">"]
+    for k in range(100):
+        host = f"{words(rng, 1).replace('&amp;', 'and')}{k}.example.com"
+        out.append(f'<div class="g"><div class="yuRUbf"><a href="/url?q=https://{host}/page&amp;sa=U">'
+                   f"<h3>{words(rng, 7)}</h3><cite>{host}</cite></a></div>"
+                   f'<div class="VwiC3b"><span>{words(rng, 35)}</span></div></div>')
+    out.append("</div></div><div id=\"botstuff\">" + "".join(f"<a href=\"/search?q={w}\">{w}</a> " for w in WORDS))
+    out.append("</div><div id=\"foot\">" + words(rng, 200) + "</div></body></html>")
+    return "".join(out)
+
+
+def forms(rng):
+    out = [head("Account settings"), "<body><h1>Settings</h1>"]
+    for f in range(40):
+        out.append(f'<form action="/settings/{f}" method="post"><fieldset><legend>{words(rng, 3)}</legend>')
+        for i in range(8):
+            kind = ("text", "email", "password", "checkbox", "radio", "number", "search", "hidden")[i]
+            out.append(f'<label for="f{f}i{i}">{words(rng, 2)}</label>'
+                       f'<input id="f{f}i{i}" type="{kind}" name="{words(rng, 1)}_{i}" '
+                       f'placeholder="{words(rng, 3)}" value="{words(rng, 1) if i % 2 else ""}">')
+        out.append(f'<select name="s{f}">' + "".join(f"<option value=\"{o}\">{words(rng, 2)}</option>" for o in range(12))
+                   + "</select>")
+        out.append(f'<textarea name="t{f}" rows="4" cols="60">{words(rng, 30)}</textarea>'
+                   f'<button type="submit">Save</button><button type="reset">Reset</button></fieldset></form>')
+        out.append(f"<p>{words(rng, 25)}</p>")
+    out.append("</body></html>")
+    return "".join(out)
+
+
+def main():
+    CORPUS.mkdir(exist_ok=True)
+    makers = {"news": news, "docs": docs, "table": table, "search": search, "forms": forms}
+    index = {}
+    for name, (url, desc) in PAGES.items():
+        html = makers[name](random.Random(f"solarren-bench-{name}"))
+        (CORPUS / f"{name}.html").write_text(html, encoding="utf-8")
+        index[name] = {"url": url, "description": desc}
+        print(f"{name}.html {len(html.encode('utf-8')) // 1024} KB")
+    (CORPUS / "index.json").write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,23 +2,51 @@ from PyQt6 import QtWidgets
 DOC = """
 <h2>SolarEx Plugin & Renderer Guide</h2>
 <p>Plugins live in <code>solarex/Plugins</code> or <code>~/.config/SolarEx/plugins</code>.</p>
+<h3>Activate lazily</h3>
+<pre>
+# plugin.json: main.py is imported only when one of the events fires
+{"name":"MyTool","version":"1.0","entry":"main.py",
+ "activation":["onMenu:open"],            # also onStartup (default), onWindowCreated, onUrl:https://*.example.com/*
+ "menus":[{"id":"open","menu":"Tools","label":"My Tool…","run":"open_tool"}]}
+
+# main.py
+def open_tool(core, win): core.ui_api.show_message("Hello from MyTool")
+</pre>
+<h3>Hook into views</h3>
+<pre>
+# Events: view_created(view), navigation_start(view, url), content_ready(view, ok),
+# url_intercept(view, url) -> None, HTML to show instead, or True when handled.
+# Lower priority runs first; time spent is accounted per plugin (see hooks.budget_ms).
+def init(core):
+    core.hooks.register("navigation_start", lambda view, url: print("visit", url), priority=100)
+    core.hooks.register("url_intercept", lambda view, url: "&lt;h1&gt;Hi&lt;/h1&gt;" if url == "about:hi" else None)
+</pre>
 <h3>Create a Renderer</h3>
 <pre>
+# solarex/render/modules/myengine.json  (read at startup; the module is imported on first use)
+{"id":"myengine","name":"My Engine","description":"...","version":"1.0",
+ "settings":[{"key":"font_size","type":"spin","label":"Font size","default":13}]}
+
 # solarex/render/modules/myengine.py
-metadata = {"id":"myengine","name":"My Engine","description":"...", "version":"1.0"}
-def get_settings_schema(core): return [{"key":"font_size","type":"spin","label":"Font size","default":13}]
 def new_view(core, *a, **kw):
     from PyQt6 import QtWidgets, QtCore
     class MyView(QtWidgets.QTextBrowser):
         def load(self, url): self.setSource(QtCore.QUrl(url.toString() if hasattr(url,'toString') else str(url)))
     return MyView()
 </pre>
-"""
+<h3>Add a SolarRen site extractor</h3>
+<pre>
+from solarex.render.extractors import ExtractResult, SiteExtractor
+def extract(ctx):
+    items = "".join(f"&lt;li&gt;{a.get_text(strip=True)}&lt;/li&gt;" for a in ctx.select("title_links"))
+    return ExtractResult(f"&lt;ul&gt;{items}&lt;/ul&gt;", status="Issues ready")   # or None to fall back
 def init(core):
-    def on_window(win):
-        menu = core.ui_api.add_menu(win, "Help")
-        def show():
-            d = QtWidgets.QDialog(win); d.setWindowTitle("SolarEx Docs"); d.resize(800,600)
-            lay = QtWidgets.QVBoxLayout(d); w = QtWidgets.QTextBrowser(); w.setHtml(DOC); lay.addWidget(w); d.exec()
-        core.ui_api.add_menu_item(menu, "Plugin/Renderer Docs", show)
-    core.on_window_created(on_window)
+    core.render.extractors.register(SiteExtractor(
+        id="tracker", hosts=("issues.example.*",), extract=extract,
+        selectors={"title_links": "table.issues td.title a"},
+        needs=("table",), stop_at=r'&lt;div id="footer"'))
+</pre>
+"""
+def show_docs(core, win):
+    d = QtWidgets.QDialog(win); d.setWindowTitle("SolarEx Docs"); d.resize(800,600)
+    lay = QtWidgets.QVBoxLayout(d); w = QtWidgets.QTextBrowser(); w.setHtml(DOC); lay.addWidget(w); d.exec()
@@ -71,3 +71,8 @@ def forge_open(core, plugin_dir: str):
     btn_close.clicked.connect(dlg.close)
 
     dlg.exec()
+
+def open_forge(core, win):
+    root = str(core.plugin_manager.user_root)
+    plugin_dir = QtWidgets.QFileDialog.getExistingDirectory(win, "Open plugin folder", root)
+    if plugin_dir: forge_open(core, plugin_dir)
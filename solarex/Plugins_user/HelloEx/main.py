@@ -1,16 +1,4 @@
-from PyQt6 import QtCore
+HELLO = "<html><body><h1>SolarEx says hi!</h1><p>Custom plugin page.</p></body></html>"
 def init(core):
     print("[HelloEx] Registered about:helloex")
-    old_view = core.render.new_view
-    def patched_view(*a, **kw):
-        view = old_view(*a, **kw)
-        def intercept(url):
-            try: s = url.toString()
-            except Exception: return
-            if s == "about:helloex":
-                html = "<html><body><h1>SolarEx says hi!</h1><p>Custom plugin page.</p></body></html>"
-                if hasattr(view, "setHtml"): view.setHtml(html, QtCore.QUrl("about:blank"))
-        if hasattr(view, "urlChanged"):
-            view.urlChanged.connect(intercept)
-        return view
-    core.render.new_view = patched_view
+    core.hooks.register("url_intercept", lambda view, url: HELLO if url == "about:helloex" else None)
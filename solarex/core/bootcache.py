@@ -0,0 +1,61 @@
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+class BootCache:
+    """Discovery results from the previous launch, kept in the profile for warm starts.
+
+    Each section stores a value together with the mtimes of the files and
+    directories it was derived from; ``get`` returns None as soon as any of
+    them changed, appeared or disappeared. Incognito profiles keep the cache
+    in memory only.
+    """
+    VERSION = 2
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.dirty = False
+        self._data = {}
+        if self.path:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == self.VERSION: self._data = data.get("sections", {})
+            except (OSError, ValueError):
+                pass
+
+    @classmethod
+    def for_profile(cls, profile) -> "BootCache":
+        return cls(None if profile.incognito else Path(profile.config_root) / "bootcache.json")
+
+    @staticmethod
+    def _stamps(paths: Iterable) -> dict:
+        stamps = {}
+        for p in paths:
+            try: stamps[str(p)] = os.stat(p).st_mtime_ns
+            except OSError: stamps[str(p)] = None
+        return stamps
+
+    def get(self, section: str):
+        entry = self._data.get(section)
+        if not entry or self._stamps(entry["stamps"]) != entry["stamps"]: return None
+        return entry["value"]
+
+    def peek(self, section: str):
+        """The stored value even if stale, for callers that revalidate entries themselves."""
+        entry = self._data.get(section)
+        return entry["value"] if entry else None
+
+    def put(self, section: str, paths: Iterable, value):
+        self._data[section] = {"stamps": self._stamps(paths), "value": value}
+        self.dirty = True
+
+    def save(self):
+        if not self.path or not self.dirty: return
+        try:
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps({"version": self.VERSION, "sections": self._data}), encoding="utf-8")
+            tmp.replace(self.path)
+            self.dirty = False
+        except OSError as e:
+            print("[SolarEx][boot] cache save failed:", e)
@@ -0,0 +1,100 @@
+import time
+from typing import Callable, Dict, List
+
+EVENTS = (
+    "view_created",       # fn(view)
+    "navigation_start",   # fn(view, url)
+    "url_intercept",      # fn(view, url) -> None to pass, an HTML str to show instead, or True if handled
+    "content_ready",      # fn(view, ok)
+)
+
+class Hook:
+    __slots__ = ("event", "fn", "priority", "owner", "seq")
+    def __init__(self, event, fn, priority, owner, seq):
+        self.event, self.fn, self.priority, self.owner, self.seq = event, fn, priority, owner, seq
+
+class HookRegistry:
+    """Ordered view hooks with per-owner time accounting.
+
+    Handlers run by ascending ``priority`` (ties in registration order). The
+    owner defaults to the handler's module, which for plugins is the plugin
+    name. Time spent in each owner's handlers is summed; with
+    ``hooks.budget_ms`` set, an owner that exceeds it is reported once, or its
+    hooks are removed when ``hooks.budget_action`` is ``"disable"``.
+    """
+
+    def __init__(self, core):
+        self.core = core
+        self._hooks: Dict[str, List[Hook]] = {e: [] for e in EVENTS}
+        self._seq = 0
+        self.stats: Dict[str, list] = {}     # owner -> [calls, seconds]
+        self.over_budget = set()
+
+    def register(self, event: str, fn: Callable, priority: int = 0, owner: str = None) -> Hook:
+        if event not in self._hooks: raise ValueError(f"unknown hook event {event!r}")
+        owner = owner or getattr(fn, "__module__", None) or "?"
+        if owner in self.over_budget and self._action() == "disable":
+            print(f"[SolarEx][hooks] {owner} is over budget; not registering its {event} hook")
+            return None
+        self._seq += 1
+        hook = Hook(event, fn, priority, owner, self._seq)
+        hooks = self._hooks[event]
+        hooks.append(hook)
+        hooks.sort(key=lambda h: (h.priority, h.seq))
+        return hook
+
+    def unregister(self, hook: Hook):
+        if hook is not None and hook in self._hooks[hook.event]: self._hooks[hook.event].remove(hook)
+
+    def unregister_owner(self, owner: str) -> int:
+        """Remove every hook of ``owner`` (e.g. a plugin about to be reloaded); returns how many."""
+        removed = 0
+        for hooks in self._hooks.values():
+            kept = [h for h in hooks if h.owner != owner]
+            removed += len(hooks) - len(kept)
+            hooks[:] = kept
+        return removed
+
+    def has(self, event: str) -> bool:
+        return bool(self._hooks[event])
+
+    def run(self, event: str, *args):
+        """Call every handler in order; exceptions are logged, not raised."""
+        for hook in list(self._hooks[event]):
+            self._call(hook, args)
+
+    def first(self, event: str, *args):
+        """Call handlers until one returns something other than None, and return that."""
+        for hook in list(self._hooks[event]):
+            result = self._call(hook, args)
+            if result is not None: return result
+        return None
+
+    def _call(self, hook, args):
+        t0 = time.perf_counter()
+        try:
+            return hook.fn(*args)
+        except Exception as exc:
+            print(f"[SolarEx][hooks] {hook.owner} {hook.event} failed: {exc}")
+        finally:
+            self._charge(hook.owner, time.perf_counter() - t0)
+
+    def _action(self):
+        return self.core.settings.get_ns("hooks", "budget_action", "warn")
+
+    def _charge(self, owner, seconds):
+        st = self.stats.get(owner)
+        if st is None: st = self.stats[owner] = [0, 0.0]
+        st[0] += 1; st[1] += seconds
+        budget_ms = self.core.settings.get_ns("hooks", "budget_ms", 0)
+        if not budget_ms or owner in self.over_budget or st[1] * 1000 <= budget_ms: return
+        self.over_budget.add(owner)
+        if self._action() == "disable":
+            self.unregister_owner(owner)
+            print(f"[SolarEx][hooks] {owner} spent {st[1] * 1000:.1f} ms in hooks (budget {budget_ms} ms); its hooks were disabled")
+        else:
+            print(f"[SolarEx][hooks] {owner} spent {st[1] * 1000:.1f} ms in hooks (budget {budget_ms} ms)")
+
+    def report(self) -> str:
+        rows = sorted(self.stats.items(), key=lambda kv: -kv[1][1])
+        return "\n".join(f"  {owner:<24} {calls:>6} calls {secs * 1000:>9.2f} ms" for owner, (calls, secs) in rows)
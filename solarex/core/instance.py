@@ -0,0 +1,96 @@
+import getpass
+import json
+import re
+
+from PyQt6 import QtCore, QtNetwork
+
+FORWARD_TIMEOUT_MS = 1000
+
+
+def socket_name(profile_name: str) -> str:
+    """One local socket per user and profile (a named pipe on Windows)."""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", f"SolarEx-{user}-{profile_name}")
+
+
+def forward(name: str, message: dict, timeout_ms: int = FORWARD_TIMEOUT_MS) -> bool:
+    """Hand ``message`` to the instance listening on ``name``; True once it acknowledged.
+
+    Blocking and event-loop free, so it can run before any QApplication exists.
+    """
+    sock = QtNetwork.QLocalSocket()
+    sock.connectToServer(name)
+    if not sock.waitForConnected(timeout_ms):
+        return False
+    try:
+        sock.write(json.dumps(message).encode("utf-8") + b"\n")
+        if not sock.waitForBytesWritten(timeout_ms): return False
+        reply = b""
+        while not reply.endswith(b"\n"):
+            if not sock.waitForReadyRead(timeout_ms): return False
+            reply += bytes(sock.readAll())
+        return reply.strip() == b"ok"
+    finally:
+        sock.abort()
+
+
+class InstanceServer(QtCore.QObject):
+    """Accepts forwarded launches: one JSON line per connection, answered with ``ok``."""
+    received = QtCore.pyqtSignal(dict)
+
+    def __init__(self, name: str, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self._server = QtNetwork.QLocalServer(self)
+        self._server.setSocketOptions(QtNetwork.QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._on_connection)
+
+    def listen(self) -> bool:
+        # With UserAccessOption Qt binds under a temporary name and renames it over ours, so
+        # listen() alone would take the socket from a running instance: ask it first.
+        if self._answering():
+            print(f"[SolarEx][instance] Another instance is already accepting launches on '{self.name}'")
+            return False
+        if not self._server.listen(self.name):
+            # A socket left behind by a crashed instance (nobody answered above): replace it.
+            in_use = self._server.serverError() == QtNetwork.QAbstractSocket.SocketError.AddressInUseError
+            if not (in_use and QtNetwork.QLocalServer.removeServer(self.name) and self._server.listen(self.name)):
+                print(f"[SolarEx][instance] Cannot listen on '{self.name}': {self._server.errorString()}")
+                return False
+        print(f"[SolarEx][instance] Accepting launches on '{self.name}'")
+        return True
+
+    def _answering(self) -> bool:
+        sock = QtNetwork.QLocalSocket()
+        sock.connectToServer(self.name)
+        try:
+            return sock.waitForConnected(FORWARD_TIMEOUT_MS)
+        finally:
+            sock.abort()
+
+    def close(self):
+        self._server.close()
+
+    def _on_connection(self):
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            buf = bytearray()
+            sock.readyRead.connect(lambda s=sock, b=buf: self._on_ready(s, b))
+            sock.disconnected.connect(sock.deleteLater)
+
+    def _on_ready(self, sock, buf: bytearray):
+        buf.extend(bytes(sock.readAll()))
+        if b"\n" not in buf: return
+        line = bytes(buf).split(b"\n", 1)[0]
+        try:
+            message = json.loads(line.decode("utf-8"))
+            if not isinstance(message, dict): raise ValueError("expected an object")
+        except ValueError as e:
+            print("[SolarEx][instance] bad message:", e)
+            sock.write(b"error\n"); sock.disconnectFromServer()
+            return
+        sock.write(b"ok\n"); sock.flush(); sock.disconnectFromServer()
+        self.received.emit(message)
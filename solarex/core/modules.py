@@ -4,9 +4,12 @@ import traceback
 
 from .registry import ModuleRegistry
 from .profiles import ProfileManager
+from .bootcache import BootCache
+from .hooks import HookRegistry
 from .plugins import PluginManager
 from .uiapi import UIAPI
 from .settings import Settings
+from .startup import StartupProfile
 
 class SolarCore:
     def __init__(self):
@@ -16,21 +19,38 @@ class SolarCore:
         self.plugin_manager = None
         self.ui_api = UIAPI(self)
         self.settings = Settings()
+        self.hooks = HookRegistry(self)   # view hooks (view_created, navigation_start, url_intercept, content_ready)
         self._window_created_listeners = []
+        self._navigate_listeners = []
+        self.windows = []                 # open main windows, in creation order
         self._shutdown_hooks = []
+        self.boot_cache = None            # BootCache in warm-start mode
+        self.prefetch = None              # solarex.net.prefetch.Prefetch of the home page, if any
+        self.startup = StartupProfile()   # solarx swaps in an enabled one for --startup-profile
 
-    def boot(self):
-        print("[SolarEx] Booting modular web system…")
+    def boot(self, warm=False):
+        """``warm``: call after set_profile(); discovery results are cached in that profile and
+        the throwaway Default profile is not created."""
+        print("[SolarEx] Booting modular web system…" + (" (warm start)" if warm else ""))
         core_root = Path(__file__).resolve().parent.parent
+        if warm and self.profile is not None:
+            self.boot_cache = BootCache.for_profile(self.profile)
         self.plugin_manager = PluginManager(core_root)
-        self.plugin_manager.discover()
-        self.profile = ProfileManager(profile_name="Default", incognito=False)
+        with self.startup.span("plugins.discover"):
+            self.plugin_manager.discover(self.boot_cache)
+        if self.profile is None or not warm:
+            with self.startup.span("profile Default"):
+                self.profile = ProfileManager(profile_name="Default", incognito=False)
 
     def set_profile(self, name="Default", incognito=False):
         self.profile = ProfileManager(profile_name=name, incognito=incognito)
         print(f"[SolarEx] Using profile: {self.profile}")
 
     def load(self, dotted, as_name=None):
+        with self.startup.span(f"load {dotted}"):
+            return self._load(dotted, as_name)
+
+    def _load(self, dotted, as_name):
         try:
             mod = import_module(dotted)
         except Exception as exc:
@@ -55,14 +75,41 @@ class SolarCore:
         return self.registry.require(name)
 
     def on_window_created(self, fn):
+        """``fn(win)`` for every main window, including those already open (lazy plugins register late)."""
         self._window_created_listeners.append(fn)
+        for win in list(self.windows):
+            self._call_window_listener(fn, win)
 
     def emit_window_created(self, win):
+        self.windows.append(win)
+        if hasattr(win, "destroyed"):
+            win.destroyed.connect(lambda *_, w=win: w in self.windows and self.windows.remove(w))
         for fn in list(self._window_created_listeners):
+            self._call_window_listener(fn, win)
+
+    @staticmethod
+    def _call_window_listener(fn, win):
+        try:
+            fn(win)
+        except Exception as exc:
+            print("[SolarEx][event] window_created error:", exc)
+
+    def on_navigate(self, fn):
+        """``fn(url: str)`` whenever a view's URL changes."""
+        self._navigate_listeners.append(fn)
+
+    def emit_navigate(self, url):
+        url = url.toString() if hasattr(url, "toString") else str(url)
+        for fn in list(self._navigate_listeners):
             try:
-                fn(win)
+                fn(url)
             except Exception as exc:
-                print("[SolarEx][event] window_created error:", exc)
+                print("[SolarEx][event] navigate error:", exc)
+
+    def remove_listeners(self, module: str):
+        """Drop the window_created and navigate listeners defined in ``module`` (a plugin being reloaded)."""
+        for listeners in (self._window_created_listeners, self._navigate_listeners):
+            listeners[:] = [fn for fn in listeners if getattr(fn, "__module__", None) != module]
 
     def add_shutdown_hook(self, fn):
         if callable(fn):
@@ -75,3 +122,5 @@ class SolarCore:
                 hook()
             except Exception as exc:
                 print("[SolarEx][shutdown] hook error:", exc)
+        if self.hooks.stats and self.settings.get_ns("hooks", "report", False):
+            print("[SolarEx][hooks] Time spent in view hooks:\n" + self.hooks.report())
@@ -1,16 +1,34 @@
+import fnmatch
 import importlib.util
 import json
+import os
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+PARALLEL_READ_MIN = 16   # below this many manifests a thread pool costs more than it saves
+
 class Plugin:
+    """One ``plugin.json``. ``activation`` lists the events that import it:
+
+    ``onStartup`` (the default when absent), ``onWindowCreated``, ``onMenu:<id>``
+    for an entry of ``menus`` ({"id", "menu", "label", "run"}), and
+    ``onUrl:<glob>`` for the first navigation to a matching URL.
+    """
     def __init__(self, path: Path, manifest: dict):
         self.path = path
         self.manifest = manifest
         self.name = manifest.get("name", path.name)
         self.entry = manifest.get("entry", "main.py")
+        self.activation = list(manifest.get("activation") or ["onStartup"])
+        self.menus = list(manifest.get("menus") or [])
         self.module = None
+        self.failed = False
+
+    def events(self, kind: str):
+        prefix = kind + ":"
+        return [e[len(prefix):] for e in self.activation if e.startswith(prefix)]
 
 class PluginManager:
     def __init__(self, core_root: Path):
@@ -18,31 +36,122 @@ class PluginManager:
         self.user_root = Path.home() / ".config" / "SolarEx" / "plugins"
         self.plugins = []
 
-    def discover(self):
+    def discover(self, cache=None):
+        """Read every ``*/plugin.json``; with a BootCache, manifests whose mtime is unchanged are reused."""
+        cached = cache.get("plugins") if cache else None
+        if cached is not None:
+            self.plugins.extend(Plugin(Path(path), manifest) for path, _mtime, manifest in cached)
+            return
+        known = {path: (mtime, manifest) for path, mtime, manifest in (cache.peek("plugins") or [])} if cache else {}
+        stamped, paths = [], []
         for d in [self.core_root / "Plugins", self.user_root]:
+            stamped.append(d)
             if not d.exists(): continue
-            for p in d.glob("*/plugin.json"):
-                try:
-                    manifest = json.loads(p.read_text(encoding="utf-8"))
-                    self.plugins.append(Plugin(p.parent, manifest))
-                except Exception as e:
-                    print("[SolarEx][plugin] read error:", e)
+            for sub in d.iterdir():
+                if sub.is_dir(): stamped.append(sub)
+            paths.extend(sorted(d.glob("*/plugin.json")))
 
+        def read(p):
+            try:
+                mtime = os.stat(p).st_mtime_ns
+                hit = known.get(str(p.parent))
+                if hit and hit[0] == mtime: return p, mtime, hit[1]
+                return p, mtime, json.loads(p.read_text(encoding="utf-8"))
+            except Exception as e:
+                print("[SolarEx][plugin] read error:", e)
+                return p, None, None
+
+        if len(paths) >= PARALLEL_READ_MIN:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+                results = list(pool.map(read, paths))
+        else:
+            results = [read(p) for p in paths]
+        found = []
+        for p, mtime, manifest in results:
+            if manifest is None: continue
+            self.plugins.append(Plugin(p.parent, manifest))
+            stamped.append(p); found.append((str(p.parent), mtime, manifest))
+        if cache: cache.put("plugins", stamped, found)
+
+    def get(self, name: str):
+        return next((pl for pl in self.plugins if pl.name == name), None)
+
+    # ---- activation ----
     def load_all(self, core):
+        """Activate ``onStartup`` plugins now; wire the other activation events to their triggers."""
         for pl in self.plugins:
-            main_py = pl.path / pl.entry
-            try:
-                spec = importlib.util.spec_from_file_location(pl.name, main_py)
-                if not spec or not spec.loader:
-                    raise ImportError(f"Unable to load spec from {main_py}")
-                mod = importlib.util.module_from_spec(spec)
-                sys.modules[pl.name] = mod
+            if "onStartup" in pl.activation:
+                self.activate(core, pl, "onStartup")
+                continue
+            if "onWindowCreated" in pl.activation:
+                core.on_window_created(lambda win, pl=pl: self.activate(core, pl, "onWindowCreated"))
+            for pattern in pl.events("onUrl"):
+                core.on_navigate(lambda url, pl=pl, pattern=pattern:
+                                 fnmatch.fnmatch(url, pattern) and self.activate(core, pl, f"onUrl:{pattern}"))
+        if any(pl.menus for pl in self.plugins):
+            core.on_window_created(lambda win: self._add_menu_stubs(core, win))
+
+    def activate(self, core, pl: Plugin, reason: str = ""):
+        """Import ``pl`` and run its ``init(core)`` once; returns the module (None if it failed)."""
+        if pl.module is None and not pl.failed:
+            with core.startup.span(f"plugin {pl.name}"):
+                self._load(core, pl)
+            if pl.module is not None and reason and reason != "onStartup":
+                print(f"[SolarEx][plugin] Activated {pl.name} ({reason})")
+        return pl.module
+
+    def _add_menu_stubs(self, core, win):
+        """Menu entries declared in manifests; the plugin is imported on first click."""
+        if not hasattr(win, "menuBar"): return
+        for pl in self.plugins:
+            for item in pl.menus:
+                menu = core.ui_api.menu(win, item.get("menu", pl.name))
+                core.ui_api.add_menu_item(menu, item.get("label", item.get("id", pl.name)),
+                                          lambda *_, pl=pl, item=item: self._run_menu(core, win, pl, item))
+
+    def _run_menu(self, core, win, pl: Plugin, item: dict):
+        mod = self.activate(core, pl, f"onMenu:{item.get('id')}")
+        fn = getattr(mod, item.get("run", ""), None) if mod else None
+        if not callable(fn):
+            core.ui_api.show_message(f"{pl.name}: menu entry '{item.get('id')}' has no handler")
+            return
+        try:
+            fn(core, win)
+        except Exception as e:
+            print(f"[SolarEx][plugin] {pl.name}.{item.get('run')} failed: {e}")
+            traceback.print_exc()
+
+    def reload(self, core, name: str):
+        """Re-run a plugin's ``main.py`` and ``init`` (PluginForge's Reload button).
+
+        The previous load's hooks and listeners are removed first, so ``init`` does not stack a
+        second copy of them; a plugin disabled for exceeding the hook budget gets another chance.
+        """
+        pl = self.get(name)
+        if pl is None: raise KeyError(f"no plugin named {name!r}")
+        core.hooks.unregister_owner(pl.name)
+        core.hooks.over_budget.discard(pl.name)
+        core.remove_listeners(pl.name)
+        pl.module, pl.failed = None, False
+        if self.activate(core, pl, "reload") is None: raise RuntimeError(f"{name} failed to load (see log)")
+
+    def _load(self, core, pl):
+        main_py = pl.path / pl.entry
+        try:
+            spec = importlib.util.spec_from_file_location(pl.name, main_py)
+            if not spec or not spec.loader:
+                raise ImportError(f"Unable to load spec from {main_py}")
+            mod = importlib.util.module_from_spec(spec)
+            sys.modules[pl.name] = mod
+            with core.startup.span("exec"):
                 spec.loader.exec_module(mod)
-                init_fn = getattr(mod, "init", None)
-                if callable(init_fn):
+            init_fn = getattr(mod, "init", None)
+            if callable(init_fn):
+                with core.startup.span("init"):
                     init_fn(core)
-                pl.module = mod
-                print(f"[SolarEx][plugin] Loaded {pl.name}")
-            except Exception as e:
-                print(f"[SolarEx][plugin] Failed {pl.name}: {e}")
-                traceback.print_exc()
+            pl.module = mod
+            print(f"[SolarEx][plugin] Loaded {pl.name}")
+        except Exception as e:
+            pl.failed = True
+            print(f"[SolarEx][plugin] Failed {pl.name}: {e}")
+            traceback.print_exc()
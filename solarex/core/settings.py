@@ -7,6 +7,7 @@ class Settings:
         cfg.mkdir(parents=True, exist_ok=True)
         self.path = cfg / "settings.json"
         self._data = {}
+        self._listeners = []
         self.load()
 
     def load(self):
@@ -24,14 +25,29 @@ class Settings:
     def get(self, key, default=None):
         return self._data.get(key, default)
 
+    def on_change(self, fn):
+        """Call ``fn(ns, key, value)`` after a value changes; ``ns`` is None for top-level keys."""
+        self._listeners.append(fn)
+
+    def _notify(self, ns, key, value):
+        for fn in list(self._listeners):
+            try:
+                fn(ns, key, value)
+            except Exception as e:
+                print("[SolarEx][settings] listener error:", e)
+
     def set(self, key, value):
+        changed = self._data.get(key) != value
         self._data[key] = value
         self.save()
+        if changed: self._notify(None, key, value)
 
     def get_ns(self, ns, key, default=None):
         return self._data.get("namespaces", {}).get(ns, {}).get(key, default)
 
     def set_ns(self, ns, key, value):
         nsmap = self._data.setdefault("namespaces", {}).setdefault(ns, {})
+        changed = nsmap.get(key) != value
         nsmap[key] = value
         self.save()
+        if changed: self._notify(ns, key, value)
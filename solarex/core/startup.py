@@ -0,0 +1,161 @@
+import builtins
+import importlib.util
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import List, Optional
+
+class _Span:
+    __slots__ = ("name", "cat", "start", "end", "tid", "depth", "args", "import_ms")
+    def __init__(self, name, cat, start, tid, depth, args):
+        self.name, self.cat, self.start, self.end = name, cat, start, None
+        self.tid, self.depth, self.args, self.import_ms = tid, depth, args, 0.0
+
+class StartupProfile:
+    """Monotonic timeline of startup phases, with import time attributed to the phase that triggered it.
+
+    Disabled profiles cost one attribute check per ``span()``; ``SolarCore`` always has one
+    (``core.startup``) so modules and plugins can mark phases unconditionally.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.t0 = time.perf_counter()
+        self.spans: List[_Span] = []
+        self.imports: List[_Span] = []
+        self.marks: List[tuple] = []
+        self._stacks = {}           # thread id -> open spans (phases and imports)
+        self._lock = threading.Lock()
+        self._orig_import = None
+
+    # ---- recording ----
+    def _stack(self, tid):
+        stack = self._stacks.get(tid)
+        if stack is None:
+            with self._lock: stack = self._stacks.setdefault(tid, [])
+        return stack
+
+    @contextmanager
+    def _open(self, name, cat, args, into):
+        tid = threading.get_ident()
+        stack = self._stack(tid)
+        span = _Span(name, cat, time.perf_counter(), tid, len(stack), args)
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            stack.pop()
+            into.append(span)
+
+    def span(self, name: str, cat: str = "phase", **args):
+        return self._open(name, cat, args, self.spans) if self.enabled else nullcontext()
+
+    def mark(self, name: str):
+        if self.enabled: self.marks.append((name, time.perf_counter(), threading.get_ident()))
+
+    def track_imports(self):
+        """Time every import statement that brings in a new module (inclusive; self time is derived)."""
+        if not self.enabled or self._orig_import: return
+        self._orig_import = orig = builtins.__import__
+        profile = self
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            full = name
+            if level:
+                try: full = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+                except (ImportError, ValueError): pass
+            new = [n for n in (full, *(f"{full}.{f}" for f in fromlist or () if f != "*")) if n not in sys.modules]
+            if not new:
+                return orig(name, globals, locals, fromlist, level)
+            with profile._open(full if full in new else new[0], "import", {}, profile.imports):
+                return orig(name, globals, locals, fromlist, level)
+
+        builtins.__import__ = timed_import
+
+    def stop_imports(self):
+        if self._orig_import:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    # ---- output ----
+    def _ms(self, t): return (t - self.t0) * 1000
+
+    def _attribute(self):
+        """Self time per import, charged to the innermost phase open when it started."""
+        rows = []
+        innermost_first = sorted(self.spans, key=lambda s: -s.depth)
+        for imp in self.imports:
+            children = sum(o.end - o.start for o in self.imports
+                           if o.tid == imp.tid and o.depth == imp.depth + 1 and imp.start <= o.start and o.end <= imp.end)
+            phase = next((s for s in innermost_first
+                          if s.tid == imp.tid and s.start <= imp.start and imp.end <= s.end), None)
+            self_ms = (imp.end - imp.start - children) * 1000
+            rows.append((imp, self_ms, phase))
+        return rows
+
+    def report(self, top: int = 15) -> str:
+        rows = self._attribute()
+        for s in self.spans: s.import_ms = 0.0
+        for _imp, self_ms, phase in rows:
+            if phase is not None: phase.import_ms += self_ms
+        main = threading.main_thread().ident
+        lines = ["Startup profile (ms since interpreter reached solarx.py)",
+                 f"{'start':>8} {'took':>8} {'imports':>8}  phase"]
+        timeline = [(s.start, f"{self._ms(s.start):8.1f} {(s.end - s.start) * 1000:8.1f} {s.import_ms:8.1f}  "
+                              f"{'  ' * s.depth}{s.name}{'' if s.tid == main else '  [thread]'}") for s in self.spans]
+        timeline += [(t, f"{self._ms(t):8.1f} {'':8} {'':8}  * {name}") for name, t, _tid in self.marks]
+        lines += [line for _t, line in sorted(timeline, key=lambda row: row[0])]
+        if rows:
+            lines += ["", f"Slowest imports (self time) of {len(rows)} new modules, "
+                          f"{sum(r[1] for r in rows):.0f} ms total"]
+            for imp, self_ms, phase in sorted(rows, key=lambda r: -r[1])[:top]:
+                lines.append(f"{self_ms:8.1f}  {imp.name}  <- {phase.name if phase else '(top level)'}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """Trace Event Format, loadable in chrome://tracing or Perfetto."""
+        us = lambda t: round((t - self.t0) * 1e6, 1)
+        events = [{"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "SolarEx startup"}}]
+        for s in (*self.spans, *self.imports):
+            events.append({"name": s.name, "cat": s.cat, "ph": "X", "pid": 1, "tid": s.tid,
+                           "ts": us(s.start), "dur": round((s.end - s.start) * 1e6, 1), "args": s.args})
+        for name, t, tid in self.marks:
+            events.append({"name": name, "cat": "mark", "ph": "i", "s": "g", "pid": 1, "tid": tid, "ts": us(t)})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Optional[str]) -> str:
+        """Print the report and write the Chrome trace to ``path``; returns the report."""
+        self.stop_imports()
+        text = self.report()
+        print(text)
+        if path:
+            Path(path).write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+            print(f"[SolarEx][startup] Chrome trace written to {path}")
+        return text
+
+def on_first_paint(widget, callback, timeout_s: float = 15.0):
+    """Call ``callback()`` once, after ``widget`` first paints (or after ``timeout_s`` if it never does)."""
+    from PyQt6 import QtCore
+
+    class _Watcher(QtCore.QObject):
+        def __init__(self):
+            super().__init__(widget)
+            self.fired = False
+        def fire(self):
+            if self.fired: return
+            self.fired = True
+            widget.removeEventFilter(self)
+            callback()
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.Type.Paint:
+                QtCore.QTimer.singleShot(0, self.fire)   # after this paint has been delivered
+            return False
+
+    watcher = _Watcher()
+    widget.installEventFilter(watcher)
+    QtCore.QTimer.singleShot(int(timeout_s * 1000), watcher.fire)
+    return watcher
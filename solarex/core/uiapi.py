@@ -13,6 +13,12 @@ class UIAPI:
         b = QtWidgets.QPushButton(text); b.clicked.connect(cb); self._tb(win).addWidget(b); return b
     def add_menu(self, win, title):
         mb = win.menuBar() or QtWidgets.QMenuBar(win); win.setMenuBar(mb); return mb.addMenu(title)
+    def menu(self, win, title):
+        """The menu titled ``title`` in ``win``'s menu bar, created if it is not there yet."""
+        mb = win.menuBar()
+        for act in mb.actions():
+            if act.menu() and act.text() == title: return act.menu()
+        return mb.addMenu(title)
     def add_menu_item(self, menu, text, cb):
         act = menu.addAction(text); act.triggered.connect(cb); return act
     def show_message(self, text, title="SolarEx"):
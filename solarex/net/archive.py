@@ -0,0 +1,185 @@
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import httpx
+
+REPLAY_CHUNK = 16 * 1024
+
+
+def _open(path: Path, mode: str, gz: Optional[bool] = None):
+    if gz is None: gz = path.name.endswith(".gz")
+    return gzip.open(path, mode + "t", encoding="utf-8") if gz else open(path, mode, encoding="utf-8")
+
+
+def _key(method: str, url: str, body: bytes = b"") -> str:
+    key = f"{method.upper()} {url}"
+    return f"{key} {hashlib.sha1(body).hexdigest()}" if body else key
+
+
+class NetArchive:
+    """HTTP exchanges in HAR 1.2 form (``.har`` or ``.har.gz``).
+
+    Bodies are kept exactly as they came over the wire (still content-encoded)
+    and always base64, so replay hands the client the same bytes and headers.
+    Timings use the HAR fields: ``wait`` is time to first byte, ``receive`` the
+    body transfer.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.entries: List[dict] = []
+        self._by_key: Dict[str, List[dict]] = {}
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "NetArchive":
+        archive = cls(path)
+        with _open(archive.path, "r") as fh:
+            for entry in json.load(fh)["log"]["entries"]:
+                archive._index(entry)
+        return archive
+
+    def _index(self, entry: dict):
+        req = entry["request"]
+        body = base64.b64decode(req.get("postData", {}).get("_base64", ""))
+        self.entries.append(entry)
+        self._by_key.setdefault(_key(req["method"], req["url"], body), []).append(entry)
+
+    def add(self, request: httpx.Request, response: httpx.Response, body: bytes, started: float,
+            wait_ms: float, receive_ms: float):
+        entry = {
+            "startedDateTime": datetime.fromtimestamp(started, timezone.utc).isoformat(),
+            "time": round(wait_ms + receive_ms, 3),
+            "request": {
+                "method": request.method, "url": str(request.url), "httpVersion": "HTTP/1.1",
+                "headers": [{"name": k, "value": v} for k, v in request.headers.items()],
+                "queryString": [{"name": k, "value": v} for k, v in request.url.params.multi_items()],
+                "cookies": [], "headersSize": -1, "bodySize": len(request.content),
+            },
+            "response": {
+                "status": response.status_code, "statusText": response.reason_phrase,
+                "httpVersion": response.extensions.get("http_version", b"HTTP/1.1").decode("ascii", "replace"),
+                "headers": [{"name": k, "value": v} for k, v in response.headers.multi_items()],
+                "cookies": [], "redirectURL": response.headers.get("location", ""),
+                "headersSize": -1, "bodySize": len(body),
+                "content": {"size": len(body), "mimeType": response.headers.get("content-type", ""),
+                            "text": base64.b64encode(body).decode("ascii"), "encoding": "base64"},
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": round(wait_ms, 3), "receive": round(receive_ms, 3)},
+        }
+        if request.content:
+            entry["request"]["postData"] = {
+                "mimeType": request.headers.get("content-type", ""),
+                "text": request.content.decode("utf-8", "replace"),
+                "_base64": base64.b64encode(request.content).decode("ascii"),
+            }
+        with self._lock:
+            self._index(entry)
+            self.dirty = True
+
+    def match(self, request: httpx.Request) -> Optional[dict]:
+        """Next recorded exchange for this request; repeats of a request replay in recorded order, then stick to the last."""
+        key = _key(request.method, str(request.url), request.content)
+        with self._lock:
+            found = self._by_key.get(key)
+            if not found: return None
+            i = self._served.get(key, 0)
+            self._served[key] = i + 1
+            return found[min(i, len(found) - 1)]
+
+    def save(self):
+        with self._lock:
+            if not self.dirty: return
+            payload = {"log": {"version": "1.2", "creator": {"name": "SolarEx", "version": "1.0"},
+                               "entries": list(self.entries)}}
+            self.dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with _open(tmp, "w", gz=self.path.name.endswith(".gz")) as fh:
+            json.dump(payload, fh)
+        tmp.replace(self.path)
+
+    def __len__(self): return len(self.entries)
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Passes requests to the network and files every exchange in ``archive``."""
+
+    def __init__(self, archive: NetArchive, inner: Optional[httpx.BaseTransport] = None):
+        self.archive = archive
+        self.inner = inner or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()   # buffer the body so it can be both sent and archived
+        started, t0 = time.time(), time.perf_counter()
+        response = self.inner.handle_request(request)
+        t1 = time.perf_counter()
+        try:
+            body = b"".join(response.stream)   # raw bytes: decoding happens in the client
+        finally:
+            response.close()
+        t2 = time.perf_counter()
+        self.archive.add(request, response, body, started, (t1 - t0) * 1000, (t2 - t1) * 1000)
+        return httpx.Response(response.status_code, headers=response.headers.multi_items(), content=body,
+                              request=request, extensions=response.extensions)
+
+    def close(self):
+        self.inner.close()
+
+
+class _PacedStream(httpx.SyncByteStream):
+    def __init__(self, body: bytes, receive_s: float):
+        self.body = body
+        self.receive_s = receive_s
+
+    def __iter__(self):
+        chunks = max(1, -(-len(self.body) // REPLAY_CHUNK))
+        pause = self.receive_s / chunks
+        for i in range(chunks):
+            if pause: time.sleep(pause)
+            yield self.body[i * REPLAY_CHUNK:(i + 1) * REPLAY_CHUNK]
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Serves requests from ``archive`` and never touches the network.
+
+    ``latency_ms`` None replays the recorded timing (time to first byte, then
+    the body paced over the recorded transfer time); a number serves every
+    response after that fixed delay. Unrecorded requests get a 504.
+    """
+
+    def __init__(self, archive: NetArchive, latency_ms: Optional[float] = None):
+        self.archive = archive
+        self.latency_ms = latency_ms
+        self.misses = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        entry = self.archive.match(request)
+        if entry is None:
+            self.misses += 1
+            print(f"[SolarEx][net] replay miss: {request.method} {request.url}")
+            return httpx.Response(504, headers={"x-solarex-replay": "miss"}, content=b"not in replay archive",
+                                  request=request)
+        resp, timings = entry["response"], entry.get("timings", {})
+        body = base64.b64decode(resp["content"].get("text", "")) if resp["content"].get("encoding") == "base64" \
+            else resp["content"].get("text", "").encode("utf-8")
+        if self.latency_ms is None:
+            time.sleep(max(0.0, timings.get("wait", 0)) / 1000)
+            stream = _PacedStream(body, max(0.0, timings.get("receive", 0)) / 1000)
+        else:
+            time.sleep(self.latency_ms / 1000)
+            stream = _PacedStream(body, 0.0)
+        headers = [(h["name"], h["value"]) for h in resp["headers"]]
+        return httpx.Response(resp["status"], headers=headers, stream=stream, request=request,
+                              extensions={"http_version": resp.get("httpVersion", "HTTP/1.1").encode("ascii")})
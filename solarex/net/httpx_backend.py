@@ -1,6 +1,12 @@
 import httpx
 from types import SimpleNamespace
 
+from solarex.net.archive import NetArchive, RecordingTransport, ReplayTransport
+
+# Streamed page loads run on a small shared pool and only notice cancellation between chunks,
+# so a host that never answers must give its worker back quickly.
+CONNECT_TIMEOUT = 4.0
+
 
 def init(core):
     core.net = HTTPXBackend(core)
@@ -10,12 +16,38 @@ class HTTPXBackend:
     def __init__(self, core=None):
         self._core = core
         self._headers = {"User-Agent": self._determine_user_agent()}
+        self.archive = None
+        self.replaying = False
+        self._replay_latency = None
+        self._setup_archive()
         self._client = httpx.Client(
             follow_redirects=True,
             timeout=20,
             headers=self._headers,
+            transport=self.make_transport(),
         )
 
+    def _setup_archive(self):
+        """--net-record / --net-replay: file every exchange in a HAR, or serve only from one."""
+        args = getattr(self._core, "args", None)
+        record, replay = getattr(args, "net_record", None), getattr(args, "net_replay", None)
+        if replay:
+            self.archive = NetArchive.load(replay)
+            self.replaying = True
+            latency = str(getattr(args, "replay_latency", None) or "original")
+            self._replay_latency = None if latency == "original" else float(latency)
+            timing = "recorded timing" if self._replay_latency is None else f"{self._replay_latency:g} ms latency"
+            print(f"[SolarEx][net] Replaying {len(self.archive)} exchanges from {replay} ({timing}); network is off")
+        elif record:
+            self.archive = NetArchive(record)
+            print(f"[SolarEx][net] Recording network traffic to {record}")
+
+    def make_transport(self):
+        """Transport for any extra httpx client, so it records/replays with the backend; None when live."""
+        if self.archive is None: return None
+        if self.replaying: return ReplayTransport(self.archive, self._replay_latency)
+        return RecordingTransport(self.archive)
+
     def _determine_user_agent(self) -> str:
         ua = None
         if self._core is not None:
@@ -38,5 +70,36 @@ class HTTPXBackend:
         r.encoding = encoding if encoding else r.encoding
         return r.text
 
+    def fetch_stream(self, url: str, cancelled=None, progress=None, max_bytes=None, encoding=None):
+        """Read ``url`` chunk by chunk.
+
+        Returns None (and closes the stream) once ``cancelled()`` is true. Stops
+        early at ``max_bytes`` and flags the result as truncated.
+        """
+        truncated = False
+        with self._client.stream("GET", url, timeout=httpx.Timeout(20, connect=CONNECT_TIMEOUT)) as r:
+            total = int(r.headers.get("content-length") or 0)
+            buf = bytearray()
+            for chunk in r.iter_bytes():
+                if cancelled is not None and cancelled():
+                    return None
+                buf.extend(chunk)
+                if max_bytes and len(buf) >= max_bytes:
+                    del buf[max_bytes:]
+                    truncated = True
+                    break
+                if total and progress is not None:
+                    progress(min(99, len(buf) * 100 // total))
+            charset = encoding or r.charset_encoding or "utf-8"
+            final_url, status = str(r.url), r.status_code
+        try:
+            text = buf.decode(charset, errors="replace")
+        except LookupError:
+            text = buf.decode("utf-8", errors="replace")
+        return SimpleNamespace(url=final_url, status=status, text=text, truncated=truncated)
+
     def close(self):
         self._client.close()
+        if self.archive is not None and not self.replaying:
+            self.archive.save()
+            print(f"[SolarEx][net] Saved {len(self.archive)} exchanges to {self.archive.path}")
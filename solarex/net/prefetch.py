@@ -0,0 +1,76 @@
+import threading
+from types import SimpleNamespace
+from typing import Callable, Optional
+
+import httpx
+
+
+def _same_url(a: str, b: str) -> bool:
+    try:
+        return str(httpx.URL(a)) == str(httpx.URL(b))
+    except Exception:
+        return a == b
+
+
+class Prefetch:
+    """Fetches one URL on a background thread while the rest of startup runs.
+
+    The first view that navigates to the same URL ``claim``s it and gets the
+    result as soon as it is ready, instead of starting its own request.
+    ``prepare`` may be set (by the active renderer) before the fetch finishes;
+    it then runs on the same thread and its return value travels along as
+    ``result.prepared``. Results are handed out once; later navigations to the
+    URL fetch normally.
+    """
+
+    def __init__(self, core, url: str, max_bytes: Optional[int] = None):
+        self.core = core
+        self.url = url
+        self.max_bytes = max_bytes
+        self.prepare: Optional[Callable[[SimpleNamespace], object]] = None
+        self.cancelled = False
+        self.claimed = False
+        self._result = None
+        self._waiting: Optional[Callable] = None
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name="solarex-prefetch", daemon=True).start()
+
+    def _run(self):
+        result = SimpleNamespace(url=self.url, text=None, truncated=False, error=None, prepared=None)
+        try:
+            resp = self.core.net.fetch_stream(self.url, cancelled=lambda: self.cancelled, max_bytes=self.max_bytes)
+            if resp is None: return
+            result.text, result.truncated = resp.text, resp.truncated
+            self.core.startup.mark("home fetched")
+            prepare = self.prepare
+            if prepare is not None and not self.cancelled:
+                try:
+                    result.prepared = prepare(result)
+                except Exception as e:
+                    print("[SolarEx][net] prefetch prepare failed:", e)
+        except Exception as e:
+            result.error = str(e)
+        with self._lock:
+            waiting, self._waiting = self._waiting, None
+            if waiting is None: self._result = result
+        if waiting is not None: waiting(result)
+
+    def claim(self, url: str, deliver: Callable[[SimpleNamespace], None]) -> bool:
+        """Take the result for ``url``: ``deliver(result)`` runs once it is ready (on the prefetch
+        thread, or right here if it already is). False if the URL differs or was already taken."""
+        with self._lock:
+            if self.claimed or self.cancelled or not _same_url(url, self.url): return False
+            self.claimed = True
+            result, self._result = self._result, None
+            if result is None:
+                self._waiting = deliver
+                return True
+        deliver(result)
+        return True
+
+    def cancel(self):
+        """Drop the prefetch if nobody claimed it (e.g. the first tab went elsewhere)."""
+        with self._lock:
+            if self.claimed: return
+            self.cancelled = True
+            self._result = None
@@ -0,0 +1,259 @@
+"""Headless HTML-to-text extraction with SolarRenExtractor.
+
+    python -m solarex.render.solarren extract [-j N] [-o out.jsonl] [--state state.json] INPUT...
+
+INPUT may be a file, a directory (searched recursively for HTML files), a glob
+or a WARC file (.warc / .warc.gz). One JSON object per document is written as
+soon as it is done. Nothing here imports PyQt6.
+"""
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from solarex.render.solarren import SolarRenExtractor
+
+HTML_SUFFIXES = (".html", ".htm", ".xhtml", ".shtml")
+WARC_SUFFIXES = (".warc", ".warc.gz")
+_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w.:-]+)""", re.I)
+
+
+def _decode(payload: bytes, charset: str = "") -> str:
+    if not charset:
+        m = _CHARSET_RE.search(payload, 0, 4096)
+        charset = m.group(1).decode("ascii") if m else "utf-8"
+    try:
+        return payload.decode(charset, errors="replace")
+    except LookupError:
+        return payload.decode("utf-8", errors="replace")
+
+
+def extract_job(job: Tuple) -> Dict:
+    """Worker: (source, url, path, payload, charset, previous sha1) -> result record."""
+    source, url, path, payload, charset, prev_hash = job
+    t0 = time.perf_counter()
+    try:
+        if payload is None:
+            payload = Path(path).read_bytes()
+        digest = hashlib.sha1(payload).hexdigest()
+        if digest == prev_hash:
+            return {"source": source, "sha1": digest, "skipped": True}
+        extractor = SolarRenExtractor(url)
+        extractor.feed(_decode(payload, charset))
+        extractor.close()
+        text = extractor.get_text()
+    except Exception as exc:
+        return {"source": source, "url": url, "error": str(exc) or type(exc).__name__,
+                "ms": round((time.perf_counter() - t0) * 1000, 2)}
+    return {"source": source, "url": url, "title": extractor.title, "bytes": len(payload), "sha1": digest,
+            "ms": round((time.perf_counter() - t0) * 1000, 2), "text": text}
+
+
+# ---- WARC ----
+def _read_headers(fh) -> Tuple[Optional[bytes], Dict[str, str]]:
+    first = fh.readline()
+    while first in (b"\r\n", b"\n"):
+        first = fh.readline()
+    if not first:
+        return None, {}
+    headers = {}
+    for line in iter(fh.readline, b""):
+        if line in (b"\r\n", b"\n"): break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return first.strip(), headers
+
+
+def _dechunk(body: bytes) -> bytes:
+    out, pos = [], 0
+    while True:
+        eol = body.find(b"\r\n", pos)
+        if eol < 0: break
+        size = int(body[pos:eol].split(b";")[0] or b"0", 16)
+        if not size: break
+        out.append(body[eol + 2:eol + 2 + size])
+        pos = eol + 4 + size
+    return b"".join(out)
+
+
+def _http_payload(block: bytes) -> Optional[Tuple[bytes, str]]:
+    """(body, charset) of an HTML HTTP response record, or None for anything else."""
+    head, sep, body = block.partition(b"\r\n\r\n")
+    if not sep: return None
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    ctype = headers.get("content-type", "").lower()
+    if "html" not in ctype: return None
+    m = re.search(r"charset=[\"']?([\w.:-]+)", ctype)
+    try:
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            body = _dechunk(body)
+        encoding = headers.get("content-encoding", "").lower()
+        if encoding in ("gzip", "x-gzip"):
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+    except (ValueError, OSError, EOFError, zlib.error):
+        return None
+    return body, m.group(1) if m else ""
+
+
+def iter_warc(path: Path) -> Iterator[Tuple[str, str, bytes, str]]:
+    """(record id, target URI, html body, charset) for each HTML response record."""
+    opener = gzip.open if path.name.endswith(".gz") else open
+    with opener(path, "rb") as fh:
+        while True:
+            version, headers = _read_headers(fh)
+            if version is None: return
+            block = fh.read(int(headers.get("content-length", 0) or 0))
+            if headers.get("warc-type") != "response": continue
+            if not headers.get("content-type", "").startswith("application/http"): continue
+            found = _http_payload(block)
+            if found:
+                record_id = headers.get("warc-record-id", "").strip("<>")
+                yield record_id, headers.get("warc-target-uri", ""), found[0], found[1]
+
+
+# ---- Inputs ----
+def _expand(inputs) -> Iterator[Path]:
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(HTML_SUFFIXES + WARC_SUFFIXES):
+                        yield Path(root, name)
+        elif path.exists():
+            yield path
+        else:
+            matches = sorted(glob.glob(item, recursive=True))
+            if not matches:
+                print(f"[SolarRen] extract: no input matches {item!r}", file=sys.stderr)
+            for match in matches:
+                if Path(match).is_file(): yield Path(match)
+
+
+def iter_jobs(inputs, state: Dict[str, Dict], stats: Dict[str, int], owners: Dict[str, str]) -> Iterator[Tuple]:
+    """Jobs for everything that may have changed since ``state`` was written.
+
+    WARC records are keyed "<file>#<record id>"; ``owners`` maps them back to their file.
+    """
+    for path in _expand(inputs):
+        source = str(path)
+        try:
+            st = path.stat()
+        except OSError as exc:
+            print(f"[SolarRen] extract: {source}: {exc}", file=sys.stderr)
+            continue
+        seen = state.get(source, {})
+        if seen.get("mtime") == st.st_mtime_ns and seen.get("size") == st.st_size:
+            stats["skipped"] += 1
+            continue
+        if path.name.lower().endswith(WARC_SUFFIXES):
+            try:
+                for record_id, url, body, charset in iter_warc(path):
+                    key = f"{source}#{record_id or url}"
+                    owners[key] = source
+                    yield key, url, None, body, charset, state.get(key, {}).get("sha1")
+            except (OSError, EOFError, ValueError) as exc:
+                print(f"[SolarRen] extract: {source}: bad WARC ({exc})", file=sys.stderr)
+                continue
+            state[source] = {"mtime": st.st_mtime_ns, "size": st.st_size}
+        else:
+            yield source, path.resolve().as_uri(), source, None, "", seen.get("sha1")
+            state.setdefault(source, {}).update(mtime=st.st_mtime_ns, size=st.st_size)
+
+
+def _run(jobs, workers: int) -> Iterator[Dict]:
+    """Results in completion order, with a bounded number of jobs in flight."""
+    if workers <= 1:
+        yield from map(extract_job, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for job in jobs:
+            pending.add(pool.submit(extract_job, job))
+            if len(pending) >= workers * 4:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done: yield fut.result()
+        for fut in pending: yield fut.result()
+
+
+def _load_state(path: Optional[Path]) -> Dict[str, Dict]:
+    if not path: return {}
+    try:
+        return json.loads(path.read_text("utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        print(f"[SolarRen] extract: ignoring unreadable state {path}: {exc}", file=sys.stderr)
+        return {}
+
+
+def _save_state(path: Optional[Path], state: Dict[str, Dict]):
+    if not path: return
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(state, separators=(",", ":")), "utf-8")
+    os.replace(tmp, path)
+
+
+def extract(args) -> int:
+    state_path = Path(args.state) if args.state else None
+    state = {} if args.force else _load_state(state_path)
+    stats = {"docs": 0, "skipped": 0, "errors": 0, "bytes": 0}
+    owners: Dict[str, str] = {}
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    t0 = time.perf_counter()
+    try:
+        for result in _run(iter_jobs(args.inputs, state, stats, owners), args.jobs):
+            source = result["source"]
+            if result.get("skipped"):
+                stats["skipped"] += 1
+                continue
+            if "error" in result:
+                stats["errors"] += 1
+                state.pop(source, None)   # retry next run
+                state.pop(owners.get(source), None)
+            else:
+                stats["docs"] += 1
+                stats["bytes"] += result["bytes"]
+                state.setdefault(source, {})["sha1"] = result["sha1"]
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); keep the interpreter's final flush quiet.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if out is not sys.stdout: out.close()
+        _save_state(state_path, state)
+    seconds = time.perf_counter() - t0
+    print(f"[SolarRen] extract: {stats['docs']} docs, {stats['skipped']} unchanged, {stats['errors']} errors, "
+          f"{stats['bytes'] / 1e6:.1f}MB in {seconds:.2f}s ({stats['bytes'] / 1e6 / max(seconds, 1e-9):.2f}MB/s)",
+          file=sys.stderr)
+    return 1 if stats["errors"] else 0
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m solarex.render.solarren", description="SolarRen headless tools")
+    sub = ap.add_subparsers(dest="command", required=True)
+    ex = sub.add_parser("extract", help="HTML files, directories, globs or WARCs to JSONL text")
+    ex.add_argument("inputs", nargs="+")
+    ex.add_argument("-o", "--output", help="JSONL output file (default: stdout)")
+    ex.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="worker processes (default: CPU count)")
+    ex.add_argument("--state", help="JSON file remembering mtime/size/sha1 per input; unchanged inputs are skipped")
+    ex.add_argument("--force", action="store_true", help="ignore --state and extract everything")
+    args = ap.parse_args(argv)
+    return extract(args)
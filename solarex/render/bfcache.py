@@ -0,0 +1,121 @@
+import itertools
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Hashable, List, Optional
+
+_entry_ids = itertools.count(1)
+
+
+@dataclass
+class HistoryEntry:
+    url: str
+    scroll: int = 0
+    key: int = field(default_factory=lambda: next(_entry_ids))
+
+
+@dataclass
+class CachedPage:
+    html: str
+    title: str
+    favicon: str = ""
+    digest: str = ""
+    image_loading: dict = field(default_factory=dict)   # url -> "lazy" | "eager"
+    deferred: list = field(default_factory=list)        # html chunks held back by the layout budget
+    stylesheets: list = field(default_factory=list)     # absolute URLs of linked site stylesheets
+    size: int = 0
+
+
+class PageCache:
+    """LRU of rendered pages, bounded by an approximate byte budget."""
+
+    def __init__(self, budget_bytes: int):
+        self.budget = max(0, int(budget_bytes))
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self._pages: "OrderedDict[Hashable, CachedPage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def set_budget(self, budget_bytes: int):
+        with self._lock:
+            self.budget = max(0, int(budget_bytes))
+            self._evict()
+
+    def put(self, key: Hashable, page: CachedPage):
+        page.size = (
+            sys.getsizeof(page.html) + sys.getsizeof(page.title) + sys.getsizeof(page.favicon)
+            + sum(sys.getsizeof(chunk) for chunk in page.deferred)
+        )
+        with self._lock:
+            old = self._pages.pop(key, None)
+            if old: self.used -= old.size
+            if page.size > self.budget: return
+            self._pages[key] = page
+            self.used += page.size
+            self._evict()
+
+    def get(self, key: Hashable) -> Optional[CachedPage]:
+        with self._lock:
+            page = self._pages.get(key)
+            if page is None:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def discard(self, *keys: Hashable):
+        with self._lock:
+            for key in keys:
+                old = self._pages.pop(key, None)
+                if old: self.used -= old.size
+
+    def _evict(self):
+        while self._pages and self.used > self.budget:
+            _, old = self._pages.popitem(last=False)
+            self.used -= old.size
+
+    def ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self): return len(self._pages)
+    def __repr__(self):
+        return f"<{type(self).__name__} {len(self._pages)} pages {self.used // 1024}KiB/{self.budget // 1024}KiB hits={self.hits} misses={self.misses}>"
+
+
+# The back/forward cache is a PageCache keyed by HistoryEntry.key.
+BFCache = PageCache
+
+
+class NavigationHistory:
+    """Per-view back/forward list. Page bodies live in the shared BFCache, keyed by entry."""
+
+    def __init__(self):
+        self.entries: List[HistoryEntry] = []
+        self.index = -1
+
+    @property
+    def current(self) -> Optional[HistoryEntry]:
+        return self.entries[self.index] if 0 <= self.index < len(self.entries) else None
+
+    def push(self, url: str):
+        """Append a new entry after the current one; returns (entry, dropped forward keys)."""
+        dropped = [e.key for e in self.entries[self.index + 1:]]
+        del self.entries[self.index + 1:]
+        entry = HistoryEntry(url)
+        self.entries.append(entry)
+        self.index = len(self.entries) - 1
+        return entry, dropped
+
+    def can_go(self, step: int) -> bool:
+        return 0 <= self.index + step < len(self.entries)
+
+    def go(self, step: int) -> Optional[HistoryEntry]:
+        if not self.can_go(step): return None
+        self.index += step
+        return self.entries[self.index]
+
+    def keys(self): return [e.key for e in self.entries]
@@ -0,0 +1,188 @@
+import time
+from dataclasses import dataclass, field
+from html import escape
+from typing import Dict, List
+
+from bs4 import BeautifulSoup
+from bs4.builder._htmlparser import BeautifulSoupHTMLParser, HTMLParserTreeBuilder
+
+FEED_CHUNK = 64 * 1024
+# QTextDocument setHtml + layout throughput of SolarRen output, in elements/ms. benchmarks/corpus/table.html
+# is the slowest page measured (~3/ms; long lists run ~8, plain text ~18); 2.5 leaves headroom under budget.
+NODES_PER_LAYOUT_MS = 2.5
+_layout_rate = NODES_PER_LAYOUT_MS   # lowered by observe_layout when a chunk lays out slower
+
+
+def observe_layout(nodes: int, ms: float) -> bool:
+    """Record a measured layout; True if it was slower than the rate chunks are sized with."""
+    global _layout_rate
+    if ms <= 0 or nodes <= 0: return False
+    rate = nodes / ms
+    if rate >= _layout_rate: return False
+    _layout_rate = max(1.0, rate)
+    return True
+
+
+@dataclass
+class RenderBudget:
+    max_bytes: int = 16 * 1024 * 1024
+    max_nodes: int = 300_000
+    parse_ms: int = 4000
+    layout_ms: int = 1500
+
+    @classmethod
+    def from_settings(cls, core, ns="renderer.solarren"):
+        get = core.settings.get_ns
+        return cls(
+            max_bytes=int(get(ns, "budget_max_kb", 16384)) * 1024,
+            max_nodes=int(get(ns, "budget_max_nodes", 300_000)),
+            parse_ms=int(get(ns, "budget_parse_ms", 4000)),
+            layout_ms=int(get(ns, "budget_layout_ms", 1500)),
+        )
+
+    @property
+    def layout_nodes(self) -> int:
+        return max(200, int(self.layout_ms * _layout_rate))
+
+    def key(self):
+        return (self.max_bytes, self.max_nodes, self.parse_ms, self.layout_ms, self.layout_nodes)
+
+
+@dataclass
+class BudgetReport:
+    notes: List[str] = field(default_factory=list)
+
+    @property
+    def exceeded(self) -> bool:
+        return bool(self.notes)
+
+
+class StageClock:
+    """Lap timer for the render pipeline: ``lap(name)`` books the time since the previous lap."""
+
+    def __init__(self):
+        self.laps: Dict[str, float] = {}
+        self._t = time.perf_counter()
+
+    def lap(self, name: str):
+        now = time.perf_counter()
+        self.laps[name] = self.laps.get(name, 0.0) + (now - self._t) * 1000
+        self._t = now
+
+
+class _CountingParser(BeautifulSoupHTMLParser):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.node_count = 0
+
+    def handle_starttag(self, name, attrs, *args, **kwargs):
+        self.node_count += 1
+        return super().handle_starttag(name, attrs, *args, **kwargs)
+
+
+class BudgetedTreeBuilder(HTMLParserTreeBuilder):
+    """html.parser builder that feeds in slices and stops once the node or time budget is spent.
+
+    Whatever was parsed so far is closed off normally, so the caller still gets a
+    well-formed (truncated) tree.
+    """
+
+    def __init__(self, budget: RenderBudget, report: BudgetReport, **kwargs):
+        super().__init__(**kwargs)
+        self.budget = budget
+        self.report = report
+
+    def feed(self, markup, *args, **kwargs):
+        p_args, p_kwargs = self.parser_args
+        try:
+            parser = _CountingParser(self.soup, *p_args, **p_kwargs)
+        except TypeError:   # bs4 < 4.13 sets the soup after construction
+            parser = _CountingParser(*p_args, **p_kwargs)
+            parser.soup = self.soup
+        deadline = time.perf_counter() + self.budget.parse_ms / 1000
+        for start in range(0, len(markup), FEED_CHUNK):
+            parser.feed(markup[start:start + FEED_CHUNK])
+            if parser.node_count >= self.budget.max_nodes:
+                self.report.notes.append(f"parsing stopped after {parser.node_count} elements")
+                break
+            if time.perf_counter() > deadline:
+                done = min(100, (start + FEED_CHUNK) * 100 // max(1, len(markup)))
+                self.report.notes.append(f"parsing stopped after {self.budget.parse_ms} ms ({done}% of the page)")
+                break
+        parser.close()
+        parser.already_closed_empty_element = []
+
+
+def parse_with_budget(html: str, budget: RenderBudget, report: BudgetReport, **kwargs) -> BeautifulSoup:
+    return BeautifulSoup(html, builder=BudgetedTreeBuilder(budget, report), **kwargs)
+
+
+def _subtree_sizes(container) -> dict:
+    """id(tag) -> element count of its subtree (itself included), in one pass over the tree."""
+    sizes = {}
+    # Reversed document order visits every descendant before its ancestors.
+    for node in reversed([container, *container.descendants]):
+        if getattr(node, "name", None):
+            sizes[id(node)] = 1 + sum(sizes[id(c)] for c in node.children if getattr(c, "name", None))
+    return sizes
+
+
+def _open_tag(node, **override) -> str:
+    attrs = {**node.attrs, **override}
+    return f"<{node.name}" + "".join(
+        f' {k}="{escape(" ".join(v) if isinstance(v, list) else str(v))}"' for k, v in attrs.items()) + ">"
+
+
+def _group(units, limit: int):
+    """Join (html, size, items) units into runs of at most ``limit`` elements; a bigger unit stays whole."""
+    runs, parts, count, items = [], [], 0, 0
+    for html, size, n in units:
+        if parts and count + size > limit:
+            runs.append(("".join(parts), count, items)); parts, count, items = [], 0, 0
+        parts.append(html); count += size; items += n
+    if parts: runs.append(("".join(parts), count, items))
+    return runs
+
+
+def _pieces(node, limit: int, sizes: dict):
+    """Yield (html, size, items) for ``node``, split into re-wrapped copies of it if it is over ``limit``.
+
+    Tables are split by rows (the <thead> is repeated in every piece) and lists by items,
+    so one huge <table> or <ul> no longer ends up in a single layout chunk.
+    """
+    name = getattr(node, "name", None)
+    size = sizes[id(node)] if name else 0
+    if size <= limit or name is None or name in ("tr", "li", "pre"):
+        yield str(node), size, 1; return
+    if name == "table":
+        head, head_size, units = "", 0, []
+        for child in node.children:
+            if getattr(child, "name", None) == "thead": head, head_size = str(child), sizes[id(child)]
+            elif getattr(child, "name", None) in ("tbody", "tfoot"):
+                units.extend((str(c), sizes.get(id(c), 0), 1) for c in child.children)
+            else: units.append((str(child), sizes.get(id(child), 0), 1))
+        for html, count, _n in _group(units, max(1, limit - head_size - 2)):
+            yield f"{_open_tag(node)}{head}<tbody>{html}</tbody></table>", count + head_size + 2, 1
+        return
+    if name in ("ul", "ol"):
+        units = [(str(c), sizes.get(id(c), 0), 1 if getattr(c, "name", None) == "li" else 0) for c in node.children]
+        try: start = int(node.get("start", 1))
+        except ValueError: start = 1
+        for html, count, items in _group(units, max(1, limit - 1)):
+            tag = _open_tag(node, start=str(start)) if name == "ol" else _open_tag(node)
+            yield f"{tag}{html}</{name}>", count + 1, 1
+            start += items
+        return
+    units = [piece for child in node.children for piece in _pieces(child, max(1, limit - 1), sizes)]
+    for html, count, _n in _group(units, max(1, limit - 1)):
+        yield f"{_open_tag(node)}{html}</{name}>", count + 1, 1
+
+
+def split_blocks(container, layout_nodes: int):
+    """Serialize ``container``'s children into chunks of at most about ``layout_nodes`` elements each.
+
+    Oversized children are split recursively (see _pieces); a single row or list item is never cut.
+    """
+    sizes = _subtree_sizes(container)
+    units = [piece for child in container.children for piece in _pieces(child, layout_nodes, sizes)]
+    return [html for html, _count, _items in _group(units, layout_nodes)]
@@ -0,0 +1,156 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Callable
+
+# Properties QTextDocument's HTML importer understands (see "Supported HTML Subset" in the Qt docs).
+SUPPORTED_PROPS = frozenset((
+    "color", "background", "background-color", "font", "font-family", "font-size", "font-style",
+    "font-weight", "font-variant", "text-decoration", "text-transform", "text-align", "text-indent",
+    "vertical-align", "white-space", "line-height", "letter-spacing", "word-spacing",
+    "margin", "margin-top", "margin-bottom", "margin-left", "margin-right",
+    "padding", "padding-top", "padding-bottom", "padding-left", "padding-right",
+    "border", "border-width", "border-style", "border-color", "border-collapse",
+    "width", "height", "list-style", "list-style-type", "page-break-before", "page-break-after",
+))
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_BRACE_RE = re.compile(r""""(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|[{}]""")   # strings are matched to be skipped
+# Qt matches type, .class, #id, descendant and child selectors; anything fancier never applies.
+_SELECTOR_RE = re.compile(r"^[\w\-.#> ]+$")
+_CHROME_RE = re.compile(r"(?:^|[\s>])(?:html|body|:root)$", re.I)
+_BAD_VALUE_RE = re.compile(r"var\(|calc\(|env\(|url\(|\d(?:rem|vw|vh|vmin|vmax|ch)\b", re.I)
+_MEDIA_SKIP_RE = re.compile(r"print|speech|max-width|max-device-width|orientation", re.I)
+
+
+@dataclass
+class RuleSet:
+    url: str
+    css: str = ""
+    kept: int = 0
+    dropped: int = 0
+    ms: float = 0.0
+    error: str = ""
+
+
+def _top_level(text: str):
+    """Yield (prelude, body) for each top-level rule; body is None for statements like @import."""
+    def brace(start):
+        for m in _BRACE_RE.finditer(text, start):
+            if m.group() in "{}": return m
+        return None
+
+    pos, n = 0, len(text)
+    while pos < n:
+        m = brace(pos)
+        if m is None: return
+        semi = text.find(";", pos, m.start())
+        if semi >= 0 and text[pos:semi].lstrip().startswith("@"):
+            yield text[pos:semi].strip(), None
+            pos = semi + 1; continue
+        if m.group() == "}":
+            pos = m.end(); continue
+        depth, end = 1, m.end()
+        while depth:
+            c = brace(end)
+            if c is None: end = n; break
+            depth += 1 if c.group() == "{" else -1
+            end = c.end()
+        yield text[pos:m.start()].strip(), text[m.end():end - 1]
+        pos = end
+
+
+def _reduce_rule(prelude: str, body: str):
+    selectors = [s.strip() for s in prelude.split(",")]
+    selectors = [s for s in selectors if s and _SELECTOR_RE.match(s) and not _CHROME_RE.search(s)]
+    if not selectors: return None
+    decls = []
+    for part in body.split(";"):
+        prop, sep, value = part.partition(":")
+        prop, value = prop.strip().lower(), value.replace("!important", "").strip()
+        if sep and prop in SUPPORTED_PROPS and value and not _BAD_VALUE_RE.search(value):
+            decls.append(f"{prop}: {value}")
+    if not decls: return None
+    return f"{', '.join(selectors)} {{ {'; '.join(decls)} }}"
+
+
+def reduce_stylesheet(text: str, url: str = "") -> RuleSet:
+    """Cut a site stylesheet down to rules QTextDocument can actually apply.
+
+    Comments, at-rules other than screen-ish ``@media`` blocks, selectors Qt
+    cannot match, rules aimed at html/body (SolarRen's chrome owns those),
+    unsupported properties and values using var()/calc()/url() or viewport
+    units are all dropped.
+    """
+    t0 = time.perf_counter()
+    out, kept, dropped = [], 0, 0
+    pending = [_COMMENT_RE.sub("", text)]
+    while pending:
+        for prelude, body in _top_level(pending.pop()):
+            if prelude.startswith("@"):
+                if body is not None and prelude[:6].lower() == "@media" and not _MEDIA_SKIP_RE.search(prelude):
+                    pending.append(body)
+                else:
+                    dropped += 1
+                continue
+            rule = _reduce_rule(prelude, body or "")
+            if rule is None:
+                dropped += 1
+            else:
+                out.append(rule); kept += 1
+    return RuleSet(url, "\n".join(out), kept, dropped, (time.perf_counter() - t0) * 1000)
+
+
+class StylesheetCache:
+    """Reduced external stylesheets keyed by absolute URL.
+
+    Every page of a site links the same few files, so each one is fetched and
+    reduced once and then shared by all pages and tabs. Lookups return a
+    Future; concurrent requests for one URL share the same load. Failed loads
+    are not kept, so the next page retries.
+    """
+
+    def __init__(self, executor: Executor, max_entries: int = 256):
+        self.executor = executor
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str, fetch: Callable[[str], str]) -> Future:
+        with self._lock:
+            fut = self._items.get(url)
+            if fut is not None:
+                self._items.move_to_end(url)
+                self.hits += 1
+                return fut
+            self.misses += 1
+            fut = self._items[url] = self.executor.submit(self._load, url, fetch)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        fut.add_done_callback(lambda f, u=url: f.result().error and self._forget(u, f))
+        return fut
+
+    def peek(self, url: str):
+        """The finished RuleSet for ``url``, or None if it is not loaded (yet)."""
+        fut = self._items.get(url)
+        return fut.result() if fut is not None and fut.done() else None
+
+    def _forget(self, url: str, fut: Future):
+        with self._lock:
+            if self._items.get(url) is fut: del self._items[url]
+
+    @staticmethod
+    def _load(url: str, fetch) -> RuleSet:
+        try:
+            text = fetch(url)
+        except Exception as e:
+            return RuleSet(url, error=str(e) or type(e).__name__)
+        return reduce_stylesheet(text or "", url)
+
+    def __len__(self): return len(self._items)
+    def __repr__(self):
+        return f"<{type(self).__name__} {len(self._items)} sheets hits={self.hits} misses={self.misses}>"
@@ -0,0 +1,103 @@
+import re
+import time
+from dataclasses import dataclass
+
+UNLIKELY_RE = re.compile(
+    r"banner|breadcrumb|combx|comment|community|cookie|consent|disqus|extra|foot|header|menu|"
+    r"modal|nav|newsletter|pager|popup|promo|related|remark|rss|share|shoutbox|sidebar|skyscraper|"
+    r"social|sponsor|subscribe|toolbar|ad-break|advert",
+    re.I,
+)
+LIKELY_RE = re.compile(r"and|article|body|column|content|main|post|entry|story|text|shadow", re.I)
+POSITIVE_RE = re.compile(r"article|body|content|entry|main|page|post|text|blog|story", re.I)
+NEGATIVE_RE = re.compile(r"hidden|combx|comment|com-|contact|foot|footer|masthead|meta|outbrain|promo|"
+                         r"related|scroll|shoutbox|sidebar|skyscraper|sponsor|shopping|tags|widget", re.I)
+JUNK_TAGS = ("nav", "footer", "aside", "form", "iframe", "button", "select", "dialog", "svg")
+PARAGRAPH_TAGS = ("p", "pre", "td", "blockquote", "li")
+TAG_BONUS = {"article": 10, "main": 8, "section": 3, "div": 5, "pre": 3, "td": 3, "blockquote": 3,
+             "form": -3, "ol": -3, "ul": -3, "li": -3, "th": -5, "h1": -5, "h2": -5, "h3": -5}
+
+
+@dataclass
+class DistillStats:
+    nodes_before: int
+    nodes_after: int
+    ms: float
+    applied: bool
+
+    def __str__(self):
+        if not self.applied:
+            return f"reader: no main content, {self.nodes_before}→{self.nodes_after} nodes in {self.ms:.0f} ms"
+        return f"reader: {self.nodes_before}→{self.nodes_after} nodes in {self.ms:.0f} ms"
+
+
+def _hint(tag) -> str:
+    cls = tag.get("class") or ""
+    if isinstance(cls, list): cls = " ".join(cls)
+    return f"{cls} {tag.get('id') or ''}"
+
+
+def _class_weight(tag) -> int:
+    hint = _hint(tag)
+    weight = 0
+    if NEGATIVE_RE.search(hint): weight -= 25
+    if POSITIVE_RE.search(hint): weight += 25
+    return weight
+
+
+def _link_density(tag, text_len: int) -> float:
+    if not text_len: return 1.0
+    link_len = sum(len(a.get_text(" ", strip=True)) for a in tag.find_all("a"))
+    return link_len / text_len
+
+
+def distill(soup, min_chars: int = 250) -> DistillStats:
+    """Reduce ``soup`` in place to its main content subtree (readability-style scoring).
+
+    Blocks are scored by text length and comma count, propagated to parent and
+    grandparent, weighted by class/id hints and scaled by (1 - link density).
+    Obvious chrome (nav, footers, banners) is always stripped; the body is only
+    swapped for the winning subtree when it carries ``min_chars`` of text.
+    """
+    t0 = time.perf_counter()
+    root = soup.body or soup
+    nodes_before = len(root.find_all(True))
+
+    for tag in root.find_all(JUNK_TAGS):
+        tag.decompose()
+    for tag in root.find_all(True):
+        if tag.decomposed or tag.name in ("body", "article", "main"): continue
+        hint = _hint(tag)
+        if hint.strip() and UNLIKELY_RE.search(hint) and not LIKELY_RE.search(hint):
+            tag.decompose()
+
+    scores = {}
+    for para in root.find_all(PARAGRAPH_TAGS):
+        text = para.get_text(" ", strip=True)
+        if len(text) < 25: continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        for level, anc in enumerate((para.parent, getattr(para.parent, "parent", None))):
+            if anc is None or getattr(anc, "name", None) is None: break
+            key = id(anc)
+            if key not in scores:
+                scores[key] = [anc, TAG_BONUS.get(anc.name, 0) + _class_weight(anc)]
+            scores[key][1] += score if level == 0 else score / 2
+
+    best, best_score = None, 0.0
+    for tag, score in scores.values():
+        text_len = len(tag.get_text(" ", strip=True))
+        final = score * (1 - _link_density(tag, text_len))
+        if final > best_score and text_len >= min_chars:
+            best, best_score = tag, final
+
+    applied = best is not None and best is not root
+    if applied:
+        # A sole-child wrapper usually means the real container is one level up.
+        parent = best.parent
+        while parent is not None and parent is not root and len(parent.find_all(True, recursive=False)) == 1:
+            best, parent = parent, parent.parent
+        best.extract()
+        root.clear()
+        root.append(best)
+    nodes_after = len(root.find_all(True))
+    return DistillStats(nodes_before, nodes_after, (time.perf_counter() - t0) * 1000, applied)
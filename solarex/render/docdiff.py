@@ -0,0 +1,137 @@
+import difflib
+import time
+from dataclasses import dataclass
+
+from PyQt6 import QtGui
+
+MAX_MATCH_BLOCKS = 4000     # above this the changed middle is replaced wholesale instead of diffed
+MAX_CHANGED_RATIO = 0.5     # patching most of the document is no cheaper than setHtml
+
+
+@dataclass
+class PatchStats:
+    blocks: int
+    changed: int
+    ms: float
+
+    def __str__(self):
+        return f"updated {self.changed} of {self.blocks} blocks in {self.ms:.0f} ms"
+
+
+def _block_sig(block) -> int:
+    bf = block.blockFormat()
+    parts = [
+        block.text(), bf.alignment().value, bf.headingLevel(), bf.indent(),
+        bf.topMargin(), bf.bottomMargin(), bf.leftMargin(), bf.background().color().rgba(),
+        block.textList() is not None,
+    ]
+    it = block.begin()
+    while not it.atEnd():
+        frag = it.fragment()
+        cf = frag.charFormat()
+        parts.append((
+            frag.length(), cf.anchorHref(), cf.fontWeight(), cf.fontItalic(), cf.fontUnderline(),
+            cf.fontPointSize(), cf.fontFamilies() and tuple(cf.fontFamilies()),
+            cf.foreground().color().rgba(), cf.background().color().rgba(),
+            cf.toImageFormat().name() if cf.isImageFormat() else "",
+        ))
+        it += 1
+    return hash(tuple(parts))
+
+
+def _table_spans(doc):
+    spans, stack = [], [doc.rootFrame()]
+    while stack:
+        for child in stack.pop().childFrames():
+            if isinstance(child, QtGui.QTextTable):
+                spans.append((child.firstPosition(), child.lastPosition()))
+            else:
+                stack.append(child)
+    return spans
+
+
+def _blocks(doc):
+    """(signature, position, length, in_table) for every block of ``doc``."""
+    spans = _table_spans(doc)
+    out = []
+    block = doc.begin()
+    while block.isValid():
+        pos = block.position()
+        in_table = any(a <= pos <= b for a, b in spans)
+        out.append((_block_sig(block), pos, block.length(), in_table))
+        block = block.next()
+    return out
+
+
+def _changed_ranges(a, b):
+    """Replace-only (old_start, old_end, new_start, new_end) ranges turning ``a`` into ``b``."""
+    head = 0
+    while head < len(a) and head < len(b) and a[head] == b[head]: head += 1
+    tail = 0
+    while tail < len(a) - head and tail < len(b) - head and a[-1 - tail] == b[-1 - tail]: tail += 1
+    a_mid, b_mid = a[head:len(a) - tail], b[head:len(b) - tail]
+    if not a_mid and not b_mid: return []
+    if len(a_mid) + len(b_mid) > MAX_MATCH_BLOCKS:
+        ops = [(0, len(a_mid), 0, len(b_mid))]
+    else:
+        sm = difflib.SequenceMatcher(None, a_mid, b_mid, autojunk=False)
+        ops = [(i1, i2, j1, j2) for tag, i1, i2, j1, j2 in sm.get_opcodes() if tag != "equal"]
+    ranges = []
+    for i1, i2, j1, j2 in ops:
+        i1, i2, j1, j2 = i1 + head, i2 + head, j1 + head, j2 + head
+        # Pure inserts/deletes borrow one unchanged neighbour so both sides select whole blocks.
+        if i1 == i2 or j1 == j2:
+            if i1 > 0 and j1 > 0: i1, j1 = i1 - 1, j1 - 1
+            else: i2, j2 = i2 + 1, j2 + 1
+        if ranges and i1 <= ranges[-1][1]:
+            p = ranges.pop()
+            i1, j1 = min(i1, p[0]), min(j1, p[2])
+            i2, j2 = max(i2, p[1]), max(j2, p[3])
+        ranges.append((i1, i2, j1, j2))
+    return ranges
+
+
+def patch_document(doc: QtGui.QTextDocument, html: str):
+    """Update ``doc`` in place to match ``html``, touching only blocks that changed.
+
+    ``html`` is parsed into a scratch document (no layout), blocks of both are
+    compared by text and formatting, and each changed run is swapped in with
+    ``insertFragment`` inside one edit block so the layout only redoes those
+    runs and the scroll position is kept. Returns PatchStats, or None when the
+    caller should fall back to ``setHtml`` (tables touched, too much changed,
+    or the patched result does not match).
+    """
+    t0 = time.perf_counter()
+    scratch = QtGui.QTextDocument()
+    scratch.setDefaultFont(doc.defaultFont())
+    scratch.setDefaultStyleSheet(doc.defaultStyleSheet())
+    scratch.setBaseUrl(doc.baseUrl())
+    scratch.setHtml(html)
+
+    old, new = _blocks(doc), _blocks(scratch)
+    old_sigs, new_sigs = [b[0] for b in old], [b[0] for b in new]
+    ranges = _changed_ranges(old_sigs, new_sigs)
+    if not ranges:
+        return PatchStats(len(new), 0, (time.perf_counter() - t0) * 1000)
+    changed = sum(max(i2 - i1, j2 - j1) for i1, i2, j1, j2 in ranges)
+    if changed > MAX_CHANGED_RATIO * max(len(old), len(new)): return None
+    for i1, i2, j1, j2 in ranges:
+        if any(b[3] for b in old[i1:i2]) or any(b[3] for b in new[j1:j2]): return None
+
+    cursor = QtGui.QTextCursor(doc)
+    src = QtGui.QTextCursor(scratch)
+    cursor.beginEditBlock()
+    # Back to front, so positions computed before the edit stay valid.
+    for i1, i2, j1, j2 in reversed(ranges):
+        # Start at the preceding block separator when there is one, so the fragment
+        # brings its own block and list formats instead of merging into the block before.
+        lead = 1 if i1 > 0 and j1 > 0 else 0
+        src.setPosition(new[j1][1] - lead)
+        src.setPosition(new[j2 - 1][1] + new[j2 - 1][2] - 1, QtGui.QTextCursor.MoveMode.KeepAnchor)
+        cursor.setPosition(old[i1][1] - lead)
+        cursor.setPosition(old[i2 - 1][1] + old[i2 - 1][2] - 1, QtGui.QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertFragment(src.selection())
+    cursor.endEditBlock()
+
+    if [b[0] for b in _blocks(doc)] != new_sigs: return None
+    return PatchStats(len(new), changed, (time.perf_counter() - t0) * 1000)
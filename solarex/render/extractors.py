@@ -0,0 +1,108 @@
+import fnmatch
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class ExtractResult:
+    body_html: str
+    status: str = "Done"
+    location: str = ""          # label for the toolbar; defaults to the host
+
+
+@dataclass
+class ExtractContext:
+    base_url: str
+    host: str
+    soup: object
+    title: str
+    extractor: "SiteExtractor"
+
+    def select(self, name: str, node=None) -> list:
+        return self.extractor.selector(name).select(node if node is not None else self.soup)
+
+    def select_one(self, name: str, node=None):
+        return self.extractor.selector(name).select_one(node if node is not None else self.soup)
+
+
+@dataclass
+class SiteExtractor:
+    """Fast path for one family of sites.
+
+    ``hosts`` are fnmatch patterns (``www.google.*``). ``selectors`` are CSS
+    selectors compiled once on first use and exposed through
+    ``ExtractContext.select``. ``needs`` lists the tag names whose subtrees the
+    extractor reads; everything else is skipped by the parser. ``stop_at`` is a
+    regex marking where the needed content ends, so the rest of the document is
+    never parsed. ``extract`` returns an ExtractResult, or None to fall back to
+    the generic renderer.
+    """
+
+    id: str
+    hosts: Sequence[str]
+    extract: Callable[[ExtractContext], Optional[ExtractResult]]
+    selectors: Dict[str, str] = field(default_factory=dict)
+    needs: Sequence[str] = ()
+    stop_at: Optional[str] = None
+    favicon: bool = True
+    priority: int = 0
+
+    def __post_init__(self):
+        self._host_re = re.compile("|".join(fnmatch.translate(h.lower()) for h in self.hosts) or "(?!)")
+        self._stop_re = re.compile(self.stop_at, re.I) if self.stop_at else None
+        self._compiled: Dict[str, object] = {}
+
+    def matches(self, host: str) -> bool:
+        return bool(self._host_re.match(host))
+
+    def selector(self, name: str):
+        sel = self._compiled.get(name)
+        if sel is None:
+            import soupsieve
+            sel = self._compiled[name] = soupsieve.compile(self.selectors[name])
+        return sel
+
+    def trim(self, html: str) -> str:
+        if self._stop_re is None: return html
+        m = self._stop_re.search(html)
+        return html[:m.start()] if m else html
+
+    def strainer(self):
+        if not self.needs: return None
+        from bs4 import SoupStrainer
+        names = {"title"} | set(self.needs)
+        if self.favicon: names.add("link")
+        return SoupStrainer(sorted(names))
+
+
+class ExtractorRegistry:
+    def __init__(self):
+        self._items: List[SiteExtractor] = []
+        self._by_host: Dict[str, Tuple[SiteExtractor, ...]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, extractor: SiteExtractor) -> SiteExtractor:
+        with self._lock:
+            self._items = [e for e in self._items if e.id != extractor.id] + [extractor]
+            self._items.sort(key=lambda e: -e.priority)
+            self._by_host.clear()
+        return extractor
+
+    def unregister(self, extractor_id: str):
+        with self._lock:
+            self._items = [e for e in self._items if e.id != extractor_id]
+            self._by_host.clear()
+
+    def match(self, host: str) -> Tuple[SiteExtractor, ...]:
+        host = (host or "").lower()
+        hit = self._by_host.get(host)
+        if hit is None:
+            hit = self._by_host[host] = tuple(e for e in self._items if e.matches(host))
+        return hit
+
+    def list(self): return list(self._items)
+
+
+registry = ExtractorRegistry()
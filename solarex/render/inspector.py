@@ -0,0 +1,369 @@
+from array import array
+from typing import Optional
+
+from PyQt6 import QtCore, QtWidgets
+
+FETCH_BATCH = 256
+TEXT_PREVIEW = 80
+
+
+class SoupDomSource:
+    """Read-only adapter exposing a BeautifulSoup tree to the inspector."""
+
+    def __init__(self, soup):
+        self._root = soup.body or soup
+
+    def root(self):
+        return self._root
+
+    def children(self, ref) -> list:
+        out = []
+        for ch in getattr(ref, "contents", None) or ():
+            if isinstance(ch, str):
+                if ch.strip(): out.append(ch)
+            else:
+                out.append(ch)
+        return out
+
+    def label(self, ref):
+        if isinstance(ref, str):
+            return "#text", ref.strip()[:TEXT_PREVIEW]
+        attrs = " ".join(
+            f'{k}="{" ".join(v) if isinstance(v, list) else v}"'
+            for k, v in getattr(ref, "attrs", {}).items()
+        )
+        return getattr(ref, "name", "#"), attrs
+
+    def keys(self, ref):
+        if isinstance(ref, str):
+            return None
+        attrs = getattr(ref, "attrs", {})
+        classes = attrs.get("class") or ()
+        if isinstance(classes, str): classes = classes.split()
+        return (ref.name or "").lower(), str(attrs.get("id") or "").lower(), tuple(c.lower() for c in classes)
+
+    def has_children(self, ref) -> bool:
+        return bool(getattr(ref, "contents", None))
+
+
+def _attr_text(attrs) -> str:
+    return " ".join(f'{k}="{" ".join(v) if isinstance(v, list) else v}"' for k, v in attrs.items())
+
+
+class DomSnapshot:
+    """Compact, immutable copy of a parsed tree for the inspector.
+
+    Nodes (elements and non-blank text) are numbered in document order and kept
+    in parallel arrays; ``end[i]`` is one past the last descendant of node ``i``,
+    so children are found by hopping ``j = end[j]``. Tag names, attribute
+    strings, ids and class lists are interned into one string table. Refs are
+    plain ints, so the snapshot can be shared with the indexing thread.
+    """
+
+    __slots__ = ("kind", "parent", "end", "label_ix", "id_ix", "class_ix", "strings")
+
+    TEXT = 0
+
+    def __init__(self):
+        self.kind = array("i")       # string index of the tag name; 0 marks a text node
+        self.parent = array("i")
+        self.end = array("i")
+        self.label_ix = array("i")   # attribute text, or the text preview for text nodes
+        self.id_ix = array("i")
+        self.class_ix = array("i")
+        self.strings = ["#text", ""]
+
+    @classmethod
+    def from_soup(cls, soup) -> "DomSnapshot":
+        snap = cls()
+        table = {s: i for i, s in enumerate(snap.strings)}
+
+        def intern(text: str) -> int:
+            ix = table.get(text)
+            if ix is None:
+                ix = table[text] = len(snap.strings)
+                snap.strings.append(text)
+            return ix
+
+        stack = [(soup.body or soup, -1)]
+        while stack:
+            ref, parent = stack.pop()
+            if ref is None:                      # all children of `parent` emitted
+                snap.end[parent] = len(snap.kind); continue
+            i = len(snap.kind)
+            snap.parent.append(parent)
+            snap.end.append(i + 1)
+            if isinstance(ref, str):
+                snap.kind.append(cls.TEXT); snap.label_ix.append(intern(ref.strip()[:TEXT_PREVIEW]))
+                snap.id_ix.append(1); snap.class_ix.append(1)
+                continue
+            attrs = getattr(ref, "attrs", {})
+            classes = attrs.get("class") or ()
+            if isinstance(classes, str): classes = classes.split()
+            snap.kind.append(intern(ref.name or "#"))
+            snap.label_ix.append(intern(_attr_text(attrs)))
+            snap.id_ix.append(intern(str(attrs.get("id") or "").lower()))
+            snap.class_ix.append(intern(" ".join(c.lower() for c in classes)))
+            stack.append((None, i))
+            for ch in reversed(getattr(ref, "contents", None) or ()):
+                if not isinstance(ch, str) or ch.strip():
+                    stack.append((ch, i))
+        return snap
+
+    def __len__(self): return len(self.kind)
+
+    def nbytes(self) -> int:
+        arrays = (self.kind, self.parent, self.end, self.label_ix, self.id_ix, self.class_ix)
+        return sum(a.itemsize * len(a) for a in arrays) + sum(len(s) for s in self.strings)
+
+    def root(self):
+        return 0 if len(self.kind) else None
+
+    def children(self, ref) -> list:
+        if ref is None: return []
+        out, j, stop = [], ref + 1, self.end[ref]
+        while j < stop:
+            out.append(j); j = self.end[j]
+        return out
+
+    def label(self, ref):
+        return self.strings[self.kind[ref]], self.strings[self.label_ix[ref]]
+
+    def keys(self, ref):
+        if self.kind[ref] == self.TEXT:
+            return None
+        classes = self.strings[self.class_ix[ref]]
+        return self.strings[self.kind[ref]].lower(), self.strings[self.id_ix[ref]], tuple(classes.split())
+
+    def has_children(self, ref) -> bool:
+        return ref is not None and self.end[ref] > ref + 1
+
+
+class _Node:
+    __slots__ = ("ref", "parent", "row", "_pending", "children")
+
+    def __init__(self, ref, parent, row):
+        self.ref = ref
+        self.parent = parent
+        self.row = row
+        self._pending = None
+        self.children: list["_Node"] = []
+
+
+class DomTreeModel(QtCore.QAbstractItemModel):
+    """Tree model that only materializes children when the view asks for them."""
+
+    HEADERS = ("Node", "Attrs")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source = None
+        self._root: Optional[_Node] = None
+
+    def set_source(self, source):
+        self.beginResetModel()
+        self._source = source
+        self._root = _Node(None, None, 0)
+        if source is not None:
+            self._root._pending = [source.root()]
+        self.endResetModel()
+
+    def source(self):
+        return self._source
+
+    # ---- lazy children ----
+    def _pending(self, node: _Node) -> list:
+        if node._pending is None:
+            node._pending = self._source.children(node.ref) if self._source else []
+        return node._pending
+
+    def _node(self, index: QtCore.QModelIndex) -> Optional[_Node]:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return bool(node and len(node.children) < len(self._pending(node)))
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if node is None: return
+        pending = self._pending(node)
+        start = len(node.children)
+        end = min(len(pending), start + FETCH_BATCH)
+        if end <= start: return
+        self.beginInsertRows(parent, start, end - 1)
+        node.children.extend(_Node(pending[i], node, i) for i in range(start, end))
+        self.endInsertRows()
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        node = self._node(parent)
+        if node is None: return False
+        if node is self._root: return bool(self._pending(node))
+        if node._pending is not None: return bool(node._pending)
+        return self._source.has_children(node.ref)
+
+    # ---- QAbstractItemModel ----
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0: return 0
+        node = self._node(parent)
+        return len(node.children) if node else 0
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self.HEADERS)
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        node = self._node(parent)
+        if node is None or not (0 <= row < len(node.children)): return QtCore.QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid(): return QtCore.QModelIndex()
+        node = index.internalPointer().parent
+        if node is None or node is self._root: return QtCore.QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (
+            QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.ToolTipRole
+        ):
+            return None
+        return self._source.label(index.internalPointer().ref)[index.column()]
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def index_for_path(self, path) -> QtCore.QModelIndex:
+        """Fetch just the branch leading to ``path`` and return its index."""
+        parent = QtCore.QModelIndex()
+        for row in path:
+            node = self._node(parent)
+            while len(node.children) <= row and self.canFetchMore(parent):
+                self.fetchMore(parent)
+            if row >= len(node.children): return QtCore.QModelIndex()
+            parent = self.index(row, 0, parent)
+        return parent
+
+
+_RUNNING: set = set()   # workers stay referenced until they finish, even if superseded or their inspector is gone
+
+
+class DomIndexWorker(QtCore.QThread):
+    ready = QtCore.pyqtSignal(object, object)   # source, entries
+
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        src = self.source
+        entries = []
+        stack = [((0,), src.root())] if src.root() is not None else []
+        while stack:
+            if self._cancelled: return
+            path, ref = stack.pop()
+            keys = src.keys(ref)
+            if keys is None: continue
+            entries.append((keys, path))
+            kids = src.children(ref)
+            for i in range(len(kids) - 1, -1, -1):
+                stack.append((path + (i,), kids[i]))
+        if not self._cancelled:
+            self.ready.emit(src, entries)
+
+
+def _matches(keys, term: str) -> bool:
+    tag, ident, classes = keys
+    if term.startswith("#"):
+        return term[1:] in ident
+    if term.startswith("."):
+        needle = term[1:]
+        return any(needle in c for c in classes)
+    return term in tag or term in ident or any(term in c for c in classes)
+
+
+class DomInspector(QtWidgets.QWidget):
+    """Lazy DOM tree plus incremental tag/#id/.class search."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        lay = QtWidgets.QVBoxLayout(self); lay.setContentsMargins(0, 0, 0, 0)
+        bar = QtWidgets.QHBoxLayout()
+        self.search = QtWidgets.QLineEdit(); self.search.setPlaceholderText("Search tag, #id or .class")
+        self.search.setClearButtonEnabled(True)
+        self.status = QtWidgets.QLabel("")
+        bar.addWidget(self.search, 1); bar.addWidget(self.status, 0)
+        self.model = DomTreeModel(self)
+        self.tree = QtWidgets.QTreeView(); self.tree.setModel(self.model); self.tree.setUniformRowHeights(True)
+        lay.addLayout(bar); lay.addWidget(self.tree, 1)
+
+        self._worker: Optional[DomIndexWorker] = None
+        self._entries = None
+        self._last_term = ""
+        self._hits: list = []
+        self._hit_pos = -1
+        self._debounce = QtCore.QTimer(self); self._debounce.setSingleShot(True); self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self._run_search)
+        self.search.textChanged.connect(lambda _t: self._debounce.start())
+        self.search.returnPressed.connect(self._next_hit)
+
+    def set_source(self, source):
+        if self._worker is not None:
+            self._worker.cancel()
+        self.model.set_source(source)
+        self.tree.expandToDepth(0)
+        self._entries = None; self._hits = []; self._hit_pos = -1; self._last_term = ""
+        self.status.setText("Indexing…")
+        self._worker = worker = DomIndexWorker(source)
+        worker.ready.connect(self._on_index_ready)
+        _RUNNING.add(worker)
+        worker.finished.connect(worker.deleteLater)
+        worker.destroyed.connect(lambda *_: _RUNNING.discard(worker))
+        worker.start()
+
+    def clear(self, message: str = ""):
+        """Show no tree, e.g. for a page whose DOM is not available."""
+        if self._worker is not None:
+            self._worker.cancel(); self._worker = None
+        self.model.set_source(None)
+        self._entries = None; self._hits = []; self._hit_pos = -1; self._last_term = ""
+        self.status.setText(message)
+
+    def _on_index_ready(self, source, entries):
+        if source is not self.model.source(): return
+        self._entries = entries
+        self.status.setText(f"{len(entries)} nodes")
+        if self.search.text().strip(): self._run_search()
+
+    def _run_search(self):
+        term = self.search.text().strip().lower()
+        if not term:
+            self._hits = []; self._hit_pos = -1; self._last_term = ""
+            self.status.setText(f"{len(self._entries)} nodes" if self._entries is not None else "Indexing…")
+            return
+        if self._entries is None:
+            self.status.setText("Indexing…"); return
+        # Narrow the previous hit list while the user keeps typing the same term.
+        narrowing = self._last_term and term.startswith(self._last_term) and term[:1] == self._last_term[:1]
+        pool = self._hits if narrowing else self._entries
+        self._hits = [e for e in pool if _matches(e[0], term)]
+        self._last_term = term
+        self._hit_pos = -1
+        self.status.setText(f"{len(self._hits)} matches")
+        if self._hits: self._next_hit()
+
+    def _next_hit(self):
+        if not self._hits: return
+        self._hit_pos = (self._hit_pos + 1) % len(self._hits)
+        idx = self.model.index_for_path(self._hits[self._hit_pos][1])
+        if idx.isValid():
+            p = idx.parent()
+            while p.isValid():
+                self.tree.expand(p); p = p.parent()
+            self.tree.setCurrentIndex(idx); self.tree.scrollTo(idx)
+        self.status.setText(f"{self._hit_pos + 1}/{len(self._hits)}")
@@ -1,46 +1,111 @@
 import importlib
+import json
 import pkgutil
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from types import ModuleType
-from typing import Callable, Dict, Optional
+from typing import Dict, List, Optional
+
+from solarex.render.extractors import registry as extractor_registry
+
+def read_manifest(module_file) -> dict:
+    """The ``<module>.json`` sidecar next to a renderer module: metadata plus ``settings`` schema."""
+    return json.loads(Path(module_file).with_suffix(".json").read_text(encoding="utf-8"))
 
 @dataclass
 class BackendEntry:
     id: str
     name: str
     desc: str
-    module: ModuleType
-    settings_schema: Callable[[object], list]
+    dotted: str
+    version: str = ""
+    settings: Optional[List[dict]] = None   # None: only the module knows (get_settings_schema)
+    prefetch: bool = False                  # manifest opt-in: the first view can take a startup prefetch
+    module: Optional[ModuleType] = None
+    import_ms: Optional[float] = None
+
+    def load(self) -> ModuleType:
+        """Import the backend module on first use; import errors propagate."""
+        if self.module is None:
+            t0 = time.perf_counter()
+            mod = importlib.import_module(self.dotted)
+            self.import_ms = (time.perf_counter() - t0) * 1000
+            if not callable(getattr(mod, "new_view", None)):
+                raise ImportError(f"{self.dotted} has no new_view()")
+            self.module = mod
+            print(f"[SolarEx][render] Imported renderer '{self.id}' in {self.import_ms:.0f} ms")
+        return self.module
+
+    def setting(self, core, key: str):
+        """Current value of ``key`` in this backend's namespace, defaulting to its manifest schema."""
+        default = next((item.get("default") for item in self.settings or () if item.get("key") == key), None)
+        return core.settings.get_ns(f"renderer.{self.id}", key, default)
+
+    def settings_schema(self, core) -> list:
+        if self.settings is not None: return self.settings
+        return getattr(self.load(), "get_settings_schema", lambda core: [])(core)
 
     def create_view(self, core, *args, **kwargs):
-        return self.module.new_view(core, *args, **kwargs)
+        return self.load().new_view(core, *args, **kwargs)
 
 class RenderManager:
     def __init__(self, core):
         self.core = core
         self.backends: Dict[str, BackendEntry] = {}
         self.active_id: Optional[str] = None
+        self.extractors = extractor_registry
         self._discover()
     def _discover(self):
+        """Register backends from their sidecar manifests; modules without one are imported to read ``metadata``."""
         import solarex.render.modules as mods
-        for m in pkgutil.iter_modules(mods.__path__):
-            try:
-                mod = importlib.import_module(f"solarex.render.modules.{m.name}")
-            except Exception as exc:
-                print(f"[SolarEx][render] Failed to import renderer module '{m.name}': {exc}")
-                continue
-            meta = getattr(mod, "metadata", None)
-            factory = getattr(mod, "new_view", None)
-            if not meta or not callable(factory):
-                continue
-            entry = BackendEntry(
-                id=meta.get("id", m.name),
-                name=meta.get("name", m.name),
-                desc=meta.get("description", ""),
-                module=mod,
-                settings_schema=getattr(mod, "get_settings_schema", lambda core: [])
-            )
+        t0 = time.perf_counter()
+        cache = getattr(self.core, "boot_cache", None)
+        found = cache.get("renderers") if cache else None
+        if found is None:
+            found, stamped = [], list(mods.__path__)
+            for m in pkgutil.iter_modules(mods.__path__):
+                manifest = Path(m.module_finder.path) / f"{m.name}.json"
+                if not manifest.exists():
+                    found.append((m.name, None)); continue
+                try:
+                    found.append((m.name, json.loads(manifest.read_text(encoding="utf-8"))))
+                    stamped.append(manifest)
+                except Exception as exc:
+                    print(f"[SolarEx][render] Bad renderer manifest '{manifest.name}': {exc}")
+            if cache: cache.put("renderers", stamped, found)
+        for name, meta in found:
+            dotted = f"solarex.render.modules.{name}"
+            if meta is not None:
+                entry = self._entry(name, dotted, meta)
+                entry.settings = meta.get("settings", [])
+            else:
+                entry = self._import_legacy(name, dotted)
+                if entry is None: continue
             self.backends[entry.id] = entry
+        print(f"[SolarEx][render] Found {len(self.backends)} renderer(s) in {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    @staticmethod
+    def _entry(name, dotted, meta) -> BackendEntry:
+        return BackendEntry(id=meta.get("id", name), name=meta.get("name", name), desc=meta.get("description", ""),
+                            dotted=dotted, version=meta.get("version", ""), prefetch=bool(meta.get("prefetch")))
+
+    def _import_legacy(self, name, dotted) -> Optional[BackendEntry]:
+        entry = self._entry(name, dotted, {})
+        try:
+            mod = entry.load()
+        except Exception as exc:
+            print(f"[SolarEx][render] Failed to import renderer module '{name}': {exc}")
+            return None
+        meta = getattr(mod, "metadata", None)
+        if not meta: return None
+        loaded = self._entry(name, dotted, meta)
+        loaded.module, loaded.import_ms = mod, entry.import_ms
+        return loaded
+
+    def import_times(self) -> Dict[str, Optional[float]]:
+        """ms spent importing each backend so far; None for backends never imported."""
+        return {bid: be.import_ms for bid, be in self.backends.items()}
 
     def _preferred(self, *candidates: str) -> Optional[BackendEntry]:
         for candidate in candidates:
@@ -48,14 +113,24 @@ class RenderManager:
             if entry:
                 return entry
         return next(iter(self.backends.values()), None)
+    def _usable(self, entry: BackendEntry) -> bool:
+        try:
+            entry.load()
+            return True
+        except Exception as exc:
+            print(f"[SolarEx][render] Failed to import renderer module '{entry.id}': {exc}")
+            return False
     def list_backends(self): return list(self.backends.values())
     def set_active(self, backend_id: str):
         entry = self.backends.get(backend_id)
+        if entry and not self._usable(entry):
+            entry = None
         if not entry:
-            entry = self._preferred("qtweb", "solarren")
+            entry = next((be for be in (self.backends.get(c) for c in dict.fromkeys(("qtweb", "solarren", *self.backends)))
+                          if be and be.id != backend_id and self._usable(be)), None)
             if not entry:
                 raise RuntimeError("No renderer backends are available")
-            print(f"[SolarEx][render] Unknown backend '{backend_id}', falling back to '{entry.id}'")
+            print(f"[SolarEx][render] Backend '{backend_id}' unavailable, falling back to '{entry.id}'")
         self.active_id = entry.id
         print(f"[SolarEx] Renderer set to '{self.active_id}'")
     def new_view(self, *a, **kw):
@@ -71,14 +146,37 @@ class RenderManager:
             raise RuntimeError(f"Renderer '{self.active_id}' is not registered")
 
         try:
-            return entry.create_view(self.core, *a, **kw)
+            return self._created(entry.create_view(self.core, *a, **kw))
         except Exception as exc:
             print(f"[SolarEx][render] Failed to create view for '{entry.id}': {exc}")
             fallback = self._preferred("solarren")
             if fallback and fallback.id != entry.id:
                 print(f"[SolarEx][render] Falling back to '{fallback.id}' renderer")
                 self.active_id = fallback.id
-                return fallback.create_view(self.core, *a, **kw)
+                return self._created(fallback.create_view(self.core, *a, **kw))
             raise
 
+    def _created(self, view):
+        """Wire a new view to the core: navigations feed ``core.emit_navigate`` (plugin ``onUrl:``
+        activation), loads feed the ``content_ready`` hook, then ``view_created`` hooks run."""
+        hooks = getattr(self.core, "hooks", None)
+        sig = getattr(view, "urlChanged", None) or getattr(view, "sourceChanged", None)
+        if sig is not None and hasattr(self.core, "emit_navigate"):
+            sig.connect(self.core.emit_navigate)
+        if hooks is not None:
+            if hasattr(view, "loadFinished"):
+                view.loadFinished.connect(lambda ok, v=view: hooks.run("content_ready", v, ok))
+            hooks.run("view_created", view)
+        return view
+
+    def before_navigate(self, view, url: str):
+        """Called by backends before loading ``url`` in ``view``. Returns None to go ahead, or the
+        ``url_intercept`` result (HTML to show instead, or True when a hook handled it)."""
+        hooks = getattr(self.core, "hooks", None)
+        if hooks is None: return None
+        result = hooks.first("url_intercept", view, url)
+        if result is None:
+            hooks.run("navigation_start", view, url)
+        return result
+
 def init(core): core.render = RenderManager(core)
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from solarex.render.bfcache import CachedPage, PageCache
+
+
+class RenderMemo:
+    """Memoized render output: an in-memory LRU plus an optional zlib-compressed disk tier."""
+
+    def __init__(self, budget_bytes: int, disk_dir: Optional[Path] = None, disk_max_files: int = 512):
+        self.mem = PageCache(budget_bytes)
+        self.disk_dir = None
+        self.disk_max_files = disk_max_files
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._writer: Optional[ThreadPoolExecutor] = None   # one thread, so disk writes queue up in order
+        self.set_disk_dir(disk_dir)
+
+    def set_disk_dir(self, disk_dir: Optional[Path]):
+        """Turn the disk tier on (at ``disk_dir``) or off; files already written stay for the next time."""
+        disk_dir = Path(disk_dir) if disk_dir else None
+        if disk_dir == self.disk_dir: return
+        if disk_dir:
+            try:
+                disk_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                print("[SolarRen] render memo disk tier unavailable:", exc)
+                disk_dir = None
+        self.disk_dir = disk_dir
+
+    @staticmethod
+    def key(*parts) -> str:
+        return hashlib.sha1("\x1f".join(str(p) for p in parts).encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        page = self.mem.get(key)
+        if page is None and self.disk_dir:
+            page = self._read(key)
+        if page is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return page
+
+    def _read(self, key: str) -> Optional[CachedPage]:
+        path = self.disk_dir / f"{key}.z"
+        try:
+            data = json.loads(zlib.decompress(path.read_bytes()))
+            os.utime(path)
+        except (OSError, ValueError, zlib.error):
+            return None
+        page = CachedPage(
+            data["html"], data["title"], data.get("favicon", ""), data.get("digest", ""),
+            data.get("image_loading", {}), data.get("deferred", []), data.get("stylesheets", []),
+        )
+        self.disk_hits += 1
+        self.mem.put(key, page)
+        return page
+
+    def put(self, key: str, page: CachedPage):
+        self.mem.put(key, page)
+        if self.disk_dir:
+            payload = {
+                "html": page.html, "title": page.title, "favicon": page.favicon,
+                "digest": page.digest, "image_loading": page.image_loading, "deferred": page.deferred,
+                "stylesheets": page.stylesheets,
+            }
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solarren-memo")
+            self._writer.submit(self._write, self.disk_dir, key, payload)
+
+    def _write(self, disk_dir: Path, key: str, payload: dict):
+        path = disk_dir / f"{key}.z"
+        tmp = path.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(zlib.compress(json.dumps(payload).encode("utf-8", "surrogatepass"), 6))
+            os.replace(tmp, path)
+            self._prune(disk_dir)
+        except OSError as exc:
+            print("[SolarRen] render memo write failed:", exc)
+
+    def _prune(self, disk_dir: Path):
+        files = list(disk_dir.glob("*.z"))
+        if len(files) <= self.disk_max_files: return
+        files.sort(key=lambda p: p.stat().st_mtime)
+        for old in files[:len(files) - self.disk_max_files]:
+            try: old.unlink()
+            except OSError: pass
+
+    def report(self) -> str:
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        return f"{self.hits}/{total} hits ({ratio:.0%}, {self.disk_hits} from disk)"
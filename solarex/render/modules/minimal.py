@@ -1,8 +1,20 @@
 from PyQt6 import QtWidgets, QtCore
-metadata = {"id":"minimal","name":"Minimal (no JS)","description":"QTextBrowser fallback","version":"1.1"}
-def get_settings_schema(core): return []
+from solarex.render.manager import read_manifest
+metadata = read_manifest(__file__)
 class MinView(QtWidgets.QTextBrowser):
+    loadStarted = QtCore.pyqtSignal()
+    loadFinished = QtCore.pyqtSignal(bool)
+    def __init__(self, core=None):
+        super().__init__(); self.core = core
     def load(self, url):
         if hasattr(url,"toString"): url = url.toString()
-        self.setSource(QtCore.QUrl(url))
-def new_view(core, *a, **kw): return MinView()
+        render = getattr(self.core, "render", None)
+        intercepted = render.before_navigate(self, url) if render else None
+        if intercepted is not None and not isinstance(intercepted, str): return
+        self.loadStarted.emit()
+        if intercepted is None:
+            self.setSource(QtCore.QUrl(url))   # synchronous; QTextBrowser only reads local files and resources
+        else:
+            self.setHtml(intercepted)
+        self.loadFinished.emit(not self.document().isEmpty())
+def new_view(core, *a, **kw): return MinView(core)
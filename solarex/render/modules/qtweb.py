@@ -1,18 +1,37 @@
-from PyQt6 import QtWebEngineWidgets, QtWebEngineCore
+from PyQt6 import QtCore, QtWebEngineWidgets, QtWebEngineCore
 
-metadata = {
-    "id": "qtweb",
-    "name": "QtWebEngine (full)",
-    "description": "Chromium-based WebEngine with JS/CSS",
-    "version": "1.2.1",
-}
+from solarex.render.manager import read_manifest
 
+metadata = read_manifest(__file__)
 
-def get_settings_schema(core):
-    return [
-        {"key": "cookies_enabled", "type": "checkbox", "label": "Enable persistent cookies", "default": True},
-        {"key": "http_cache", "type": "checkbox", "label": "Enable HTTP disk cache", "default": True},
-    ]
+# ✅ Compatibility: QWebEnginePage moved from QtWebEngineWidgets → QtWebEngineCore
+_PageBase = getattr(QtWebEngineCore, "QWebEnginePage", None) or QtWebEngineWidgets.QWebEnginePage
+
+
+class HookedPage(_PageBase):
+    """Runs the core's url_intercept / navigation_start hooks for main-frame navigations."""
+    def __init__(self, core, profile):
+        super().__init__(profile)
+        self.core = core
+        self.view_ref = None
+        self._serving = None   # URL whose intercepted HTML is being loaded through setHtml
+
+    def acceptNavigationRequest(self, url, nav_type, is_main_frame):
+        render = getattr(self.core, "render", None)
+        serving, self._serving = self._serving, None
+        if not is_main_frame or render is None or self.view_ref is None or url.scheme() == "data" or url == serving:
+            return super().acceptNavigationRequest(url, nav_type, is_main_frame)
+        intercepted = render.before_navigate(self.view_ref, url.toString())
+        if intercepted is None:
+            return super().acceptNavigationRequest(url, nav_type, is_main_frame)
+        if isinstance(intercepted, str):
+            # Not from inside the navigation request: setHtml starts a navigation of its own.
+            QtCore.QTimer.singleShot(0, lambda: self._serve(intercepted, url))
+        return False
+
+    def _serve(self, html, url):
+        self._serving = QtCore.QUrl(url)
+        self.setHtml(html, url)
 
 
 def new_view(core, *a, **kw):
@@ -42,12 +61,8 @@ def new_view(core, *a, **kw):
         else QtWebEngineCore.QWebEngineProfile.HttpCacheType.MemoryHttpCache
     )
 
-    # ✅ Compatibility: QWebEnginePage moved from QtWebEngineWidgets → QtWebEngineCore
-    try:
-        page = QtWebEngineCore.QWebEnginePage(profile)
-    except AttributeError:
-        page = QtWebEngineWidgets.QWebEnginePage(profile)
-
+    page = HookedPage(core, profile)
     view = QtWebEngineWidgets.QWebEngineView()
     view.setPage(page)
+    page.view_ref = view
     return view
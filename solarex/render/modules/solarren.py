@@ -1,21 +1,20 @@
 from PyQt6 import QtWidgets, QtCore, QtGui
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from html import escape
-import httpx, os, base64, urllib.parse, re, textwrap
-
-metadata = {
-    "id": "solarren",
-    "name": "SolarRen Ultra",
-    "description": "HTML parser with GET/POST forms, status bar, zoom/reload, favicon, async loader, DOM inspector",
-    "version": "4.2.0"
-}
-
-def get_settings_schema(core):
-    return [
-        {"key": "font_size", "type": "spin", "label": "Font size", "min": 8, "max": 48, "step": 1, "default": 14},
-        {"key": "wrap", "type": "checkbox", "label": "Word wrap", "default": True},
-        {"key": "dark", "type": "checkbox", "label": "Dark theme", "default": True},
-    ]
+import httpx, os, base64, fnmatch, functools, hashlib, time, urllib.parse, re, textwrap, weakref
+
+from solarex.render.bfcache import BFCache, CachedPage, NavigationHistory
+from solarex.render.css import StylesheetCache
+from solarex.render.budget import BudgetReport, RenderBudget, StageClock, observe_layout, parse_with_budget, split_blocks
+from solarex.render.distill import distill
+from solarex.render.docdiff import PatchStats, patch_document
+from solarex.render.extractors import ExtractContext, ExtractResult, SiteExtractor, registry as extractors
+from solarex.render.inspector import DomInspector, DomSnapshot
+from solarex.render.manager import read_manifest
+from solarex.render.memo import RenderMemo
+from solarex.net.httpx_backend import CONNECT_TIMEOUT
+
+metadata = read_manifest(__file__)   # id/name/version and the settings schema live in solarren.json
 
 # ---------------- helpers ----------------
 
@@ -38,6 +37,242 @@ def _parse_inline_css(style_str: str):
             out[k] = v
     return out
 
+def _reader_enabled(core, base_url: str) -> bool:
+    if core.settings.get_ns("renderer.solarren", "reader_mode", False): return True
+    sites = core.settings.get_ns("renderer.solarren", "reader_sites", "") or ""
+    host = (urllib.parse.urlparse(base_url).hostname or "").lower()
+    return bool(host) and any(fnmatch.fnmatch(host, pat.strip().lower()) for pat in sites.split(",") if pat.strip())
+
+def _continue_html(deferred) -> str:
+    if not deferred: return ""
+    return (f'<div class="solarren-continue"><a href="solarren://continue">'
+            f'Continue loading ({len(deferred)} more part{"s" if len(deferred) > 1 else ""})</a></div>')
+
+@functools.lru_cache(maxsize=None)
+def _theme_stylesheet(dark: bool) -> str:
+    """Theme CSS, built once per theme and set as each document's default stylesheet."""
+    bg = "#0f111a" if dark else "#f5f6fa"
+    fg = "#d5d9e2" if dark else "#1f2530"
+    accent = "#4fa3ff" if dark else "#0a59c9"
+    muted = "#5a6074" if dark else "#6f778b"
+    surface = "#161a2b" if dark else "#ffffff"
+    secondary_surface = "#1d2237" if dark else "#f0f3fb"
+    code_bg = "#0f1220" if dark else "#f1f3f8"
+    gradient_end = "#05060a" if dark else "#e4e7ef"
+
+    return textwrap.dedent(
+        f"""
+        :root {{ color-scheme: {'dark' if dark else 'light'}; }}
+        body {{
+            margin: 0;
+            padding: 32px;
+            background: radial-gradient(circle at top, {bg} 0%, {bg} 45%, {gradient_end} 100%);
+            color: {fg};
+            font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+            display: flex;
+            justify-content: center;
+        }}
+        a {{ color: {accent}; }}
+        a:hover {{ color: {accent}; text-decoration: underline; }}
+        .solarren-wrapper {{ width: 100%; max-width: 960px; }}
+        .solarren-toolbar {{
+            display: flex;
+            align-items: center;
+            gap: 12px;
+            padding: 12px 16px;
+            border-radius: 12px;
+            background: {surface};
+            border: 1px solid {muted};
+            box-shadow: 0 6px 18px rgba(0, 0, 0, 0.18);
+            margin-bottom: 20px;
+        }}
+        .solarren-location {{
+            flex: 1;
+            font-family: 'JetBrains Mono', 'Fira Code', monospace;
+            font-size: 12px;
+            display: flex;
+            gap: 4px;
+            overflow: hidden;
+            white-space: nowrap;
+            text-overflow: ellipsis;
+        }}
+        .solarren-location span {{ overflow: hidden; text-overflow: ellipsis; }}
+        .solarren-location-protocol {{ opacity: 0.6; }}
+        .solarren-location-host {{ font-weight: 600; }}
+        .solarren-location-path {{ opacity: 0.7; }}
+        .solarren-open {{
+            padding: 8px 14px;
+            border-radius: 8px;
+            border: 1px solid {accent};
+            text-decoration: none;
+            color: {accent};
+        }}
+        .solarren-open:hover {{ background: {accent}; color: {bg}; }}
+        .solarren-surface {{
+            background: {surface};
+            border-radius: 16px;
+            border: 1px solid {muted};
+            box-shadow: 0 12px 32px rgba(0, 0, 0, 0.25);
+            padding: 28px;
+        }}
+        .solarren-header h1 {{ margin: 0 0 6px 0; font-size: 22px; }}
+        .solarren-url {{ font-size: 12px; color: {muted}; }}
+        .solarren-content {{ margin-top: 20px; }}
+        .solarren-document {{
+            line-height: 1.65;
+            font-size: 14px;
+        }}
+        .solarren-document pre {{
+            background: {code_bg};
+            border-radius: 8px;
+            padding: 12px;
+            overflow-x: auto;
+        }}
+        .solarren-document img {{ max-width: 100%; height: auto; }}
+        .solarren-document table {{
+            width: 100%;
+            border-collapse: collapse;
+            margin: 10px 0;
+        }}
+        .solarren-document th,
+        .solarren-document td {{
+            border: 1px solid {muted};
+            padding: 6px 8px;
+        }}
+        .solarren-control {{
+            margin: 12px 0;
+            padding: 12px;
+            border-radius: 8px;
+            border: 1px dashed {muted};
+            font-family: 'JetBrains Mono', 'Fira Code', monospace;
+        }}
+        .solarren-budget {{
+            margin-bottom: 12px;
+            padding: 8px 12px;
+            border-radius: 8px;
+            border: 1px solid {accent};
+        }}
+        .solarren-continue {{
+            margin-top: 16px;
+            font-weight: 600;
+        }}
+        .solarren-google-search {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            gap: 12px;
+            padding: 12px 16px;
+            border-radius: 12px;
+            background: {secondary_surface};
+            margin-bottom: 20px;
+        }}
+        .solarren-google-query {{ font-family: 'JetBrains Mono', 'Fira Code', monospace; font-size: 13px; }}
+        .solarren-google-button {{
+            padding: 8px 16px;
+            border-radius: 8px;
+            border: 1px solid {accent};
+            text-decoration: none;
+            color: {accent};
+            font-weight: 600;
+        }}
+        .solarren-google-button:hover {{ background: {accent}; color: {bg}; }}
+        .solarren-google-results {{ display: flex; flex-direction: column; gap: 18px; }}
+        .solarren-result {{
+            padding: 16px;
+            border-radius: 12px;
+            background: {surface};
+            border: 1px solid {muted};
+            box-shadow: 0 4px 18px rgba(0, 0, 0, 0.18);
+        }}
+        .solarren-result-title {{ font-size: 18px; font-weight: 600; }}
+        .solarren-result-link {{ font-size: 12px; color: {muted}; margin-top: 4px; }}
+        .solarren-result-snippet {{ margin-top: 10px; line-height: 1.55; font-size: 13px; }}
+        .solarren-empty {{ font-style: italic; color: {muted}; }}
+        """
+    ).strip()
+
+_STYLE_KEYS = ("dark", "font_size", "wrap", "site_css")
+_VIEWS: "weakref.WeakSet[SolarRenView]" = weakref.WeakSet()
+_WATCHING = set()
+
+def _track_view(view):
+    """Register ``view`` for live restyling when the theme, font or wrap settings change."""
+    _VIEWS.add(view)
+    settings = view.core.settings
+    if id(settings) in _WATCHING: return
+    _WATCHING.add(id(settings))
+
+    def changed(ns, key, _value):
+        if ns != "renderer.solarren" or key not in _STYLE_KEYS: return
+        for v in list(_VIEWS):
+            try: v._style_timer.start()
+            except RuntimeError: _VIEWS.discard(v)   # Qt side already deleted
+    settings.on_change(changed)
+
+MAX_STYLESHEETS = 8
+
+def _stylesheet_links(soup, base_url: str) -> list:
+    """Absolute URLs of ``<link rel=stylesheet>`` sheets that apply on screen, in document order."""
+    urls = []
+    for link in soup.find_all("link", href=True):
+        rel = link.get("rel") or ()
+        if isinstance(rel, str): rel = rel.split()
+        if "stylesheet" not in (r.lower() for r in rel) or "alternate" in (r.lower() for r in rel): continue
+        media = (link.get("media") or "all").lower()
+        if "screen" not in media and "all" not in media: continue
+        url = _abs(base_url, link["href"])
+        if url.startswith(("http://", "https://")) and url not in urls: urls.append(url)
+    return urls[:MAX_STYLESHEETS]
+
+_STYLESHEETS: StylesheetCache | None = None
+
+def _stylesheet_cache() -> StylesheetCache:
+    """Reduced site stylesheets shared by every tab, keyed by URL."""
+    global _STYLESHEETS
+    if _STYLESHEETS is None: _STYLESHEETS = StylesheetCache(_css_pool())
+    return _STYLESHEETS
+
+def _fetch_css(backend, url: str) -> str:
+    if hasattr(backend, "fetch_stream"):
+        resp = backend.fetch_stream(url, max_bytes=2 * 1024 * 1024)
+        return resp.text if resp is not None and resp.status < 400 else ""
+    if hasattr(backend, "get_text"): return backend.get_text(url)
+    with httpx.Client(follow_redirects=True, timeout=20.0, headers={"User-Agent": DEFAULT_USER_AGENT}) as client:
+        r = client.get(url)
+        return r.text if r.status_code < 400 else ""
+
+def _digest(html: str) -> str:
+    return hashlib.sha1(html.encode("utf-8", "surrogatepass")).hexdigest()
+
+_BFCACHE: BFCache | None = None
+
+def _bfcache(core) -> BFCache:
+    """Shared back/forward cache; its budget follows the current setting."""
+    global _BFCACHE
+    budget = int(core.settings.get_ns("renderer.solarren", "bfcache_mb", 64)) * 1024 * 1024
+    if _BFCACHE is None: _BFCACHE = BFCache(budget)
+    elif _BFCACHE.budget != budget: _BFCACHE.set_budget(budget)
+    return _BFCACHE
+
+_RENDER_MEMO: RenderMemo | None = None
+
+def _render_memo(core) -> RenderMemo:
+    """Shared render memo; the disk tier lives in the profile and is never used in incognito.
+
+    Settings are re-read on every call, so toggling the disk tier or the budget applies to the next page.
+    """
+    global _RENDER_MEMO
+    budget = int(core.settings.get_ns("renderer.solarren", "render_memo_mb", 32)) * 1024 * 1024
+    disk = None
+    if core.settings.get_ns("renderer.solarren", "render_memo_disk", False) and not core.profile.incognito:
+        disk = os.path.join(core.profile.cache_path, "solarren-memo")
+    if _RENDER_MEMO is None:
+        _RENDER_MEMO = RenderMemo(budget, disk)
+    else:
+        if _RENDER_MEMO.mem.budget != budget: _RENDER_MEMO.mem.set_budget(budget)
+        _RENDER_MEMO.set_disk_dir(disk)
+    return _RENDER_MEMO
+
 def _inject_supported_styles(tag, style_dict):
     existing = tag.get("style", "")
     if "background" in style_dict and "background-color" not in style_dict:
@@ -54,45 +289,183 @@ def _inject_supported_styles(tag, style_dict):
 DEFAULT_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) SolarEx/4.2"
 
 
-class FetchWorker(QtCore.QThread):
-    chunk = QtCore.pyqtSignal(int)          # percent
-    done  = QtCore.pyqtSignal(str, str)     # html, url
-    error = QtCore.pyqtSignal(str)
-
-    def __init__(self, url, backend, timeout=20.0, user_agent: str | None = None):
-        super().__init__()
-        self.url = url
-        self.backend = backend
-        self.timeout = timeout
-        self.user_agent = user_agent or DEFAULT_USER_AGENT
-
-    def run(self):
-        try:
-            # Prefer SolarEx backend (cookies/UA)
-            if hasattr(self.backend, "get_text"):
-                html = self.backend.get_text(self.url)
-                self.done.emit(html, self.url); return
-            if hasattr(self.backend, "fetch"):
-                resp = self.backend.fetch(self.url)
-                html = getattr(resp, "text", None) or resp.content.decode("utf-8", "ignore")
-                self.done.emit(html, self.url); return
-
-            client = httpx.Client(
+NO_DOM_MESSAGE = "No DOM for this page (restored from cache); reload to inspect"
+VIEWPORT_BUCKET = 100   # CSS px; srcset choice granularity for the render memo key
+_SRCSET_RE = re.compile(r"(\S+?)(?:\s+(\d+(?:\.\d+)?)([wx]))?\s*(?:,\s*|$)")
+_SIZES_COND_RE = re.compile(r"\(\s*(min|max)-width\s*:\s*([\d.]+)px\s*\)")
+_LENGTH_RE = re.compile(r"([\d.]+)(px|vw)\s*$")
+
+def _sizes_width(sizes: str, viewport_css: float) -> float:
+    """Evaluate the simple (min|max)-width/px/vw subset of an img ``sizes`` list."""
+    for entry in (sizes or "").split(","):
+        entry = entry.strip()
+        if not entry: continue
+        ok = True
+        for kind, px in _SIZES_COND_RE.findall(entry):
+            ok &= viewport_css >= float(px) if kind == "min" else viewport_css <= float(px)
+        m = _LENGTH_RE.search(entry)
+        if ok and m:
+            value, unit = float(m.group(1)), m.group(2)
+            return value if unit == "px" else viewport_css * value / 100
+    return viewport_css
+
+def _pick_image_source(img, viewport_css: float, dpr: float) -> str:
+    """Smallest srcset candidate that still covers the rendered width; falls back to ``src``."""
+    srcset = img.get("srcset") or ""
+    cands = [(u, float(v or 1), unit or "x") for u, v, unit in _SRCSET_RE.findall(srcset.strip())]
+    if not cands: return img.get("src") or ""
+    widths = [(v, u) for u, v, unit in cands if unit == "w"]
+    if widths:
+        need = _sizes_width(img.get("sizes", ""), viewport_css) * dpr
+        bigger = [c for c in widths if c[0] >= need]
+        return (min(bigger) if bigger else max(widths))[1]
+    dens = [(v, u) for u, v, unit in cands]
+    bigger = [c for c in dens if c[0] >= dpr]
+    return (min(bigger) if bigger else max(dens))[1]
+
+_FETCH_POOL: ThreadPoolExecutor | None = None
+_IMAGE_POOL: ThreadPoolExecutor | None = None
+_CSS_POOL: ThreadPoolExecutor | None = None
+
+def _image_pool() -> ThreadPoolExecutor:
+    global _IMAGE_POOL
+    if _IMAGE_POOL is None:
+        _IMAGE_POOL = ThreadPoolExecutor(max_workers=6, thread_name_prefix="solarren-img")
+    return _IMAGE_POOL
+
+def _css_pool() -> ThreadPoolExecutor:
+    """Stylesheet loads are shared between tabs and never cancelled, so they stay off the navigation pool."""
+    global _CSS_POOL
+    if _CSS_POOL is None:
+        _CSS_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="solarren-css")
+    return _CSS_POOL
+
+def _fetch_pool() -> ThreadPoolExecutor:
+    """Small pool shared by every view; superseded fetches give their thread back at the next chunk."""
+    global _FETCH_POOL
+    if _FETCH_POOL is None:
+        _FETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="solarren-fetch")
+    return _FETCH_POOL
+
+
+class CancelToken:
+    """Cooperative cancel flag; calling it also reports cancellation of the parent token."""
+    __slots__ = ("cancelled", "parent")
+    def __init__(self, parent: "CancelToken | None" = None):
+        self.cancelled = False
+        self.parent = parent
+    def cancel(self): self.cancelled = True
+    def __call__(self): return self.cancelled or bool(self.parent and self.parent())
+
+
+class _Navigation:
+    """Current navigation of one view. Results carrying any other id are stale and dropped."""
+    __slots__ = ("id", "token", "on_done")
+
+    def __init__(self):
+        self.id = 0
+        self.token: CancelToken | None = None
+        self.on_done = None
+
+    def start(self, on_done):
+        self.cancel()
+        self.token = CancelToken()
+        self.on_done = on_done
+        return self.id, self.token
+
+    def cancel(self):
+        if self.token: self.token.cancel()
+        self.id += 1
+        self.token = None
+        self.on_done = None
+
+
+class FetchSignals(QtCore.QObject):
+    chunk = QtCore.pyqtSignal(int, int)       # nav id, percent
+    done  = QtCore.pyqtSignal(int, str, str, bool)  # nav id, html, url, truncated
+    error = QtCore.pyqtSignal(int, str)       # nav id, message
+
+
+def _fetch_job(nav_id, url, backend, token: CancelToken, signals: FetchSignals,
+               timeout=20.0, user_agent: str | None = None, max_bytes: int | None = None):
+    """Runs on the fetch pool. Checks ``token`` between chunks and closes the stream once cancelled."""
+    def progress(p):
+        if not token(): _emit_safely(signals.chunk, nav_id, p)
+    try:
+        # Prefer SolarEx backend (cookies/UA)
+        truncated = False
+        if hasattr(backend, "fetch_stream"):
+            resp = backend.fetch_stream(url, cancelled=token, progress=progress, max_bytes=max_bytes)
+            html = resp.text if resp is not None else None
+            truncated = bool(resp and resp.truncated)
+        elif hasattr(backend, "get_text"):
+            html = backend.get_text(url)
+        elif hasattr(backend, "fetch"):
+            resp = backend.fetch(url)
+            html = getattr(resp, "text", None) or resp.content.decode("utf-8", "ignore")
+        else:
+            with httpx.Client(
                 follow_redirects=True,
-                timeout=self.timeout,
-                headers={"User-Agent": self.user_agent},
-            )
-            r = client.stream("GET", self.url)
-            total = int(r.headers.get("content-length") or 0)
-            buf = bytearray()
-            with r as resp:
+                timeout=httpx.Timeout(timeout, connect=min(timeout, CONNECT_TIMEOUT)),
+                headers={"User-Agent": user_agent or DEFAULT_USER_AGENT},
+            ) as client, client.stream("GET", url) as resp:
+                total = int(resp.headers.get("content-length") or 0)
+                buf = bytearray()
                 for b in resp.iter_bytes():
+                    if token(): return
                     buf.extend(b)
-                    if total:
-                        self.chunk.emit(min(99, int(len(buf)*100/total)))
-            self.done.emit(buf.decode("utf-8", "ignore"), self.url)
-        except Exception as e:
-            self.error.emit(str(e))
+                    if max_bytes and len(buf) >= max_bytes:
+                        truncated = True; break
+                    if total: progress(min(99, int(len(buf)*100/total)))
+            html = buf.decode("utf-8", "ignore")
+        if html is not None and not token():
+            _emit_safely(signals.done, nav_id, html, url, truncated)
+    except Exception as e:
+        if not token(): _emit_safely(signals.error, nav_id, str(e) or type(e).__name__)
+
+def _emit_safely(signal, *args):
+    try: signal.emit(*args)
+    except RuntimeError: pass   # receiver already deleted
+
+def _image_job(gen, url, path, client, token: CancelToken, signals: "ImageSignals"):
+    """Runs on the image pool: fill the disk cache if needed and decode off the GUI thread."""
+    if token(): return
+    image = QtGui.QImage()
+    try:
+        if not os.path.exists(path):
+            r = client.get(url)
+            r.raise_for_status()
+            with open(path, "wb") as f: f.write(r.content)
+        if token(): return
+        image.load(path)
+    except Exception as e:
+        print("[SolarRen] image fetch failed:", e)
+    try:
+        if not token(): signals.ready.emit(gen, url, image)
+    except RuntimeError:
+        pass
+
+
+class StylesheetSignals(QtCore.QObject):
+    ready = QtCore.pyqtSignal(str)   # stylesheet url
+
+
+class ImageSignals(QtCore.QObject):
+    ready = QtCore.pyqtSignal(int, str, object)   # page generation, url, QImage
+
+
+class SolarRenCanvas(QtWidgets.QTextBrowser):
+    """QTextBrowser that never fetches remote images itself; they are fed in by the view."""
+
+    def __init__(self):
+        super().__init__()
+        self._placeholder = QtGui.QImage(1, 1, QtGui.QImage.Format.Format_ARGB32)
+        self._placeholder.fill(QtCore.Qt.GlobalColor.transparent)
+
+    def loadResource(self, rtype, url):
+        if rtype == QtGui.QTextDocument.ResourceType.ImageResource.value and url.scheme() in ("http", "https"):
+            return self._placeholder
+        return super().loadResource(rtype, url)
 
 # ---------------- main view ----------------
 
@@ -111,6 +484,11 @@ class HoverEventFilter(QtCore.QObject):
         return super().eventFilter(obj, event)
 
 class SolarRenView(QtWidgets.QScrollArea):
+    # Same shape as QWebEngineView's, so tab UIs and benchmarks can treat backends alike.
+    loadStarted = QtCore.pyqtSignal()
+    loadFinished = QtCore.pyqtSignal(bool)
+    urlChanged = QtCore.pyqtSignal(QtCore.QUrl)
+
     def __init__(self, core):
         super().__init__()
         self.core = core
@@ -118,24 +496,23 @@ class SolarRenView(QtWidgets.QScrollArea):
 
         self.user_agent = getattr(getattr(core, "args", None), "ua", None) or DEFAULT_USER_AGENT
 
-        self.canvas = QtWidgets.QTextBrowser()
+        self.canvas = SolarRenCanvas()
         self.setWidget(self.canvas)
 
+        make_transport = getattr(getattr(core, "net", None), "make_transport", None)
         self.client = httpx.Client(
             follow_redirects=True,
             timeout=20.0,
             headers={"User-Agent": self.user_agent},
+            transport=make_transport() if make_transport else None,
         )
         self.cache_dir = os.path.join(core.profile.storage_path, "cache", "images")
         os.makedirs(self.cache_dir, exist_ok=True)
 
-        fs = core.settings.get_ns("renderer.solarren", "font_size", 14)
-        font = self.canvas.font(); font.setPointSize(fs); self.canvas.setFont(font)
-        wrap = core.settings.get_ns("renderer.solarren", "wrap", True)
-        self.canvas.setLineWrapMode(
-            QtWidgets.QTextEdit.LineWrapMode.WidgetWidth if wrap
-            else QtWidgets.QTextEdit.LineWrapMode.NoWrap
-        )
+        self._zoom_steps = 0
+        self._page: CachedPage | None = None   # page on the canvas, kept for restyling
+        self._apply_font()
+        self._apply_wrap()
 
         # Events
         self.canvas.anchorClicked.connect(self._on_link_clicked)
@@ -144,17 +521,63 @@ class SolarRenView(QtWidgets.QScrollArea):
 
         # Shortcuts
         QtGui.QShortcut(QtGui.QKeySequence("Ctrl+R"), self.canvas, activated=self.reload)
+        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+R"), self.canvas, activated=self._prompt_auto_refresh)
         QtGui.QShortcut(QtGui.QKeySequence("Ctrl+="), self.canvas, activated=lambda: self._zoom(1))
         QtGui.QShortcut(QtGui.QKeySequence("Ctrl++"), self.canvas, activated=lambda: self._zoom(1))
         QtGui.QShortcut(QtGui.QKeySequence("Ctrl+-"), self.canvas, activated=lambda: self._zoom(-1))
         QtGui.QShortcut(QtGui.QKeySequence("Ctrl+0"), self.canvas, activated=self._zoom_reset)
         QtGui.QShortcut(QtGui.QKeySequence("F12"),    self.canvas, activated=self._toggle_dom_inspector)
+        QtGui.QShortcut(QtGui.QKeySequence("Alt+Left"),  self.canvas, activated=self.back)
+        QtGui.QShortcut(QtGui.QKeySequence("Alt+Right"), self.canvas, activated=self.forward)
 
         self._dom_dock = None
         self._dom_tree = None
-        self._last_zoom_delta = 0
-        self._last_soup = None
+        self._dom_snapshot = None   # compact copy for the inspector; the soup itself is never kept
+        self._last_html = None
+        self.stages: dict = {}      # ms per pipeline stage of the last transform (StageClock laps)
         self.current_url = "about:blank"
+        self._favicon_path = ""
+        self._deferred: list = []
+        self._shown = None          # (url, digest) of the document on the canvas, for in-place reloads
+        self._nav = _Navigation()
+        self._loading = False       # a load() / reload() / history fetch is in flight
+        self._prefetched = None     # (digest, soup, BudgetReport) parsed off-thread by a startup prefetch
+        self._fetch_signals = FetchSignals(self)
+        self._fetch_signals.chunk.connect(self._on_fetch_chunk)
+        self._fetch_signals.done.connect(self._on_fetch_done)
+        self._fetch_signals.error.connect(self._on_fetch_error)
+
+        # Viewport-driven image loading
+        self._page_gen = 0
+        self._alive = CancelToken()
+        self._image_token = CancelToken(self._alive)
+        self._image_loading: dict = {}
+        self._image_requested: dict = {}   # url -> fragment positions
+        self._image_signals = ImageSignals(self)
+        self._image_signals.ready.connect(self._on_image_ready)
+        self._css_signals = StylesheetSignals(self)
+        # Queued even when the sheet is already loaded, so a restyle never re-enters _present.
+        self._css_signals.ready.connect(self._on_stylesheet_ready, QtCore.Qt.ConnectionType.QueuedConnection)
+        self._css_waiting: set = set()
+        self._image_timer = QtCore.QTimer(self); self._image_timer.setSingleShot(True); self._image_timer.setInterval(60)
+        self._image_timer.timeout.connect(self._load_visible_images)
+        self.canvas.verticalScrollBar().valueChanged.connect(lambda _v: self._image_timer.start())
+        self.canvas.document().documentLayout().documentSizeChanged.connect(lambda _s: self._image_timer.start())
+        self.history = NavigationHistory()
+        history = self.history
+        self.destroyed.connect(lambda *_: _bfcache(core).discard(*history.keys()))
+        self.destroyed.connect(lambda *_, nav=self._nav: nav.cancel())
+        self.destroyed.connect(lambda *_, tok=self._alive: tok.cancel())
+
+        self.refresh_interval = 0
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.timeout.connect(self._auto_refresh)
+        self.set_auto_refresh(core.settings.get_ns("renderer.solarren", "auto_refresh_s", 0))
+
+        # Settings changes arrive one key at a time; restyle once per batch.
+        self._style_timer = QtCore.QTimer(self); self._style_timer.setSingleShot(True); self._style_timer.setInterval(0)
+        self._style_timer.timeout.connect(self.apply_style_settings)
+        _track_view(self)
 
     # ---- status bar ----
     def _show_status(self, text: str):
@@ -163,6 +586,7 @@ class SolarRenView(QtWidgets.QScrollArea):
 
     # ---- favicon ----
     def _set_favicon(self, base_url, soup):
+        self._favicon_path = ""
         try:
             link = soup.find("link", rel=re.compile("icon", re.I))
             href = link.get("href") if link else None
@@ -173,29 +597,93 @@ class SolarRenView(QtWidgets.QScrollArea):
             if not os.path.exists(path):
                 data = self.client.get(absu).content
                 with open(path, "wb") as f: f.write(data)
-            pix = QtGui.QPixmap(path)
-            if not pix.isNull():
-                icon = QtGui.QIcon(pix)
-                win = self.window()
-                if isinstance(win, QtWidgets.QMainWindow): win.setWindowIcon(icon)
+            self._apply_favicon(path)
         except Exception:
             pass
 
+    def _apply_favicon(self, path):
+        self._favicon_path = path or ""
+        if not path: return
+        pix = QtGui.QPixmap(path)
+        if not pix.isNull():
+            icon = QtGui.QIcon(pix)
+            win = self.window()
+            if isinstance(win, QtWidgets.QMainWindow): win.setWindowIcon(icon)
+
     # ---- images ----
-    def _image_local(self, abs_url):
-        try:
-            if not abs_url: return ""
-            if abs_url.startswith("data:image/"): return abs_url
-            name = base64.urlsafe_b64encode(abs_url.encode()).decode()[:48] + ".img"
-            path = os.path.join(self.cache_dir, name)
-            if not os.path.exists(path):
-                r = self.client.get(abs_url)
-                r.raise_for_status()
-                with open(path, "wb") as f: f.write(r.content)
-            return "file://" + path if os.path.getsize(path) else ""
-        except Exception as e:
-            print("[SolarRen] image fetch failed:", e)
-            return ""
+    def _image_path(self, abs_url):
+        name = base64.urlsafe_b64encode(abs_url.encode()).decode()[:48] + ".img"
+        return os.path.join(self.cache_dir, name)
+
+    def _image_viewport(self):
+        """(CSS width, device pixel ratio) used to pick srcset candidates; part of the render memo key.
+
+        The width is bucketed so a few pixels of resize still reuse the memoized page.
+        """
+        width = self.canvas.viewport().width()
+        return max(VIEWPORT_BUCKET, width - width % VIEWPORT_BUCKET), round(self.devicePixelRatioF() or 1.0, 2)
+
+    def _reset_images(self, image_loading):
+        self._image_token.cancel()
+        self._image_token = CancelToken(self._alive)
+        self._page_gen += 1
+        self._image_loading = dict(image_loading or {})   # the page may be shared with the memo and bfcache
+        self._image_requested = {}
+        self._image_timer.start()
+
+    def _load_visible_images(self):
+        """Request images whose blocks sit inside the viewport plus the lookahead margin."""
+        doc = self.canvas.document()
+        layout = doc.documentLayout()
+        top = self.canvas.verticalScrollBar().value()
+        height = self.canvas.viewport().height()
+        ahead = height * int(self.core.settings.get_ns("renderer.solarren", "image_lookahead", 2))
+        margins = {"eager": None, "lazy": height // 2}
+        widest = max(ahead, height // 2)
+        pos = layout.hitTest(QtCore.QPointF(0, max(0, top - widest)), QtCore.Qt.HitTestAccuracy.FuzzyHit)
+        block = doc.findBlock(max(0, pos))
+        eager = {u for u, mode in self._image_loading.items() if mode == "eager" and u not in self._image_requested}
+        while block.isValid():
+            rect = layout.blockBoundingRect(block)
+            if rect.top() > top + height + widest and not eager: break
+            it = block.begin()
+            while not it.atEnd():
+                frag = it.fragment()
+                fmt = frag.charFormat()
+                if fmt.isImageFormat():
+                    url = fmt.toImageFormat().name()
+                    margin = margins.get(self._image_loading.get(url), ahead)
+                    near = margin is None or (rect.bottom() >= top - margin and rect.top() <= top + height + margin)
+                    if near and url.startswith(("http://", "https://")):
+                        self._request_image(url, frag.position())
+                        eager.discard(url)
+                it += 1
+            block = block.next()
+        if not block.isValid():
+            # Eager images that are not in the document any more: stop scanning for them.
+            for url in eager: self._image_loading.pop(url, None)
+
+    def _request_image(self, url, position):
+        positions = self._image_requested.get(url)
+        if positions is not None:
+            positions.add(position); return
+        self._image_requested[url] = {position}
+        _image_pool().submit(
+            _image_job, self._page_gen, url, self._image_path(url), self.client, self._image_token, self._image_signals
+        )
+
+    def _rescan_images(self, image_loading):
+        """After an in-place patch the recorded image positions are stale; the next scan records them again."""
+        self._image_loading = dict(image_loading or {})
+        for positions in self._image_requested.values(): positions.clear()
+        self._image_timer.start()
+
+    def _on_image_ready(self, gen, url, image):
+        if gen != self._page_gen or image.isNull(): return
+        doc = self.canvas.document()
+        doc.addResource(QtGui.QTextDocument.ResourceType.ImageResource.value, QtCore.QUrl(url), image)
+        for position in self._image_requested.get(url, ()):
+            doc.markContentsDirty(position, 1)
 
     # ---- forms ----
     def _rewrite_forms(self, soup, base_url):
@@ -240,9 +728,12 @@ class SolarRenView(QtWidgets.QScrollArea):
                 joiner = "&" if urllib.parse.urlparse(action).query else "?"
                 self.load(action + (joiner + q if q else ""))
             else:
+                self._nav.cancel()
                 r = self.client.post(action, data=data, headers={"Content-Type": "application/x-www-form-urlencoded"})
+                self._push_history(action)
                 self._render(action, r.text)
         except Exception as e:
+            self._shown = None
             self.canvas.setPlainText(f"[SolarRen] form error: {e}")
 
     # ---- DOM inspector ----
@@ -253,38 +744,247 @@ class SolarRenView(QtWidgets.QScrollArea):
             self._dom_dock.hide(); return
         if not self._dom_dock:
             self._dom_dock = QtWidgets.QDockWidget("DOM Inspector", win)
-            self._dom_tree = QtWidgets.QTreeWidget()
-            self._dom_tree.setHeaderLabels(["Node", "Attrs"])
+            self._dom_tree = DomInspector()
             self._dom_dock.setWidget(self._dom_tree)
             win.addDockWidget(QtCore.Qt.DockWidgetArea.RightDockWidgetArea, self._dom_dock)
         self._dom_dock.show()
-        if self._last_soup: self._populate_dom_tree(self._last_soup)
-
-    def _populate_dom_tree(self, soup):
-        self._dom_tree.clear()
-        def add_node(parent, tag):
-            if isinstance(tag, str):
-                if tag.strip(): QtWidgets.QTreeWidgetItem(parent, ["#text", tag.strip()[:80]]); return
-            label = getattr(tag, "name", "#")
-            attrs = " ".join([f'{k}="{v}"' for k,v in getattr(tag, "attrs", {}).items()])
-            item = QtWidgets.QTreeWidgetItem(parent, [label, attrs])
-            for ch in getattr(tag, "children", []): add_node(item, ch)
-        root = self._dom_tree.invisibleRootItem()
-        add_node(root, (soup.body or soup))
-        self._dom_tree.expandToDepth(2)
-
-    # ---- zoom/reload ----
+        self._update_dom_snapshot()
+
+    def _populate_dom_tree(self, source):
+        # The model only builds rows as branches are expanded; search is indexed off-thread.
+        self._dom_tree.set_source(source)
+
+    def _inspecting(self) -> bool:
+        return self._dom_dock is not None and self._dom_dock.isVisible()
+
+    def _update_dom_snapshot(self):
+        """Show the page's DOM if the inspector is open, otherwise drop it until F12 re-parses.
+
+        The snapshot is always of the page as parsed, before SolarRen's rewrites: _transform
+        takes it straight after parsing, and otherwise ``_last_html`` is parsed again here.
+        """
+        if not self._inspecting():
+            self._dom_snapshot = None; return
+        if self._dom_snapshot is None and self._last_html:
+            soup = parse_with_budget(self._last_html, RenderBudget.from_settings(self.core), BudgetReport())
+            self._dom_snapshot = DomSnapshot.from_soup(soup)
+        if self._dom_snapshot is not None:
+            self._populate_dom_tree(self._dom_snapshot)
+        else:
+            # e.g. restored from the bfcache, which keeps only the rendered page, not its source
+            self._dom_tree.clear(NO_DOM_MESSAGE)
+
+    # ---- style / zoom/reload ----
+    def _apply_font(self):
+        """Set the canvas font straight to font_size + zoom steps: a single relayout."""
+        size = max(1, int(self.core.settings.get_ns("renderer.solarren", "font_size", 14)) + self._zoom_steps)
+        font = self.canvas.font()
+        if font.pointSize() == size: return
+        font.setPointSize(size); self.canvas.setFont(font)
+
+    def _apply_wrap(self):
+        wrap = self.core.settings.get_ns("renderer.solarren", "wrap", True)
+        self.canvas.setLineWrapMode(
+            QtWidgets.QTextEdit.LineWrapMode.WidgetWidth if wrap
+            else QtWidgets.QTextEdit.LineWrapMode.NoWrap
+        )
+
+    def apply_style_settings(self):
+        """Apply the current theme, font and wrap settings to the page on screen.
+
+        Rendered pages carry no theme, so a theme change swaps the document's
+        default stylesheet and re-imports the already-transformed HTML: no
+        refetch, no BeautifulSoup pass, one layout.
+        """
+        self._apply_font()
+        self._apply_wrap()
+        self._restyle()
+
+    def _document_css(self, page: CachedPage | None) -> str:
+        """Loaded site stylesheets followed by the theme, so the theme wins ties on SolarRen's own chrome."""
+        theme = _theme_stylesheet(bool(self.core.settings.get_ns("renderer.solarren", "dark", True)))
+        if page is None or not page.stylesheets or not self.core.settings.get_ns("renderer.solarren", "site_css", True):
+            return theme
+        cache = _stylesheet_cache()
+        backend = getattr(self.core, "net", None) or self.core.require("net")
+        sheets = []
+        for url in page.stylesheets:
+            fut = cache.get(url, lambda u, b=backend: _fetch_css(b, u))
+            if fut.done():
+                sheets.append(fut.result().css)
+            elif url not in self._css_waiting:
+                self._css_waiting.add(url)
+                fut.add_done_callback(lambda _f, u=url, sig=self._css_signals: _emit_safely(sig.ready, u))
+        return "\n".join(sheets + [theme])
+
+    def _on_stylesheet_ready(self, url):
+        self._css_waiting.discard(url)
+        if self._page is None or url not in self._page.stylesheets: return
+        # One restyle when the page's last pending sheet is in, not one per sheet.
+        if not self._css_waiting.intersection(self._page.stylesheets): self._style_timer.start()
+
+    def _restyle(self):
+        """Re-import the shown page if its stylesheet changed.
+
+        Keeps the scroll position, the parts already continued and the images already
+        loaded (document resources survive setHtml; only their positions are rescanned).
+        """
+        css = self._document_css(self._page)
+        doc = self.canvas.document()
+        if doc.defaultStyleSheet() == css: return
+        if self._page is None or self._shown is None:
+            doc.setDefaultStyleSheet(css); return
+        sb = self.canvas.verticalScrollBar()
+        ratio = sb.value() / sb.maximum() if sb.maximum() else 0.0
+        page, html = self._page, self._page.html
+        shown = page.deferred[:len(page.deferred) - len(self._deferred)]
+        if shown:
+            head, sep, tail = html.rpartition(_continue_html(page.deferred))
+            if sep:
+                parts = "".join(f'<div class="solarren-document">{chunk}</div>' for chunk in shown)
+                html = f"{head}{parts}{_continue_html(self._deferred)}{tail}"
+        doc.setDefaultStyleSheet(css)
+        t0 = time.perf_counter()
+        self.canvas.setHtml(html)
+        self._check_layout(html, t0)
+        self._rescan_images(page.image_loading)
+        QtCore.QTimer.singleShot(0, lambda: sb.setValue(round(ratio * sb.maximum())))
+
     def _zoom(self, delta):
-        if delta > 0: self.canvas.zoomIn(1)
-        else: self.canvas.zoomOut(1)
-        self._last_zoom_delta += delta
+        self._zoom_steps += delta
+        self._apply_font()
     def _zoom_reset(self):
-        if self._last_zoom_delta > 0:
-            for _ in range(self._last_zoom_delta): self.canvas.zoomOut(1)
-        elif self._last_zoom_delta < 0:
-            for _ in range(-self._last_zoom_delta): self.canvas.zoomIn(1)
-        self._last_zoom_delta = 0
-    def reload(self): self.load(self.current_url)
+        self._zoom_steps = 0
+        self._apply_font()
+    def reload(self): self._fetch(self.current_url, keep_document=True)
+
+    # ---- auto refresh ----
+    def set_auto_refresh(self, seconds: int):
+        """Reload this tab every ``seconds``; 0 turns it off."""
+        self.refresh_interval = max(0, int(seconds or 0))
+        if self.refresh_interval: self._refresh_timer.start(self.refresh_interval * 1000)
+        else: self._refresh_timer.stop()
+
+    def _auto_refresh(self):
+        # Skip a beat rather than queueing reloads behind a slow server.
+        if self._nav.on_done is not None or self.current_url == "about:blank": return
+        self.reload()
+
+    def _prompt_auto_refresh(self):
+        seconds, ok = QtWidgets.QInputDialog.getInt(
+            self, "Auto refresh", "Reload this tab every (seconds, 0 = off):", self.refresh_interval, 0, 86400
+        )
+        if not ok: return
+        self.set_auto_refresh(seconds)
+        self._show_status(f"Auto refresh every {seconds} s" if seconds else "Auto refresh off")
+
+    # ---- history / bfcache ----
+    def _remember_scroll(self):
+        entry = self.history.current
+        if entry: entry.scroll = self.canvas.verticalScrollBar().value()
+
+    def _restore_scroll(self, value: int):
+        # Let the document lay out first so the scrollbar range covers the old position.
+        sb = self.canvas.verticalScrollBar()
+        QtCore.QTimer.singleShot(0, lambda: sb.setValue(value))
+
+    def _push_history(self, url: str):
+        self._remember_scroll()
+        _entry, dropped = self.history.push(url)
+        _bfcache(self.core).discard(*dropped)
+        self.current_url = url
+
+    def back(self): self._go(-1)
+    def forward(self): self._go(1)
+
+    def _go(self, step: int):
+        if not self.history.can_go(step): return
+        self._remember_scroll()
+        entry = self.history.go(step)
+        self.current_url = entry.url
+        self.urlChanged.emit(QtCore.QUrl(entry.url))
+        page = _bfcache(self.core).get(entry.key)
+        if page is None:
+            self._fetch(entry.url); return
+        self._nav.cancel()
+        self._loading = False
+        self.loadStarted.emit()
+        self._present(entry.url, page)
+        self._set_title(page.title)
+        self._apply_favicon(page.favicon)
+        self._dom_snapshot = None; self._last_html = None
+        self._update_dom_snapshot()
+        self._restore_scroll(entry.scroll)
+        self._show_status("Restored from back/forward cache")
+        self.loadFinished.emit(True)
+        if self.core.settings.get_ns("renderer.solarren", "bfcache_revalidate", False):
+            self._revalidate(entry, page)
+
+    def _revalidate(self, entry, page):
+        def done(html, u, truncated):
+            if self.history.current is not entry: return
+            if _digest(html) == page.digest:
+                self._show_status("Cached page is up to date"); return
+            self._remember_scroll()
+            self._render(u, html, truncated)
+        self._start_navigation(entry.url, done)
+
+    def _present(self, base_url, page: CachedPage):
+        doc = self.canvas.document()
+        doc.setDefaultStyleSheet(self._document_css(page))
+        t0 = time.perf_counter()
+        self.canvas.setHtml(page.html)
+        self._check_layout(page.html, t0)
+        doc.setBaseUrl(QtCore.QUrl(base_url))
+        self._shown = (base_url, page.digest)
+        self._page = page
+        self._deferred = list(page.deferred)
+        self._reset_images(page.image_loading)
+
+    def _patch(self, base_url, page: CachedPage):
+        """Bring the shown document up to ``page`` in place if it is a newer version of the same URL."""
+        if self._shown is None or self._shown[0] != base_url or page.deferred or self._deferred: return None
+        if not self.core.settings.get_ns("renderer.solarren", "diff_update", True): return None
+        if page.digest and self._shown[1] == page.digest:
+            return PatchStats(self.canvas.document().blockCount(), 0, 0.0)
+        stats = patch_document(self.canvas.document(), page.html)
+        if stats is None: return None
+        self._shown = (base_url, page.digest)
+        self._page = page
+        self._rescan_images(page.image_loading)
+        return stats
+
+    def _continue_loading(self):
+        """Append the next held-back chunk in place of the trailing "continue" link."""
+        if not self._deferred: return
+        chunk = self._deferred.pop(0)
+        t0 = time.perf_counter()
+        cursor = QtGui.QTextCursor(self.canvas.document())
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.StartOfBlock, QtGui.QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+        cursor.insertHtml(f'<div class="solarren-document">{chunk}</div>{_continue_html(self._deferred)}')
+        self._check_layout(chunk, t0)
+        self._show_status(f"Loaded another part in {(time.perf_counter() - t0) * 1000:.0f} ms · {len(self._deferred)} left")
+
+    def _check_layout(self, html: str, t0: float):
+        """Time the layout of a chunk just set; a chunk over the layout budget shrinks later ones."""
+        self.canvas.document().documentLayout().documentSize()
+        ms = (time.perf_counter() - t0) * 1000
+        budget_ms = RenderBudget.from_settings(self.core).layout_ms
+        if ms <= budget_ms: return
+        nodes = html.count("<") - html.count("</")
+        if observe_layout(nodes, ms):
+            print(f"[SolarRen] layout of {nodes} elements took {ms:.0f} ms (budget {budget_ms} ms); using smaller chunks")
+
+    def _commit_document(self, base_url, page: CachedPage):
+        stats = self._patch(base_url, page)
+        if stats is None: self._present(base_url, page)
+        entry = self.history.current
+        if entry is None: return stats
+        _bfcache(self.core).put(entry.key, page)
+        if entry.scroll and stats is None: self._restore_scroll(entry.scroll)
+        return stats
 
     # ---- events ----
     def _on_link_clicked(self, qurl: QtCore.QUrl):
@@ -293,153 +993,191 @@ class SolarRenView(QtWidgets.QScrollArea):
             self._handle_form_submit(url); return
         if url.startswith("solarren://google_search"):
             self._handle_google_search(url); return
+        if url.startswith("solarren://continue"):
+            self._continue_loading(); return
         self.load(url)
 
     # ---- public ----
     def load(self, qurl):
         url = qurl.toString() if hasattr(qurl, "toString") else str(qurl)
-        self.current_url = url
-        self.canvas.setPlainText(f"[SolarRen] Loading {url} …")
+        render = getattr(self.core, "render", None)
+        intercepted = render.before_navigate(self, url) if render else None
+        if intercepted is not None and not isinstance(intercepted, str): return
+        self._push_history(url)
+        self.urlChanged.emit(QtCore.QUrl(url))
+        if intercepted is None:
+            self._fetch(url); return
+        # A url_intercept hook supplied the page; render it in place of the network response.
+        self._nav.cancel()
+        self._loading = True
+        self.loadStarted.emit()
+        try:
+            self._render(url, intercepted)
+        finally:
+            self._finish_load(True)
+
+    def _fetch(self, url, keep_document=False):
+        if not keep_document or self._shown is None:
+            self._shown = None
+            self.canvas.setPlainText(f"[SolarRen] Loading {url} …")
         self._show_status(f"Loading {url}")
+        self._loading = True
+        self.loadStarted.emit()
+        self._start_navigation(url, lambda html, u, truncated: self._render(u, html, truncated))
 
+    def _start_navigation(self, url, on_done):
+        """Supersede whatever this view was fetching and queue ``url`` on the shared pool."""
         backend = getattr(self.core, "net", None) or self.core.require("net")
-        self._worker = FetchWorker(url, backend, user_agent=self.user_agent)
-        self._worker.chunk.connect(lambda p: self._show_status(f"Downloading… {p}%"))
-        self._worker.done.connect(lambda html, u: self._render(u, html))
-        self._worker.error.connect(lambda msg: self.canvas.setPlainText(f"[SolarRen] fetch failed: {msg}"))
-        self._worker.start()
+        nav_id, token = self._nav.start(on_done)
+        prefetch = getattr(self.core, "prefetch", None)
+        # Delivered through the pool so a finished prefetch still completes asynchronously, like a fetch.
+        if prefetch is not None and prefetch.claim(url, lambda result: _fetch_pool().submit(self._take_prefetch, nav_id, url, result)):
+            return
+        _fetch_pool().submit(
+            _fetch_job, nav_id, url, backend, token, self._fetch_signals, user_agent=self.user_agent,
+            max_bytes=RenderBudget.from_settings(self.core).max_bytes,
+        )
+
+    def _take_prefetch(self, nav_id, url, result):
+        """Fetch pool: feed a claimed prefetch result through the fetch signals."""
+        if result.error is not None:
+            _emit_safely(self._fetch_signals.error, nav_id, result.error); return
+        self._prefetched = result.prepared
+        _emit_safely(self._fetch_signals.done, nav_id, result.text, url, result.truncated)
+
+    def stop(self):
+        self._nav.cancel()
+        self._finish_load(False)
+
+    def _finish_load(self, ok: bool):
+        if not self._loading: return
+        self._loading = False
+        self.loadFinished.emit(ok)
+
+    def _on_fetch_chunk(self, nav_id, percent):
+        if nav_id == self._nav.id: self._show_status(f"Downloading… {percent}%")
+
+    def _on_fetch_done(self, nav_id, html, url, truncated):
+        if nav_id != self._nav.id: return
+        on_done = self._nav.on_done
+        self._nav.cancel()
+        try:
+            on_done(html, url, truncated)
+        finally:
+            self._finish_load(True)
+
+    def _on_fetch_error(self, nav_id, msg):
+        if nav_id != self._nav.id: return
+        self._nav.cancel()
+        self._shown = None
+        self.canvas.setPlainText(f"[SolarRen] fetch failed: {msg}")
+        self._finish_load(False)
 
     # ---- render ----
-    def _render(self, base_url, html):
-        soup = BeautifulSoup(html, "html.parser")
+    def _set_title(self, title):
+        win = self.window()
+        if isinstance(win, QtWidgets.QMainWindow): win.setWindowTitle(f"SolarEx - {title}")
+
+    def _render(self, base_url, html, truncated=False):
+        digest = _digest(html)
+        budget = RenderBudget.from_settings(self.core)
+        memo = _render_memo(self.core)
+        key = memo.key(
+            digest, base_url,
+            _reader_enabled(self.core, base_url),
+            budget.key(), truncated,
+            self._image_viewport(),
+            metadata["version"],
+        )
+        page = memo.get(key)
+        prefetched, self._prefetched = self._prefetched, None
+        self._dom_snapshot = None
+        if page is None:
+            t0 = time.perf_counter()
+            parsed = prefetched[1:] if prefetched and prefetched[0] == digest else None
+            _soup, page, status = self._transform(base_url, html, budget, truncated, parsed=parsed)
+            status = f"{status} · render {(time.perf_counter() - t0) * 1000:.0f} ms"
+            page.digest = digest
+            memo.put(key, page)
+        else:
+            # Identical input and settings: reuse the output, skip parse and transform.
+            self._set_title(page.title)
+            self._apply_favicon(page.favicon)
+            status = f"Done (render memo: {memo.report()})"
+        self._last_html = html
+        self._update_dom_snapshot()
+        patched = self._commit_document(base_url, page)
+        if patched is not None: status = f"{status} · {patched}"
+        self._show_status(status)
+
+    def _transform(self, base_url, html, budget: RenderBudget, truncated=False, parsed=None):
+        """Parse and rewrite ``html``; returns (soup, CachedPage, status).
+
+        ``parsed``: (soup, BudgetReport) of ``html`` already parsed elsewhere (see prepare_prefetch).
+        """
+        report = BudgetReport()
+        clock = StageClock()
+        self.stages = clock.laps
+        if truncated:
+            report.notes.append(f"download stopped at {budget.max_bytes // 1024} KB")
+
+        extracted = self._try_site_extractors(base_url, html, budget, report, clock)
+        if extracted is not None:
+            return extracted
+
+        if parsed is not None:
+            soup, parse_report = parsed
+            report.notes.extend(parse_report.notes)
+        else:
+            soup = parse_with_budget(html, budget, report)
+        clock.lap("parse")
+        if self._inspecting(): self._dom_snapshot = DomSnapshot.from_soup(soup)
         # Keep inline styles; drop scripts & <noscript>
         for s in soup(["script","noscript"]): s.decompose()
 
         # Title + favicon
-        title_tag = soup.find("title")
-        title = title_tag.text.strip() if title_tag else base_url
-        win = self.window()
-        if isinstance(win, QtWidgets.QMainWindow): win.setWindowTitle(f"SolarEx - {title}")
+        title = self._page_title(soup, base_url)
         self._set_favicon(base_url, soup)
+        stylesheets = _stylesheet_links(soup, base_url)
+        clock.lap("clean")
 
-        if self._render_google_if_applicable(base_url, soup, title):
-            return
+        # Reader mode: keep only the main content subtree before any further work
+        status = "Done"
+        if _reader_enabled(self.core, base_url):
+            stats = distill(soup)
+            status = f"Done · {stats}"
+            clock.lap("distill")
 
         # Inline styles pass-through (subset)
         for tag in soup.find_all(True):
             sty = _parse_inline_css(tag.get("style", ""))
             if sty: _inject_supported_styles(tag, sty)
+        clock.lap("inline_css")
 
         # Forms and images
         self._rewrite_forms(soup, base_url)
+        clock.lap("forms")
+        # Images are only referenced here; _load_visible_images fetches them as they near the viewport.
+        image_loading = {}
+        viewport_css, dpr = self._image_viewport()
         for img in soup.find_all("img"):
-            src = img.get("src")
+            src = _pick_image_source(img, viewport_css, dpr)
             absu = _abs(base_url, src) if src else ""
-            img["src"] = self._image_local(absu) if absu else ""
+            img["src"] = absu
+            for attr in ("srcset", "sizes"):
+                if attr in img.attrs: del img[attr]
+            mode = (img.get("loading") or "").lower()
+            if absu and mode in ("lazy", "eager"): image_loading[absu] = mode
 
         # Iframes -> placeholders
         for iframe in soup.find_all("iframe"):
             src = iframe.get("src")
             iframe.replace_with(soup.new_tag("div", string=f"[iframe: {_abs(base_url, src)}]" if src else "[iframe]"))
+        clock.lap("media")
 
         # Basic structural pretties
         self._enhance_blocks(soup)
-
-        # Theme
-        dark = self.core.settings.get_ns("renderer.solarren", "dark", True)
-        bg = "#0f111a" if dark else "#f5f6fa"
-        fg = "#d5d9e2" if dark else "#1f2530"
-        accent = "#4fa3ff" if dark else "#0a59c9"
-        muted = "#5a6074" if dark else "#6f778b"
-
-        stylesheet = textwrap.dedent(
-            f"""
-            :root {{ color-scheme: {'dark' if dark else 'light'}; }}
-            body {{
-                margin: 0;
-                padding: 32px;
-                background: radial-gradient(circle at top, {bg} 0%, {bg} 45%, {('#05060a' if dark else '#e4e7ef')} 100%);
-                color: {fg};
-                font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-                display: flex;
-                justify-content: center;
-            }}
-            a {{ color: {accent}; }}
-            a:hover {{ color: {accent}; text-decoration: underline; }}
-            .solarren-wrapper {{ width: 100%; max-width: 960px; }}
-            .solarren-toolbar {{
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                padding: 12px 16px;
-                border-radius: 12px;
-                background: {('#161a2b' if dark else '#ffffff')};
-                border: 1px solid {muted};
-                box-shadow: 0 6px 18px rgba(0, 0, 0, 0.18);
-                margin-bottom: 20px;
-            }}
-            .solarren-location {{
-                flex: 1;
-                font-family: 'JetBrains Mono', 'Fira Code', monospace;
-                font-size: 12px;
-                display: flex;
-                gap: 4px;
-                overflow: hidden;
-                white-space: nowrap;
-                text-overflow: ellipsis;
-            }}
-            .solarren-location span {{ overflow: hidden; text-overflow: ellipsis; }}
-            .solarren-location-protocol {{ opacity: 0.6; }}
-            .solarren-location-host {{ font-weight: 600; }}
-            .solarren-location-path {{ opacity: 0.7; }}
-            .solarren-open {{
-                padding: 8px 14px;
-                border-radius: 8px;
-                border: 1px solid {accent};
-                text-decoration: none;
-                color: {accent};
-            }}
-            .solarren-open:hover {{ background: {accent}; color: {bg}; }}
-            .solarren-surface {{
-                background: {('#161a2b' if dark else '#ffffff')};
-                border-radius: 16px;
-                border: 1px solid {muted};
-                box-shadow: 0 12px 32px rgba(0, 0, 0, 0.25);
-                padding: 28px;
-            }}
-            .solarren-header h1 {{ margin: 0 0 6px 0; font-size: 22px; }}
-            .solarren-url {{ font-size: 12px; color: {muted}; }}
-            .solarren-content {{ margin-top: 20px; }}
-            .solarren-document {{
-                line-height: 1.65;
-                font-size: 14px;
-            }}
-            .solarren-document pre {{
-                background: {('#0f1220' if dark else '#f1f3f8')};
-                border-radius: 8px;
-                padding: 12px;
-                overflow-x: auto;
-            }}
-            .solarren-document img {{ max-width: 100%; height: auto; }}
-            .solarren-document table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin: 10px 0;
-            }}
-            .solarren-document th,
-            .solarren-document td {{
-                border: 1px solid {muted};
-                padding: 6px 8px;
-            }}
-            .solarren-control {{
-                margin: 12px 0;
-                padding: 12px;
-                border-radius: 8px;
-                border: 1px dashed {muted};
-                font-family: 'JetBrains Mono', 'Fira Code', monospace;
-            }}
-            """
-        ).strip()
+        clock.lap("enhance")
 
         parsed = urllib.parse.urlparse(base_url)
         protocol_display = f"{parsed.scheme}://" if parsed.scheme else ""
@@ -480,27 +1218,34 @@ class SolarRenView(QtWidgets.QScrollArea):
         )
 
         body_node = soup.body or soup
-        if getattr(body_node, "name", "").lower() == "body":
+        deferred = []
+        if len(body_node.find_all(True)) > budget.layout_nodes:
+            # Too much for one layout pass: show the first chunk, keep the rest behind "continue".
+            body_fragment, *deferred = split_blocks(body_node, budget.layout_nodes) or [""]
+            report.notes.append(f"showing part 1 of {len(deferred) + 1}")
+        elif getattr(body_node, "name", "").lower() == "body":
             body_fragment = "".join(str(child) for child in body_node.children)
         else:
             body_fragment = str(body_node)
 
-        document_html = f'<div class="solarren-document">{body_fragment}</div>'
+        notice_html = ""
+        if report.exceeded:
+            notice_html = f'<div class="solarren-budget">Large page: {escape("; ".join(report.notes))}.</div>'
+            status = f"{status} · over budget: {'; '.join(report.notes)}"
+        document_html = f'<div class="solarren-document">{notice_html}{body_fragment}</div>{_continue_html(deferred)}'
 
+        # The theme is not baked in: it is applied as the document's default stylesheet.
         html_output = (
-            "<html><head><meta charset=\"utf-8\"/>"
-            f"<style>{stylesheet}</style>"
-            "</head><body>"
+            "<html><head><meta charset=\"utf-8\"/></head><body>"
             "<div class=\"solarren-wrapper\">"
             f"{toolbar_html}<div class=\"solarren-surface\">{header_html}<div class=\"solarren-content\">{document_html}</div></div>"
             "</div>"
             "</body></html>"
         )
+        clock.lap("serialize")
 
-        self.canvas.setHtml(html_output)
-        self.canvas.document().setBaseUrl(QtCore.QUrl(base_url))
-        self._last_soup = soup
-        self._show_status("Done")
+        return soup, CachedPage(html_output, title, self._favicon_path, image_loading=image_loading, deferred=deferred,
+                                      stylesheets=stylesheets), status
 
     def _enhance_blocks(self, soup):
         for hr in soup.find_all("hr"):
@@ -523,231 +1268,55 @@ class SolarRenView(QtWidgets.QScrollArea):
             for h in soup.find_all(f"h{i}"):
                 h["style"] = (h.get("style","")+f";color:#fff;margin:6px 0;font-size:{24 - i*2}px;").strip(";")
 
-    def _render_google_if_applicable(self, base_url, soup, title):
+    # ---- site extractors ----
+    def _page_title(self, soup, base_url):
+        title_tag = soup.find("title")
+        title = title_tag.text.strip() if title_tag else base_url
+        self._set_title(title)
+        return title
+
+    def _try_site_extractors(self, base_url, html, budget, report, clock: StageClock):
+        """Run matching fast-path extractors on a partial parse; None falls back to the full render."""
         parsed = urllib.parse.urlparse(base_url)
         host = (parsed.hostname or parsed.netloc or "").lower()
-        if not host.startswith("www.google."):
-            return False
-
-        search_form = soup.find("form")
-        query_input = search_form.find("input", attrs={"name": "q"}) if search_form else None
-        query_value = query_input.get("value", "") if query_input else ""
-        action = _abs(base_url, search_form.get("action") if search_form else "https://www.google.com/search")
-
-        results = []
-        for res in soup.select("div#search div.g"):
-            link = res.find("a", href=True)
-            title_tag = res.find("h3")
-            if not link or not title_tag:
-                continue
-            href = self._google_clean_link(_abs(base_url, link["href"]))
-            snippet = ""
-            snippet_tag = res.select_one("div.IsZvec") or res.select_one("div.VwiC3b") or res.select_one("span.aCOpRe")
-            if snippet_tag:
-                snippet = snippet_tag.get_text(" ", strip=True)
-            else:
-                snippet = res.get_text(" ", strip=True)
-            results.append({
-                "title": title_tag.get_text(" ", strip=True),
-                "href": href,
-                "display": urllib.parse.urlparse(href).netloc or href,
-                "snippet": snippet,
-            })
-
-        cards = []
-        for card in results:
-            safe_title = escape(card["title"])
-            safe_href = escape(card["href"])
-            safe_display = escape(card["display"])
-            safe_snippet = escape(card["snippet"])
-            cards.append(
-                "<div class=\"solarren-result\">"
-                f"<a class=\"solarren-result-title\" href=\"{safe_href}\">{safe_title}</a>"
-                f"<div class=\"solarren-result-link\">{safe_display}</div>"
-                f"<div class=\"solarren-result-snippet\">{safe_snippet}</div>"
-                "</div>"
-            )
-
-        safe_query = escape(query_value)
-        safe_title = escape(title)
-        safe_url = escape(base_url)
-        action_encoded = urllib.parse.quote(action, safe="")
-        query_encoded = urllib.parse.quote(query_value, safe="")
-
-        stylesheet = self._build_stylesheet(self.core.settings.get_ns("renderer.solarren", "dark", True))
-        display_query = safe_query or "—"
-        results_html = ''.join(cards) if cards else '<div class="solarren-empty">No results.</div>'
-        search_link = f"solarren://google_search?action={action_encoded}&q={query_encoded}"
-        html_output = (
-            "<html><head><meta charset=\"utf-8\"/>"
-            f"<style>{stylesheet}</style>"
-            "</head><body>"
+        for ext in extractors.match(host):
+            soup = parse_with_budget(ext.trim(html), budget, report, parse_only=ext.strainer())
+            clock.lap("parse")
+            for s in soup(["script","noscript"]): s.decompose()
+            title = self._page_title(soup, base_url)
+            if ext.favicon: self._set_favicon(base_url, soup)
+            try:
+                result = ext.extract(ExtractContext(base_url, host, soup, title, ext))
+            except Exception as e:
+                print(f"[SolarRen] extractor '{ext.id}' failed:", e)
+                result = None
+            clock.lap("extract")
+            if result is not None:
+                page = CachedPage(self._wrap_extracted(base_url, title, result), title, self._favicon_path)
+                clock.lap("serialize")
+                return soup, page, result.status
+        return None
+
+    def _wrap_extracted(self, base_url, title, result: ExtractResult) -> str:
+        parsed = urllib.parse.urlparse(base_url)
+        location = escape(result.location or parsed.hostname or parsed.netloc or base_url)
+        return (
+            "<html><head><meta charset=\"utf-8\"/></head><body>"
             "<div class=\"solarren-wrapper\">"
             "<div class=\"solarren-toolbar\">"
-            f"<div class=\"solarren-location\"><span class=\"solarren-location-host\">Google</span></div>"
-            f"<a class=\"solarren-open\" href=\"{safe_url}\" target=\"_blank\">Open original</a>"
+            f"<div class=\"solarren-location\"><span class=\"solarren-location-host\">{location}</span></div>"
+            f"<a class=\"solarren-open\" href=\"{escape(base_url)}\" target=\"_blank\">Open original</a>"
             "</div>"
             "<div class=\"solarren-surface\">"
-            f"<div class=\"solarren-header\"><h1>{safe_title}</h1></div>"
-            "<div class=\"solarren-google-search\">"
-            f"<div class=\"solarren-google-query\">Query: {display_query}</div>"
-            f"<a class=\"solarren-google-button\" href=\"{search_link}\">New search…</a>"
-            "</div>"
-            f"<div class=\"solarren-google-results\">{results_html}</div>"
+            f"<div class=\"solarren-header\"><h1>{escape(title)}</h1></div>"
+            f"{result.body_html}"
             "</div>"
             "</div>"
             "</body></html>"
         )
 
-        self.canvas.setHtml(html_output)
-        self.canvas.document().setBaseUrl(QtCore.QUrl(base_url))
-        self._last_soup = soup
-        self._show_status("Google results ready")
-        return True
-
     def _build_stylesheet(self, dark: bool) -> str:
-        bg = "#0f111a" if dark else "#f5f6fa"
-        fg = "#d5d9e2" if dark else "#1f2530"
-        accent = "#4fa3ff" if dark else "#0a59c9"
-        muted = "#5a6074" if dark else "#6f778b"
-        surface = "#161a2b" if dark else "#ffffff"
-        secondary_surface = "#1d2237" if dark else "#f0f3fb"
-        code_bg = "#0f1220" if dark else "#f1f3f8"
-        gradient_end = "#05060a" if dark else "#e4e7ef"
-
-        return textwrap.dedent(
-            f"""
-            :root {{ color-scheme: {'dark' if dark else 'light'}; }}
-            body {{
-                margin: 0;
-                padding: 32px;
-                background: radial-gradient(circle at top, {bg} 0%, {bg} 45%, {gradient_end} 100%);
-                color: {fg};
-                font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-                display: flex;
-                justify-content: center;
-            }}
-            a {{ color: {accent}; }}
-            a:hover {{ color: {accent}; text-decoration: underline; }}
-            .solarren-wrapper {{ width: 100%; max-width: 960px; }}
-            .solarren-toolbar {{
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                padding: 12px 16px;
-                border-radius: 12px;
-                background: {surface};
-                border: 1px solid {muted};
-                box-shadow: 0 6px 18px rgba(0, 0, 0, 0.18);
-                margin-bottom: 20px;
-            }}
-            .solarren-location {{
-                flex: 1;
-                font-family: 'JetBrains Mono', 'Fira Code', monospace;
-                font-size: 12px;
-                display: flex;
-                gap: 4px;
-                overflow: hidden;
-                white-space: nowrap;
-                text-overflow: ellipsis;
-            }}
-            .solarren-location span {{ overflow: hidden; text-overflow: ellipsis; }}
-            .solarren-location-protocol {{ opacity: 0.6; }}
-            .solarren-location-host {{ font-weight: 600; }}
-            .solarren-location-path {{ opacity: 0.7; }}
-            .solarren-open {{
-                padding: 8px 14px;
-                border-radius: 8px;
-                border: 1px solid {accent};
-                text-decoration: none;
-                color: {accent};
-            }}
-            .solarren-open:hover {{ background: {accent}; color: {bg}; }}
-            .solarren-surface {{
-                background: {surface};
-                border-radius: 16px;
-                border: 1px solid {muted};
-                box-shadow: 0 12px 32px rgba(0, 0, 0, 0.25);
-                padding: 28px;
-            }}
-            .solarren-header h1 {{ margin: 0 0 6px 0; font-size: 22px; }}
-            .solarren-url {{ font-size: 12px; color: {muted}; }}
-            .solarren-content {{ margin-top: 20px; }}
-            .solarren-document {{
-                line-height: 1.65;
-                font-size: 14px;
-            }}
-            .solarren-document pre {{
-                background: {code_bg};
-                border-radius: 8px;
-                padding: 12px;
-                overflow-x: auto;
-            }}
-            .solarren-document img {{ max-width: 100%; height: auto; }}
-            .solarren-document table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin: 10px 0;
-            }}
-            .solarren-document th,
-            .solarren-document td {{
-                border: 1px solid {muted};
-                padding: 6px 8px;
-            }}
-            .solarren-control {{
-                margin: 12px 0;
-                padding: 12px;
-                border-radius: 8px;
-                border: 1px dashed {muted};
-                font-family: 'JetBrains Mono', 'Fira Code', monospace;
-            }}
-            .solarren-google-search {{
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                gap: 12px;
-                padding: 12px 16px;
-                border-radius: 12px;
-                background: {secondary_surface};
-                margin-bottom: 20px;
-            }}
-            .solarren-google-query {{ font-family: 'JetBrains Mono', 'Fira Code', monospace; font-size: 13px; }}
-            .solarren-google-button {{
-                padding: 8px 16px;
-                border-radius: 8px;
-                border: 1px solid {accent};
-                text-decoration: none;
-                color: {accent};
-                font-weight: 600;
-            }}
-            .solarren-google-button:hover {{ background: {accent}; color: {bg}; }}
-            .solarren-google-results {{ display: flex; flex-direction: column; gap: 18px; }}
-            .solarren-result {{
-                padding: 16px;
-                border-radius: 12px;
-                background: {surface};
-                border: 1px solid {muted};
-                box-shadow: 0 4px 18px rgba(0, 0, 0, 0.18);
-            }}
-            .solarren-result-title {{ font-size: 18px; font-weight: 600; }}
-            .solarren-result-link {{ font-size: 12px; color: {muted}; margin-top: 4px; }}
-            .solarren-result-snippet {{ margin-top: 10px; line-height: 1.55; font-size: 13px; }}
-            .solarren-empty {{ font-style: italic; color: {muted}; }}
-            """
-        ).strip()
-
-    def _google_clean_link(self, href: str) -> str:
-        try:
-            parsed = urllib.parse.urlparse(href)
-            if parsed.path == "/url" and parsed.query:
-                params = urllib.parse.parse_qs(parsed.query)
-                if "q" in params:
-                    return params["q"][0]
-                if "url" in params:
-                    return params["url"][0]
-            return href
-        except Exception:
-            return href
+        return _theme_stylesheet(dark)
 
     def _handle_google_search(self, url: str):
         parsed = urllib.parse.urlparse(url)
@@ -764,5 +1333,89 @@ class SolarRenView(QtWidgets.QScrollArea):
         sep = "&" if urllib.parse.urlparse(action).query else "?"
         self.load(f"{action}{sep}q={urllib.parse.quote(query)}")
 
+# ---------------- built-in site extractors ----------------
+
+def _google_clean_link(href: str) -> str:
+    try:
+        parsed = urllib.parse.urlparse(href)
+        if parsed.path == "/url" and parsed.query:
+            params = urllib.parse.parse_qs(parsed.query)
+            if "q" in params:
+                return params["q"][0]
+            if "url" in params:
+                return params["url"][0]
+        return href
+    except Exception:
+        return href
+
+def _extract_google(ctx: ExtractContext):
+    base_url = ctx.base_url
+    search_form = ctx.select_one("form")
+    query_input = ctx.select_one("query", search_form) if search_form else None
+    query_value = query_input.get("value", "") if query_input else ""
+    action = _abs(base_url, search_form.get("action") if search_form else "https://www.google.com/search")
+
+    cards = []
+    for res in ctx.select("result"):
+        link = res.find("a", href=True)
+        title_tag = res.find("h3")
+        if not link or not title_tag:
+            continue
+        href = _google_clean_link(_abs(base_url, link["href"]))
+        snippet_tag = None
+        for name in ("snippet", "snippet_alt", "snippet_old"):
+            snippet_tag = ctx.select_one(name, res)
+            if snippet_tag: break
+        snippet = snippet_tag.get_text(" ", strip=True) if snippet_tag else res.get_text(" ", strip=True)
+        display = urllib.parse.urlparse(href).netloc or href
+        cards.append(
+            "<div class=\"solarren-result\">"
+            f"<a class=\"solarren-result-title\" href=\"{escape(href)}\">{escape(title_tag.get_text(' ', strip=True))}</a>"
+            f"<div class=\"solarren-result-link\">{escape(display)}</div>"
+            f"<div class=\"solarren-result-snippet\">{escape(snippet)}</div>"
+            "</div>"
+        )
+
+    action_encoded = urllib.parse.quote(action, safe="")
+    query_encoded = urllib.parse.quote(query_value, safe="")
+    display_query = escape(query_value) or "—"
+    results_html = ''.join(cards) if cards else '<div class="solarren-empty">No results.</div>'
+    search_link = f"solarren://google_search?action={action_encoded}&q={query_encoded}"
+    body = (
+        "<div class=\"solarren-google-search\">"
+        f"<div class=\"solarren-google-query\">Query: {display_query}</div>"
+        f"<a class=\"solarren-google-button\" href=\"{search_link}\">New search…</a>"
+        "</div>"
+        f"<div class=\"solarren-google-results\">{results_html}</div>"
+    )
+    return ExtractResult(body, status="Google results ready", location="Google")
+
+extractors.register(SiteExtractor(
+    id="google-search",
+    hosts=("www.google.*",),
+    extract=_extract_google,
+    selectors={
+        "form": "form",
+        "query": 'input[name="q"]',
+        "result": "div#search div.g",
+        "snippet": "div.IsZvec",
+        "snippet_alt": "div.VwiC3b",
+        "snippet_old": "span.aCOpRe",
+    },
+    needs=("form", "div"),
+    stop_at=r"""<div[^>]+id=["']?(?:botstuff|footcnt|foot)\b""",
+))
+
+def prepare_prefetch(core, result):
+    """Runs on the startup prefetch thread: parse the home page ahead of the first view.
+
+    Skipped when a site extractor will take the page; the view checks the digest before using it.
+    """
+    host = (urllib.parse.urlparse(result.url).hostname or "").lower()
+    if result.text is None or extractors.match(host): return None
+    report = BudgetReport()
+    soup = parse_with_budget(result.text, RenderBudget.from_settings(core), report)
+    return _digest(result.text), soup, report
+
 def new_view(core, *a, **kw):
     return SolarRenView(core)
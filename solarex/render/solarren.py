@@ -1,16 +1,45 @@
+import codecs
 import re
 import textwrap
 import threading
+import time
 import urllib.error
 import urllib.request
-from html import escape, unescape
+from array import array
+from html import escape
 from html.parser import HTMLParser
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from urllib.parse import urljoin, urlparse
 
 
+_WS_RE = re.compile(r"\s+")
+# Plain root-relative paths, which urljoin would only prefix with the origin: no dot
+# segments, query, fragment or params, and nothing urlsplit strips or rewrites.
+_ROOT_HREF_RE = re.compile(r"/(?![/\\])(?:[^\x00-\x20\\./?#;]|\.(?![./]|$)|/(?!\.))*$")
+
+# Segment kinds, one byte per segment in SolarRenExtractor._kinds.
+BREAK, HARD_BREAK, RULE, TEXT, PRE, LINK, LINK_PRE, CONTROL = range(8)
+HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
+
+
+class FormControl:
+    """Summary of one input/textarea/button; textarea and button values fill in as their text arrives."""
+
+    __slots__ = ("kind", "type", "name", "placeholder", "label", "value", "rows", "cols")
+
+    def __init__(self, kind, type="", name="", placeholder="", label="", value="", rows="", cols=""):
+        self.kind = kind
+        self.type = type
+        self.name = name
+        self.placeholder = placeholder
+        self.label = label
+        self.value = value
+        self.rows = rows
+        self.cols = cols
+
+
 class SolarRenExtractor(HTMLParser):
-    BLOCK_BREAK_TAGS = {
+    BLOCK_BREAK_TAGS = frozenset({
         "address",
         "article",
         "aside",
@@ -30,9 +59,9 @@ class SolarRenExtractor(HTMLParser):
         "textarea",
         "tr",
         "button",
-    }
+    })
 
-    DOUBLE_BREAK_TAGS = {
+    DOUBLE_BREAK_TAGS = frozenset({
         "article",
         "aside",
         "footer",
@@ -48,31 +77,50 @@ class SolarRenExtractor(HTMLParser):
         "p",
         "pre",
         "textarea",
-    }
+    })
 
-    LIST_TAGS = {"ul", "ol"}
+    LIST_TAGS = frozenset({"ul", "ol"})
 
     def __init__(self, base_url: str):
         super().__init__()
         self.base_url = base_url
         self._ignore_stack: list[str] = []
-        self._segments: list[tuple] = []
+        # Segments are parallel arrays: kind byte, payload (text with any list prefix
+        # folded in, or a FormControl) and an index into the interned href table.
+        self._kinds = bytearray()
+        self._data: list = []
+        self._href_ix = array("i")
+        self._hrefs: list[str] = []
+        self._href_ids: Dict[str, int] = {}
+        self._resolved: Dict[str, int] = {}
+        parts = urlparse(base_url)
+        self._origin = f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") and parts.netloc else ""
         self._pending_prefix: Optional[str] = None
+        self.title = ""                         # text of the first <title>, filled in as it is parsed
+        self._title_parts: Optional[list] = None
         self._heading_level: Optional[str] = None
-        self._anchor_stack: list[str] = []
-        self._list_stack: list[dict] = []
+        self._anchor_stack: list[int] = []
+        self._list_stack: list[list] = []      # [tag, next ordinal]
         self._pre_depth = 0
         self._textarea_stack: list[int] = []
         self._button_stack: list[int] = []
+        self._text_buf: list[str] = []         # text since the last markup event
 
     # ---- HTMLParser hooks ----
+    # HTMLParser already lower-cases tag and attribute names and, with
+    # convert_charrefs on, hands over text and attribute values unescaped.
+    # It also hands over a text run in pieces when the run crosses a feed()
+    # boundary, so text is buffered until the next markup event.
     def handle_starttag(self, tag, attrs):
-        tag = tag.lower()
+        if self._text_buf:
+            self._flush_text()
         if tag in ("script", "style"):
             self._ignore_stack.append(tag)
             return
         if self._ignore_stack:
             return
+        if tag == "title" and self._title_parts is None and not self.title:
+            self._title_parts = []
         if tag == "br":
             self._append_break(False)
             return
@@ -84,55 +132,51 @@ class SolarRenExtractor(HTMLParser):
         elif tag in self.BLOCK_BREAK_TAGS:
             self._append_break(False)
         if tag in self.LIST_TAGS:
-            self._list_stack.append({"type": tag, "index": 1})
+            self._list_stack.append([tag, 1])
             return
         if tag == "li":
             prefix = "• "
             if self._list_stack:
                 top = self._list_stack[-1]
-                if top["type"] == "ol":
-                    prefix = f"{top['index']}. "
-                    top["index"] += 1
+                if top[0] == "ol":
+                    prefix = f"{top[1]}. "
+                    top[1] += 1
             self._pending_prefix = prefix
             return
-
-        attrs_dict = {
-            k.lower(): ("" if v is None else str(v))
-            for k, v in attrs
-        }
-        if tag == "input":
-            control_info = self._make_input_control(attrs_dict)
-            self._append_form_control(control_info)
-            return
-        if tag == "textarea":
-            control_info = self._make_textarea_control(attrs_dict)
-            index = self._append_form_control(control_info)
-            self._textarea_stack.append(index)
-            return
-        if tag == "button":
-            control_info = self._make_button_control(attrs_dict)
-            index = self._append_form_control(control_info)
-            self._button_stack.append(index)
+        if tag == "a":
+            href = ""
+            for k, v in attrs:
+                if k == "href": href = v or ""
+            self._anchor_stack.append(self._resolve(href))
             return
-        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+        if tag in HEADING_TAGS:
             self._heading_level = tag
             return
         if tag == "pre":
             self._pre_depth += 1
             return
-        if tag == "a":
-            href = attrs_dict.get("href") or ""
-            resolved = urljoin(self.base_url, href) if href else ""
-            self._anchor_stack.append(resolved)
+        if tag not in ("input", "textarea", "button"):
             return
 
+        attrs_dict = {k: ("" if v is None else str(v)) for k, v in attrs}
+        if tag == "input":
+            self._append_form_control(self._make_input_control(attrs_dict))
+        elif tag == "textarea":
+            self._textarea_stack.append(self._append_form_control(self._make_textarea_control(attrs_dict)))
+        else:
+            self._button_stack.append(self._append_form_control(self._make_button_control(attrs_dict)))
+
     def handle_endtag(self, tag):
-        tag = tag.lower()
+        if self._text_buf:
+            self._flush_text()
         if self._ignore_stack and self._ignore_stack[-1] == tag:
             self._ignore_stack.pop()
             return
         if self._ignore_stack:
             return
+        if tag == "title" and self._title_parts is not None:
+            self.title = "".join(self._title_parts).strip()
+            self._title_parts = None
         if tag == "li":
             self._append_break(False)
             return
@@ -150,11 +194,11 @@ class SolarRenExtractor(HTMLParser):
             self._pre_depth -= 1
             self._append_break(True)
             return
-        if tag in ("ul", "ol") and self._list_stack:
+        if tag in self.LIST_TAGS and self._list_stack:
             self._list_stack.pop()
             self._append_break(True)
             return
-        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+        if tag in HEADING_TAGS:
             self._append_break(True)
             self._heading_level = None
             return
@@ -164,10 +208,27 @@ class SolarRenExtractor(HTMLParser):
     def handle_startendtag(self, tag, attrs):
         self.handle_starttag(tag, attrs)
 
-    def handle_data(self, data):
-        if self._ignore_stack or not data:
+    def handle_data(self, text):
+        if self._ignore_stack or not text:
             return
-        text = unescape(data)
+        if self._title_parts is not None:
+            self._title_parts.append(text)
+        self._text_buf.append(text)
+
+    def handle_comment(self, data):
+        if self._text_buf:
+            self._flush_text()
+
+    handle_decl = handle_pi = unknown_decl = handle_comment
+
+    def close(self):
+        super().close()
+        if self._text_buf:
+            self._flush_text()
+
+    def _flush_text(self):
+        text = "".join(self._text_buf)
+        self._text_buf.clear()
         if self._textarea_stack:
             self._extend_textarea_value(text)
             return
@@ -177,22 +238,43 @@ class SolarRenExtractor(HTMLParser):
         if self._heading_level:
             text = text.upper()
         if self._anchor_stack:
-            href = self._anchor_stack[-1]
-            self._append_link(text, href)
+            self._append_link(text, self._anchor_stack[-1])
         else:
             self._append_text(text)
 
     # ---- Segment helpers ----
+    def _resolve(self, href: str) -> int:
+        """Interned index of ``href`` resolved against the base URL; -1 for no target."""
+        if not href:
+            return -1
+        ix = self._resolved.get(href)
+        if ix is None:
+            if self._origin and _ROOT_HREF_RE.match(href):
+                url = self._origin + href
+            else:
+                url = urljoin(self.base_url, href)
+            ix = self._href_ids.get(url)
+            if ix is None:
+                ix = self._href_ids[url] = len(self._hrefs)
+                self._hrefs.append(url)
+            self._resolved[href] = ix
+        return ix
+
+    def _push(self, kind: int, data=None, href: int = -1) -> int:
+        self._kinds.append(kind)
+        self._data.append(data)
+        self._href_ix.append(href)
+        return len(self._kinds) - 1
+
     def _append_break(self, hard: bool):
         self._pending_prefix = None
-        if not self._segments:
+        if not self._kinds:
             return
-        kind, *rest = self._segments[-1]
-        if kind == "break":
-            if hard and not rest[0]:
-                self._segments[-1] = ("break", True)
+        if self._kinds[-1] <= HARD_BREAK:
+            if hard:
+                self._kinds[-1] = HARD_BREAK
             return
-        self._segments.append(("break", hard))
+        self._push(HARD_BREAK if hard else BREAK)
 
     def _consume_prefix(self) -> str:
         prefix = self._pending_prefix or ""
@@ -201,335 +283,230 @@ class SolarRenExtractor(HTMLParser):
 
     def _append_rule(self):
         self._pending_prefix = None
-        if self._segments:
-            kind = self._segments[-1][0]
-            if kind != "break":
-                self._segments.append(("break", True))
-        self._segments.append(("rule",))
+        if self._kinds and self._kinds[-1] > HARD_BREAK:
+            self._push(HARD_BREAK)
+        self._push(RULE)
 
     def _append_text(self, text: str):
         if self._pre_depth:
             cleaned = text.replace("\r\n", "\n")
-            if not cleaned:
-                return
-            prefix = self._consume_prefix()
-            self._segments.append(("pre", prefix, cleaned))
+            if cleaned:
+                self._push(PRE, self._consume_prefix() + cleaned)
             return
-        cleaned = re.sub(r"\s+", " ", text)
-        if not cleaned.strip():
-            return
-        prefix = self._consume_prefix()
-        self._segments.append(("text", prefix, cleaned.strip()))
+        cleaned = " ".join(text.split())
+        if cleaned:
+            self._push(TEXT, self._consume_prefix() + cleaned)
 
-    def _append_link(self, text: str, href: str):
+    def _append_link(self, text: str, href: int):
         if self._pre_depth:
             cleaned = text.replace("\r\n", "\n")
-            if not cleaned:
-                return
-            prefix = self._consume_prefix()
-            self._segments.append(("link-pre", prefix, cleaned, href))
-            return
-        cleaned = re.sub(r"\s+", " ", text)
-        if not cleaned.strip():
+            if cleaned:
+                self._push(LINK_PRE, self._consume_prefix() + cleaned, href)
             return
-        prefix = self._consume_prefix()
-        self._segments.append(("link", prefix, cleaned.strip(), href))
+        cleaned = " ".join(text.split())
+        if cleaned:
+            self._push(LINK, self._consume_prefix() + cleaned, href)
 
-    def _append_form_control(self, info: Dict[str, str]) -> int:
+    def _append_form_control(self, control: FormControl) -> int:
         self._pending_prefix = None
-        segment = ["control", info]
-        self._segments.append(segment)
-        return len(self._segments) - 1
+        return self._push(CONTROL, control)
 
     def _extend_textarea_value(self, text: str):
         if not self._textarea_stack or not text:
             return
-        index = self._textarea_stack[-1]
-        segment = self._segments[index]
-        if isinstance(segment, list) and segment and segment[0] == "control":
-            info = segment[1]
-            existing = info.get("value", "")
-            info["value"] = existing + text
+        self._data[self._textarea_stack[-1]].value += text
 
     def _finalize_textarea(self, index: int):
-        if index < 0 or index >= len(self._segments):
-            return
-        segment = self._segments[index]
-        if isinstance(segment, list) and segment and segment[0] == "control":
-            info = segment[1]
-            value = info.get("value")
-            if value:
-                info["value"] = value.strip()
+        control = self._data[index]
+        if control.value:
+            control.value = control.value.strip()
 
     def _extend_button_value(self, text: str):
         if not self._button_stack or not text.strip():
             return
-        index = self._button_stack[-1]
-        segment = self._segments[index]
-        if isinstance(segment, list) and segment and segment[0] == "control":
-            info = segment[1]
-            existing = info.get("value", "")
-            info["value"] = existing + text
+        self._data[self._button_stack[-1]].value += text
 
     def _finalize_button(self, index: int):
-        if index < 0 or index >= len(self._segments):
-            return
-        segment = self._segments[index]
-        if isinstance(segment, list) and segment and segment[0] == "control":
-            info = segment[1]
-            value = info.get("value")
-            if value:
-                trimmed = re.sub(r"\s+", " ", value.strip())
-                info["value"] = trimmed
-                if not info.get("label"):
-                    info["label"] = trimmed
-
-    def _make_input_control(self, attrs: Dict[str, str]) -> Dict[str, str]:
-        control_type = (attrs.get("type") or "text").lower()
-        label = attrs.get("aria-label") or attrs.get("title") or ""
-        placeholder = attrs.get("placeholder") or label
-        return {
-            "kind": "input",
-            "type": control_type,
-            "name": attrs.get("name") or "",
-            "placeholder": placeholder or "",
-            "label": label or "",
-            "value": attrs.get("value") or "",
-        }
-
-    def _make_textarea_control(self, attrs: Dict[str, str]) -> Dict[str, str]:
+        control = self._data[index]
+        if control.value:
+            control.value = " ".join(control.value.split())
+            if not control.label:
+                control.label = control.value
+
+    def _make_input_control(self, attrs: Dict[str, str]) -> FormControl:
         label = attrs.get("aria-label") or attrs.get("title") or ""
-        placeholder = attrs.get("placeholder") or label
-        return {
-            "kind": "textarea",
-            "name": attrs.get("name") or "",
-            "placeholder": placeholder or "",
-            "label": label or "",
-            "rows": attrs.get("rows") or "",
-            "cols": attrs.get("cols") or "",
-            "value": "",
-        }
-
-    def _make_button_control(self, attrs: Dict[str, str]) -> Dict[str, str]:
+        return FormControl(
+            "input",
+            type=(attrs.get("type") or "text").lower(),
+            name=attrs.get("name") or "",
+            placeholder=attrs.get("placeholder") or label,
+            label=label,
+            value=attrs.get("value") or "",
+        )
+
+    def _make_textarea_control(self, attrs: Dict[str, str]) -> FormControl:
         label = attrs.get("aria-label") or attrs.get("title") or ""
-        return {
-            "kind": "button",
-            "type": (attrs.get("type") or "button").lower(),
-            "name": attrs.get("name") or "",
-            "label": label or "",
-            "value": "",
-        }
+        return FormControl(
+            "textarea",
+            name=attrs.get("name") or "",
+            placeholder=attrs.get("placeholder") or label,
+            label=label,
+            rows=attrs.get("rows") or "",
+            cols=attrs.get("cols") or "",
+        )
+
+    def _make_button_control(self, attrs: Dict[str, str]) -> FormControl:
+        return FormControl(
+            "button",
+            type=(attrs.get("type") or "button").lower(),
+            name=attrs.get("name") or "",
+            label=attrs.get("aria-label") or attrs.get("title") or "",
+        )
 
     def _clean_inline_value(self, value: str) -> str:
-        compact = re.sub(r"\s+", " ", value.strip())
+        compact = _WS_RE.sub(" ", value.strip())
         if len(compact) > 60:
             compact = compact[:57] + "…"
         return compact
 
-    def _control_summary(self, info: Dict[str, str]) -> str:
-        kind = info.get("kind", "control")
-        parts: list[str] = [kind]
-        if kind == "input":
-            control_type = info.get("type") or ""
-            if control_type and control_type != "text":
-                parts.append(f"type={control_type}")
-        if kind == "button":
-            btn_type = info.get("type") or ""
-            if btn_type and btn_type != "button":
-                parts.append(f"type={btn_type}")
-        if kind == "textarea":
-            rows = info.get("rows") or ""
-            cols = info.get("cols") or ""
-            if rows:
-                parts.append(f"rows={rows}")
-            if cols:
-                parts.append(f"cols={cols}")
-        name = info.get("name") or ""
-        if name:
-            parts.append(f"name={name}")
-        placeholder = info.get("placeholder") or ""
-        if placeholder:
-            parts.append(
-                f"placeholder=\"{self._clean_inline_value(placeholder)}\""
-            )
-        label = info.get("label") or ""
-        if label and label != placeholder:
-            parts.append(f"label=\"{self._clean_inline_value(label)}\"")
-        value = info.get("value") or ""
-        if value:
-            parts.append(f"value=\"{self._clean_inline_value(value)}\"")
+    def _control_summary(self, c: FormControl) -> str:
+        parts: list[str] = [c.kind]
+        if c.kind == "input" and c.type and c.type != "text":
+            parts.append(f"type={c.type}")
+        if c.kind == "button" and c.type and c.type != "button":
+            parts.append(f"type={c.type}")
+        if c.kind == "textarea":
+            if c.rows:
+                parts.append(f"rows={c.rows}")
+            if c.cols:
+                parts.append(f"cols={c.cols}")
+        if c.name:
+            parts.append(f"name={c.name}")
+        if c.placeholder:
+            parts.append(f"placeholder=\"{self._clean_inline_value(c.placeholder)}\"")
+        if c.label and c.label != c.placeholder:
+            parts.append(f"label=\"{self._clean_inline_value(c.label)}\"")
+        if c.value:
+            parts.append(f"value=\"{self._clean_inline_value(c.value)}\"")
         return " ".join(parts)
 
-    def _control_text(self, info: Dict[str, str]) -> str:
-        summary = self._control_summary(info)
-        return f"[{summary}]"
-
-    def _control_html(self, info: Dict[str, str]) -> str:
-        summary = escape(self._control_summary(info))
-        return f'<div class="solarren-control">[{summary}]</div>'
-
-    # ---- Output helpers ----
-    def _normalize_chunk(self, chunk: Optional[str]) -> Optional[str]:
-        if chunk is None:
-            return None
-        if not isinstance(chunk, str):
-            try:
-                chunk = str(chunk)
-            except Exception:  # pragma: no cover - defensive
-                return None
-        return chunk
+    def _control_text(self, control: FormControl) -> str:
+        return f"[{self._control_summary(control)}]"
 
-    def get_text(self) -> str:
-        if not self._segments:
-            return ""
-        parts: list[str] = []
-        for segment in self._segments:
-            kind = segment[0]
-            if kind == "break":
-                if not parts:
+    def _control_html(self, control: FormControl) -> str:
+        return f'<div class="solarren-control">[{escape(self._control_summary(control))}]</div>'
+
+    # ---- Output ----
+    def write_text(self, write: Callable[[str], object]):
+        """Stream the plain-text rendering to ``write``, one piece per call."""
+        # Spacing looks at the end of the previous piece only (a hard break after a
+        # lone "\n" piece still adds one), so track that piece's last two characters.
+        tail = ""
+
+        def emit(piece: str):
+            nonlocal tail
+            write(piece)
+            tail = piece[-2:]
+
+        data, hrefs, href_ix = self._data, self._hrefs, self._href_ix
+        for i, kind in enumerate(self._kinds):
+            if kind <= HARD_BREAK:
+                if not tail:
                     continue
-                hard = segment[1]
-                if hard:
-                    if parts[-1].endswith("\n"):
-                        if not parts[-1].endswith("\n\n"):
-                            parts[-1] = parts[-1] + "\n"
-                    else:
-                        parts.append("\n\n")
+                if tail[-1] == "\n":
+                    if kind == HARD_BREAK and tail != "\n\n":
+                        write("\n")
+                        tail = tail[-1:] + "\n"
+                elif kind == HARD_BREAK:
+                    emit("\n\n")
                 else:
-                    if not parts[-1].endswith("\n"):
-                        parts.append("\n")
+                    emit("\n")
                 continue
-            if kind == "rule":
-                if parts and not parts[-1].endswith("\n"):
-                    parts.append("\n")
-                parts.append("".ljust(40, "-"))
-                parts.append("\n")
+            if kind == RULE:
+                if tail and tail[-1] != "\n":
+                    emit("\n")
+                emit("-" * 40)
+                emit("\n")
                 continue
-            if kind == "text":
-                _, prefix, content = segment
-                chunk = (prefix or "") + content
-            elif kind == "pre":
-                _, prefix, content = segment
-                chunk = (prefix or "") + content
-                if parts and not parts[-1].endswith("\n"):
-                    parts.append("\n")
-            elif kind == "link-pre":
-                _, prefix, content, href = segment
-                if parts and not parts[-1].endswith("\n"):
-                    parts.append("\n")
-                if href:
-                    chunk = (prefix or "") + f"{content} [{href}]"
-                else:
-                    chunk = (prefix or "") + content
-            elif kind == "control":
-                info = segment[1]
-                if parts and not parts[-1].endswith("\n"):
-                    parts.append("\n")
-                chunk = self._control_text(info)
+            if kind == CONTROL:
+                chunk = self._control_text(data[i])
             else:
-                _, prefix, content, href = segment
-                if href:
-                    chunk = (prefix or "") + f"{content} [{href}]"
-                else:
-                    chunk = (prefix or "") + content
-            chunk = self._normalize_chunk(chunk)
-            if not chunk:
-                continue
-            if parts and not parts[-1].endswith("\n"):
-                parts.append(" ")
-            parts.append(chunk)
+                chunk = data[i]
+                if kind == LINK or kind == LINK_PRE:
+                    ix = href_ix[i]
+                    if ix >= 0:
+                        chunk = f"{chunk} [{hrefs[ix]}]"
+            if kind != TEXT and kind != LINK and tail and tail[-1] != "\n":
+                emit("\n")
+            if tail and tail[-1] != "\n":
+                emit(" ")
+            emit(chunk)
+
+    def get_text(self) -> str:
+        parts: list[str] = []
+        self.write_text(parts.append)
         return "".join(parts)
 
-    def get_html(self) -> str:
-        if not self._segments:
-            return ""
-        parts: list[str] = ["<div class=\"solarren-document\">"]
-        last_was_break = True
-        for segment in self._segments:
-            kind = segment[0]
-            if kind == "break":
-                hard = segment[1]
-                if hard:
-                    parts.append("<br/><br/>")
-                    last_was_break = True
-                else:
-                    parts.append("<br/>")
-                    last_was_break = True
-                continue
-            if kind == "rule":
-                parts.append("<hr/>")
-                last_was_break = True
+    def write_html(self, write: Callable[[str], object]):
+        """Stream the HTML rendering to ``write``; nothing is written for an empty document."""
+        if not self._kinds:
+            return
+        data, href_ix = self._data, self._href_ix
+        safe_hrefs = [escape(h, quote=True) for h in self._hrefs]
+        write("<div class=\"solarren-document\">")
+        after_break = True
+        brs = 0   # consecutive <br/> in the output; runs longer than two are cut to two
+        for i, kind in enumerate(self._kinds):
+            if kind <= HARD_BREAK:
+                n = 2 if kind == HARD_BREAK else 1
+                keep = min(n, 2 - brs) if brs < 2 else 0
+                if keep:
+                    write("<br/>" * keep)
+                brs += n
+                after_break = True
                 continue
-            if kind == "text":
-                _, prefix, content = segment
-                chunk = (prefix or "") + content
-                chunk = self._normalize_chunk(chunk)
-                if not chunk:
-                    continue
-                chunk = chunk.strip()
-                if not chunk:
-                    continue
-                if not last_was_break:
-                    parts.append(" ")
-                parts.append(escape(chunk))
-                last_was_break = False
-            elif kind == "pre":
-                _, prefix, content = segment
-                chunk = (prefix or "") + content
-                chunk = self._normalize_chunk(chunk)
-                if not chunk or not chunk.strip():
-                    continue
-                parts.append("<pre>")
-                parts.append(escape(chunk))
-                parts.append("</pre>")
-                last_was_break = True
-            elif kind == "link-pre":
-                _, prefix, content, href = segment
-                chunk = (prefix or "") + content
-                chunk = self._normalize_chunk(chunk)
-                if not chunk:
-                    continue
-                link_target = self._normalize_chunk(href) if href else ""
-                if link_target:
-                    safe_href = escape(link_target, quote=True)
-                    parts.append("<pre>")
-                    parts.append(f'<a href="{safe_href}">{escape(chunk)}</a>')
-                    parts.append("</pre>")
+            if kind == RULE:
+                write("<hr/>")
+            elif kind == TEXT:
+                if not after_break:
+                    write(" ")
+                write(escape(data[i]))
+            elif kind == LINK:
+                if not after_break:
+                    write(" ")
+                ix = href_ix[i]
+                if ix >= 0:
+                    write(f'<a href="{safe_hrefs[ix]}">{escape(data[i])}</a>')
                 else:
-                    parts.append("<pre>")
-                    parts.append(escape(chunk))
-                    parts.append("</pre>")
-                last_was_break = True
-            elif kind == "control":
-                info = segment[1]
-                control_html = self._control_html(info)
-                control_html = self._normalize_chunk(control_html)
-                if not control_html:
+                    write(escape(data[i]))
+            elif kind == PRE:
+                if not data[i].strip():
                     continue
-                parts.append(control_html)
-                last_was_break = True
-            else:
-                _, prefix, content, href = segment
-                chunk = (prefix or "") + content
-                chunk = self._normalize_chunk(chunk)
-                if not chunk:
-                    continue
-                chunk = chunk.strip()
-                if not chunk:
-                    continue
-                if not last_was_break:
-                    parts.append(" ")
-                link_target = self._normalize_chunk(href) if href else ""
-                if link_target:
-                    safe_href = escape(link_target, quote=True)
-                    parts.append(f'<a href="{safe_href}">{escape(chunk)}</a>')
+                write(f"<pre>{escape(data[i])}</pre>")
+            elif kind == LINK_PRE:
+                ix = href_ix[i]
+                if ix >= 0:
+                    write(f'<pre><a href="{safe_hrefs[ix]}">{escape(data[i])}</a></pre>')
                 else:
-                    parts.append(escape(chunk))
-                last_was_break = False
-        parts.append("</div>")
-        html_output = "".join(parts)
-        html_output = re.sub(r"(<br/>\s*){3,}", "<br/><br/>", html_output)
-        return html_output
+                    write(f"<pre>{escape(data[i])}</pre>")
+            else:
+                write(self._control_html(data[i]))
+            brs = 0
+            after_break = kind != TEXT and kind != LINK
+        write("</div>")
+
+    def get_html(self) -> str:
+        parts: list[str] = []
+        self.write_html(parts.append)
+        return "".join(parts)
+
+    def __len__(self):
+        return len(self._kinds)
+
+
+READ_CHUNK = 64 * 1024
+PARTIAL_FIRST_S = 0.25    # first partial snapshot after this long; later ones back off by PARTIAL_BACKOFF
+PARTIAL_BACKOFF = 1.5
 
 
 class SolarRenBackend:
@@ -544,7 +521,7 @@ class SolarRenBackend:
         class SolarRenView(QtWidgets.QWidget):
             titleChanged = QtCore.pyqtSignal(str)
             loadFinished = QtCore.pyqtSignal(bool)
-            _contentReady = QtCore.pyqtSignal(str, str, str, bool)
+            _contentReady = QtCore.pyqtSignal(int, str, str, str, bool, bool)   # load id, url, title, html, success, final
 
             def __init__(self, core, agent: str):
                 super().__init__()
@@ -554,6 +531,7 @@ class SolarRenBackend:
                 )
                 self._url = QtCore.QUrl("about:blank")
                 self._thread: Optional[threading.Thread] = None
+                self._load_id = 0
 
                 layout = QtWidgets.QVBoxLayout(self)
                 layout.setContentsMargins(6, 6, 6, 6)
@@ -577,15 +555,21 @@ class SolarRenBackend:
             def url(self):
                 return QtCore.QUrl(self._url)
 
-            @QtCore.pyqtSlot(str, str, str, bool)
-            def _apply_content(self, url_str: str, title: str, content_html: str, success: bool):
+            @QtCore.pyqtSlot(int, str, str, str, bool, bool)
+            def _apply_content(self, load_id: int, url_str: str, title: str, content_html: str, success: bool, final: bool):
+                if load_id != self._load_id:
+                    return   # queued before a newer load() started
                 self._url = QtCore.QUrl(url_str)
-                self._status.setText(f"SolarRen → {url_str}")
+                self._status.setText(f"SolarRen → {url_str}" if final else f"Loading {url_str} …")
                 document_html = self._wrap_document(url_str, title, content_html)
+                bar = self._viewer.verticalScrollBar()
+                scroll = bar.value()
                 self._viewer.document().setBaseUrl(self._url)
                 self._viewer.setHtml(document_html)
+                bar.setValue(scroll)
                 self.titleChanged.emit(title)
-                self.loadFinished.emit(success)
+                if final:
+                    self.loadFinished.emit(success)
 
             def _wrap_document(self, url_str: str, title: str, body_html: str) -> str:
                 palette = self._viewer.palette()
@@ -829,7 +813,8 @@ class SolarRenBackend:
 
                 if qurl.scheme() == "about" and qurl.path().lower() in ("", "blank"):
                     ready_html = "<div class=\"solarren-document\">SolarRen ready.</div>"
-                    self._contentReady.emit(qurl.toString(), "about:blank", ready_html, True)
+                    self._load_id += 1
+                    self._contentReady.emit(self._load_id, qurl.toString(), "about:blank", ready_html, True, True)
                     return
 
                 self._status.setText(f"Loading {qurl.toString()} …")
@@ -840,6 +825,9 @@ class SolarRenBackend:
                 )
                 self.loadFinished.emit(False)
 
+                self._load_id += 1
+                load_id = self._load_id
+
                 def worker(target_url: QtCore.QUrl):
                     url_str = target_url.toString()
                     try:
@@ -848,31 +836,43 @@ class SolarRenBackend:
                         request = urllib.request.Request(
                             url_str, headers={"User-Agent": self._agent}
                         )
+                        extractor = SolarRenExtractor(url_str)
                         with urllib.request.urlopen(request, timeout=15) as response:
                             charset = response.headers.get_content_charset() or "utf-8"
-                            payload = response.read()
-                        try:
-                            html_text = payload.decode(charset, errors="replace")
-                        except LookupError:
-                            html_text = payload.decode("utf-8", errors="replace")
-
-                        title_match = re.search(
-                            r"<title[^>]*>(.*?)</title>",
-                            html_text,
-                            re.IGNORECASE | re.DOTALL,
-                        )
-                        page_title = (
-                            unescape(title_match.group(1).strip()) if title_match else url_str
-                        )
-
-                        extractor = SolarRenExtractor(url_str)
-                        extractor.feed(html_text)
+                            try:
+                                decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+                            except LookupError:
+                                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                            # Decode and parse chunk by chunk, so only the extractor's segments
+                            # are held rather than the raw bytes, the decoded text and the result.
+                            interval = PARTIAL_FIRST_S
+                            next_partial = time.monotonic() + interval
+                            shown = 0
+                            while True:
+                                if load_id != self._load_id:
+                                    return
+                                chunk = response.read(READ_CHUNK)
+                                if not chunk:
+                                    break
+                                extractor.feed(decoder.decode(chunk))
+                                now = time.monotonic()
+                                if now >= next_partial and len(extractor) > shown:
+                                    shown = len(extractor)
+                                    self._contentReady.emit(
+                                        load_id, url_str, extractor.title or url_str, extractor.get_html(), True, False
+                                    )
+                                    interval *= PARTIAL_BACKOFF
+                                    next_partial = now + interval
+                        extractor.feed(decoder.decode(b"", final=True))
+                        extractor.close()
+                        if load_id != self._load_id:
+                            return
                         body_html = extractor.get_html()
                         if not body_html:
                             body_html = (
                                 "<div class=\"solarren-document\">[No textual content rendered]</div>"
                             )
-                        self._contentReady.emit(url_str, page_title, body_html, True)
+                        self._contentReady.emit(load_id, url_str, extractor.title or url_str, body_html, True, True)
                     except (
                         urllib.error.URLError,
                         urllib.error.HTTPError,
@@ -884,14 +884,14 @@ class SolarRenBackend:
                             f"SolarRen failed to load {escape(url_str)}:\n{escape(str(exc))}"
                             "</div>"
                         )
-                        self._contentReady.emit(url_str, url_str, error_html, False)
+                        self._contentReady.emit(load_id, url_str, url_str, error_html, False, True)
                     except Exception as exc:  # pragma: no cover - defensive
                         error_html = (
                             "<div class=\"solarren-document\">"
                             f"SolarRen failed to load {escape(url_str)}:\n{escape(str(exc))}"
                             "</div>"
                         )
-                        self._contentReady.emit(url_str, url_str, error_html, False)
+                        self._contentReady.emit(load_id, url_str, url_str, error_html, False, True)
 
                 self._thread = threading.Thread(target=worker, args=(qurl,), daemon=True)
                 self._thread.start()
@@ -900,3 +900,11 @@ class SolarRenBackend:
 
 
 __all__ = ["SolarRenBackend", "SolarRenExtractor"]
+
+
+if __name__ == "__main__":
+    import sys
+
+    from solarex.render.batch import main
+
+    sys.exit(main())
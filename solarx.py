@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 import argparse
 import atexit
+import functools
 import shutil
 import sys
 from pathlib import Path
 
+from solarex.core.startup import StartupProfile, on_first_paint
+
+# Started before the Qt imports so --startup-profile can attribute them too
+STARTUP = StartupProfile(enabled=any(a.split("=")[0] == "--startup-profile" for a in sys.argv[1:]))
+STARTUP.track_imports()
+
 from PyQt6 import QtCore
 
 # Must be set BEFORE QApplication is created or any QtWebEngine import occurs
@@ -15,15 +22,8 @@ QtCore.QCoreApplication.setAttribute(
 
 from PyQt6 import QtWidgets
 
-# ✅ Preload QtWebEngine so QtWebEngineCore is initialized globally
-try:
-    from PyQt6 import QtWebEngineCore, QtWebEngineWidgets
-    QtWebEngineCore.QWebEngine.initialize() if hasattr(QtWebEngineCore, "QWebEngine") else None
-except Exception:
-    # Fallback — will still work if QtWebEngine is lazy-loaded later
-    pass
-
 from solarex.core.modules import SolarCore
+from solarex.core.settings import Settings
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent
@@ -39,6 +39,44 @@ def _cleanup_pycache(root: Path) -> None:
             pass
 
 
+def _preload_webengine() -> None:
+    # Initialize QtWebEngine before the QApplication exists; switching to qtweb later
+    # still works because AA_ShareOpenGLContexts is already set.
+    try:
+        from PyQt6 import QtWebEngineCore, QtWebEngineWidgets
+        QtWebEngineCore.QWebEngine.initialize() if hasattr(QtWebEngineCore, "QWebEngine") else None
+    except Exception:
+        # Fallback — the render manager reports the import error and picks another backend
+        pass
+
+
+def _start_home_prefetch(core: SolarCore, renderer: str, url: str):
+    """Start fetching the home page while Qt and the UI come up, if the renderer can take it over."""
+    entry = core.render.backends.get(renderer)
+    if not entry or not entry.prefetch or not getattr(core, "net", None) or not hasattr(core.net, "fetch_stream"):
+        return None
+    if not url.lower().startswith(("http://", "https://")):
+        return None
+    from solarex.net.prefetch import Prefetch
+    max_kb = entry.setting(core, "budget_max_kb")
+    return Prefetch(core, url, max_bytes=int(max_kb) * 1024 if max_kb else None)
+
+
+def _open_forwarded(core: SolarCore, win, message: dict) -> None:
+    """A later launch with --single-instance: switch renderer if it asked for one, open its URL, raise."""
+    renderer, url = message.get("renderer"), message.get("url") or "about:blank"
+    if renderer and renderer != core.render.active_id:
+        core.render.set_active(renderer)
+    if hasattr(win, "open_tab"):
+        win.open_tab(url)
+    else:
+        view = win.centralWidget()
+        if hasattr(view, "load"): view.load(QtCore.QUrl(url))
+    if win.isMinimized(): win.showNormal()
+    win.raise_()
+    win.activateWindow()
+
+
 def _load_ui(core: SolarCore, preferred: str, fallback: str) -> None:
     try:
         core.load(preferred, as_name="ui")
@@ -60,25 +98,89 @@ def main():
     ap.add_argument(
         "--renderer",
         choices=["qtweb", "solarren", "minimal"],
-        default="qtweb",
-        help="Choose renderer backend",
+        help="Choose renderer backend (default: qtweb)",
+    )
+    net = ap.add_mutually_exclusive_group()
+    net.add_argument("--net-record", metavar="HAR", help="Record all HTTP traffic to a HAR file (.har or .har.gz)")
+    net.add_argument("--net-replay", metavar="HAR", help="Serve HTTP only from a recorded HAR file, never the network")
+    ap.add_argument(
+        "--replay-latency",
+        default="original",
+        help="With --net-replay: 'original' recorded timing, or a fixed latency in ms",
+    )
+    ap.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Keep compiled bytecode and reuse cached plugin/renderer discovery (also: settings 'warm_start')",
+    )
+    ap.add_argument(
+        "--single-instance",
+        action="store_true",
+        help="Open --home as a tab in the running SolarEx of this profile, if any (also: settings 'single_instance')",
+    )
+    ap.add_argument(
+        "--startup-profile",
+        nargs="?",
+        const="solarex-startup.json",
+        metavar="TRACE_JSON",
+        help="Time every startup phase, print a report at first paint and write a Chrome trace (default: %(const)s)",
     )
     args = ap.parse_args()
+    STARTUP.mark("main")
+    if args.replay_latency != "original":
+        try:
+            float(args.replay_latency)
+        except ValueError:
+            ap.error("--replay-latency must be 'original' or a number of milliseconds")
+
+    # === Single instance: hand the launch to a running process and leave ===
+    instance_name = None
+    if not args.incognito and (args.single_instance or Settings().get("single_instance", False)):
+        from solarex.core import instance
+        instance_name = instance.socket_name(args.profile)
+        if instance.forward(instance_name, {"url": args.home, "renderer": args.renderer}):
+            print(f"[SolarEx][instance] Opened {args.home} in the running instance")
+            return
+    args.renderer = args.renderer or "qtweb"
+
+    if args.renderer == "qtweb":
+        with STARTUP.span("preload QtWebEngine"):
+            _preload_webengine()
 
     # === Core boot ===
-    core = SolarCore()
+    with STARTUP.span("SolarCore()"):
+        core = SolarCore()
+    core.startup = STARTUP
     core.args = args
-    core.boot()
-    core.set_profile(name=args.profile, incognito=args.incognito)
+    warm = args.warm_start or bool(core.settings.get("warm_start", False))
+    if warm:
+        sys.dont_write_bytecode = False   # even under PYTHONDONTWRITEBYTECODE: the next launch reuses it
+        with STARTUP.span(f"core.set_profile {args.profile}"):
+            core.set_profile(name=args.profile, incognito=args.incognito)
+    with STARTUP.span("core.boot"):
+        core.boot(warm=warm)
+    if not warm:
+        with STARTUP.span(f"core.set_profile {args.profile}"):
+            core.set_profile(name=args.profile, incognito=args.incognito)
     atexit.register(core.shutdown)
 
     # === Load core modules ===
+    core.load("solarex.render.manager", as_name="render")   # reads renderer manifests only
     core.load("solarex.net")
     core.load("solarex.net.httpx_backend", as_name="net")
     if hasattr(core, "net") and hasattr(core.net, "close"):
         core.add_shutdown_hook(core.net.close)
-    core.load("solarex.render.manager", as_name="render")
-    core.render.set_active(args.renderer)
+    core.prefetch = _start_home_prefetch(core, args.renderer, args.home)
+    with STARTUP.span(f"render.set_active {args.renderer}"):
+        core.render.set_active(args.renderer)
+    if core.prefetch is not None:
+        active = core.render.backends[core.render.active_id]
+        if active.prefetch:
+            core.prefetch.prepare = functools.partial(getattr(active.module, "prepare_prefetch", lambda core, r: None), core)
+        else:
+            core.prefetch.cancel()
+    if (args.net_record or args.net_replay) and core.render.active_id == "qtweb":
+        print("[SolarEx][net] Note: qtweb loads pages through Chromium's own network stack; only SolarEx-side requests are recorded/replayed")
 
     # === Load UI ===
     core.load("solarex.ui", as_name="ui")
@@ -88,25 +190,61 @@ def main():
         _load_ui(core, "solarex.ui.pov", "solarex.ui.classic")
 
     # === Load plugins ===
-    core.plugin_manager.load_all(core)
+    with STARTUP.span("plugins.load_all"):
+        core.plugin_manager.load_all(core)
+
+    if core.boot_cache:
+        core.boot_cache.save()
 
     # === Register cleanup ===
-    atexit.register(_cleanup_pycache, PROJECT_ROOT)
+    if not warm:   # warm starts keep bytecode for the next launch
+        atexit.register(_cleanup_pycache, PROJECT_ROOT)
 
     # === Create QApplication ===
-    app = QtWidgets.QApplication(sys.argv)
+    with STARTUP.span("QApplication"):
+        app = QtWidgets.QApplication(sys.argv)
     if hasattr(QtCore.Qt.ApplicationAttribute, "AA_UseHighDpiPixmaps"):
         app.setAttribute(QtCore.Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
 
+    # Listen before building the window so a launch racing this one forwards to it instead.
+    server, forwarded = None, []
+    if instance_name:
+        from solarex.core.instance import InstanceServer
+        server = InstanceServer(instance_name, app)
+        server.received.connect(forwarded.append)   # until the window exists
+        server.listen()
+
     # === Launch UI window ===
     win_cls = core.ui
-    try:
-        win = win_cls(core, start_url=args.home)
-    except TypeError:
-        win = win_cls(core, args.home)
-
-    win.show()
-    core.emit_window_created(win)
+    with STARTUP.span("window"):
+        try:
+            win = win_cls(core, start_url=args.home)
+        except TypeError:
+            win = win_cls(core, args.home)
+
+    if core.prefetch is not None:
+        core.prefetch.cancel()   # no-op once the first tab has claimed it
+
+    with STARTUP.span("window.show"):
+        win.show()
+    with STARTUP.span("window_created listeners"):
+        core.emit_window_created(win)
+
+    if server is not None:
+        server.received.disconnect()
+        server.received.connect(lambda message: _open_forwarded(core, win, message))
+        for message in forwarded: _open_forwarded(core, win, message)
+
+    if STARTUP.enabled:
+        def _startup_done():
+            STARTUP.mark("first paint")
+            try:
+                STARTUP.write(args.startup_profile)
+            except Exception as exc:
+                print("[SolarEx][startup] report failed:", exc)
+        on_first_paint(win, _startup_done)
+    else:
+        STARTUP.stop_imports()
 
     sys.exit(app.exec())
 